@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Answer-key index for KLCP_Loesungen.pdf, keyed by question number.
+
+The solutions PDF is parsed once (through pdf_cache) and the resulting
+{number: letter} map is stored next to the page cache, so later runs load a
+small JSON file instead of re-reading the PDF:
+
+    import answer_key
+
+    key = answer_key.AnswerKey.load('KLCP_Loesungen.pdf')
+    key[12]                  # -> 'C'
+    key.diff(questions)      # -> mismatches against questions.json
+"""
+import json
+import os
+import sys
+
+import pdf_cache
+import question_parser
+
+
+class AnswerKey:
+    """Read-only mapping of question number to correct answer letter."""
+
+    def __init__(self, answers):
+        self.answers = dict(answers)
+
+    @classmethod
+    def from_page_texts(cls, page_texts):
+        """Build the key from solution page texts; the first answer per number wins."""
+        answers = {}
+        for number, letter in question_parser.iter_numbered_answers(page_texts):
+            answers.setdefault(number, letter)
+        return cls(answers)
+
+    @classmethod
+    def load(cls, path='KLCP_Loesungen.pdf', use_cache=True):
+        """Return the key for `path`, parsing the PDF only if it changed."""
+        index_file = os.path.join(pdf_cache.CACHE_DIR, pdf_cache.cache_key(path) + '.answers.json')
+        if use_cache:
+            try:
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    return cls({int(number): letter for number, letter in json.load(f).items()})
+            except (OSError, ValueError):
+                pass
+
+        key = cls.from_page_texts(pdf_cache.iter_page_texts(path, use_cache=use_cache))
+        if use_cache:
+            os.makedirs(pdf_cache.CACHE_DIR, exist_ok=True)
+            tmp_file = index_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({str(number): letter for number, letter in key.answers.items()}, f)
+            os.replace(tmp_file, index_file)
+        return key
+
+    def __getitem__(self, number):
+        return self.answers[number]
+
+    def __contains__(self, number):
+        return number in self.answers
+
+    def __len__(self):
+        return len(self.answers)
+
+    def get(self, number, default=None):
+        return self.answers.get(number, default)
+
+    def diff(self, questions):
+        """
+        Compare the key with a list of question dicts (questions.json format).
+
+        Returns a list of {'id', 'json_answer', 'pdf_answer', 'question'}
+        dicts, sorted by id, for every question whose 'correct' differs from
+        the key. Questions without an entry in the key are not reported. The
+        comparison itself is a single set difference over (id, answer) pairs.
+        """
+        by_id = {q['id']: q for q in questions}
+        json_answers = {q_id: q['correct'] for q_id, q in by_id.items()}
+        mismatched = {q_id for q_id, _ in json_answers.items() - self.answers.items()}
+        mismatched &= self.answers.keys()
+        return [
+            {
+                'id': q_id,
+                'json_answer': json_answers[q_id],
+                'pdf_answer': self.answers[q_id],
+                'question': by_id[q_id]['question_en'],
+            }
+            for q_id in sorted(mismatched)
+        ]
+
+
+if __name__ == '__main__':
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else 'KLCP_Loesungen.pdf'
+    key = AnswerKey.load(pdf_path)
+    print(f"📋 {pdf_path}: {len(key)} answers indexed")
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Benchmark the KLCP PDF -> JSON pipeline stage by stage.
+
+Runs the extraction stages on KLCP_Fragenkatalog.pdf and on synthetic
+catalogs of any size, and reports wall time, peak RSS and pages/sec per
+stage:
+
+    open            pdfplumber.open and building the page list
+    interpret       pdfminer content-stream interpretation (page.layout)
+    text_chars      page.extract_text() on the lean page.text_chars
+    objects         pdfplumber's LT* -> dict conversion (page.objects)
+    extract_text    page.extract_text() on the converted chars
+    layout          pdfminer layout analysis (LTPage.analyze with LAParams)
+    split           the scripts' re.split(r'\\bQuestion\\s+') over the full text
+    parse           question_parser.iter_questions over the page texts
+
+Every document runs in a fresh process, so peak RSS is not inflated by the
+previous one; it is the process peak at the end of each stage. Results are
+written as JSON and can be compared with an earlier run:
+
+    python3 bench_pipeline.py --synthetic 2000 --synthetic 10000
+    python3 bench_pipeline.py --compare bench_results/pipeline-20260101-120000.json
+
+`--plane N` also compares pdfminer's R-tree Plane with the grid it replaced
+on a synthetic large page of N text lines in columns. It times the three
+access patterns of the layout pass:
+
+    extend      bulk placing all lines (group_textlines)
+    neighbours  one find() around every line (find_neighbors)
+    churn       remove two objects, add their union, repeated until one is
+                left, with a find() before every merge (group_textboxes)
+
+    python3 bench_pipeline.py --plane 1000 --plane 2000
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import re
+import resource
+import sys
+import time
+from importlib.metadata import PackageNotFoundError, version
+
+from pdfminer.utils import Plane, drange
+
+DEFAULT_PDF = 'KLCP_Fragenkatalog.pdf'
+RESULTS_DIR = 'bench_results'
+TEMPLATE_QUESTIONS = 'klcp_questions_complete.json'
+
+STAGES = ('open', 'interpret', 'text_chars', 'objects', 'extract_text', 'layout', 'split', 'parse')
+
+PLANE_PAGE = (0, 0, 2000, 20000)
+PLANE_PATTERNS = ('extend', 'neighbours', 'churn')
+
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _pdf_string(text):
+    data = text.encode('cp1252', errors='replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+def _question_lines(question, number):
+    lines = [('F2', 18, f"Question {number}"), ('F1', 12, question['question_en'])]
+    lines += [('F1', 12, option) for option in question['options_en']]
+    lines += [('F2', 18, f"Frage {number}"), ('F1', 12, question['question_de'])]
+    lines += [('F1', 12, option) for option in question['options_de']]
+    return lines
+
+
+def make_synthetic_catalog(path, question_count, per_page=2):
+    """
+    Write a catalog PDF with `question_count` questions in the KLCP layout.
+
+    The questions are cycled from klcp_questions_complete.json and set in the
+    base-14 Helvetica fonts, `per_page` blocks per page.
+    """
+    with open(TEMPLATE_QUESTIONS, 'r', encoding='utf-8') as f:
+        templates = json.load(f)
+
+    page_streams = []
+    for first in range(0, question_count, per_page):
+        ops = [b'BT']
+        y = 800
+        for number in range(first + 1, min(first + per_page, question_count) + 1):
+            question = templates[(number - 1) % len(templates)]
+            for font, size, text in _question_lines(question, number):
+                y -= size + 8
+                ops.append(b'/%s %d Tf 1 0 0 1 57 %d Tm %s Tj' % (
+                    font.encode(), size, y, _pdf_string(text)))
+            y -= 20
+        ops.append(b'ET')
+        page_streams.append(b'\n'.join(ops))
+
+    page_count = len(page_streams)
+    # 1 catalog, 2 pages, 3/4 fonts, then (page, content) pairs
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % (5 + 2 * i) for i in range(page_count)), page_count),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+    ]
+    for i, stream in enumerate(page_streams):
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+            b'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>' % (6 + 2 * i))
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+
+    out = [b'%PDF-1.4\n']
+    offsets = []
+    position = len(out[0])
+    for objid, body in enumerate(objects, start=1):
+        chunk = b'%d 0 obj\n%s\nendobj\n' % (objid, body)
+        offsets.append(position)
+        out.append(chunk)
+        position += len(chunk)
+    xref = [b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)]
+    xref += [b'%010d 00000 n \n' % offset for offset in offsets]
+    out += xref
+    out.append(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, position))
+
+    with open(path, 'wb') as f:
+        f.write(b''.join(out))
+    return page_count
+
+
+def run_document(path):
+    """Run every stage on `path` and return its result record."""
+    import pdfplumber
+    from pdfminer.layout import LAParams
+
+    import question_parser
+
+    stages = {}
+    timer = {'start': time.perf_counter()}
+
+    def finish(name, page_count):
+        elapsed = time.perf_counter() - timer['start']
+        stages[name] = {
+            'seconds': round(elapsed, 4),
+            'pages_per_sec': round(page_count / elapsed, 1) if elapsed else None,
+            'peak_rss_kb': _peak_rss_kb(),
+        }
+        timer['start'] = time.perf_counter()
+
+    pdf = pdfplumber.open(path)
+    pages = pdf.pages
+    page_count = len(pages)
+    finish('open', page_count)
+
+    for page in pages:
+        page.layout
+    finish('interpret', page_count)
+
+    for page in pages:
+        page.extract_text()
+    finish('text_chars', page_count)
+
+    for page in pages:
+        page.objects
+    finish('objects', page_count)
+
+    texts = [page.extract_text() or '' for page in pages]
+    finish('extract_text', page_count)
+
+    # Runs last on the already converted pages, so it doesn't change the
+    # objects measured above.
+    laparams = LAParams()
+    for page in pages:
+        page.layout.analyze(laparams)
+    finish('layout', page_count)
+    pdf.close()
+
+    full_text = ''.join(text + '\n\n' for text in texts)
+    blocks = re.split(r'\bQuestion\s+', full_text, flags=re.IGNORECASE)
+    finish('split', page_count)
+
+    questions = sum(1 for _ in question_parser.iter_questions(texts))
+    finish('parse', page_count)
+
+    return {
+        'document': os.path.basename(path),
+        'pages': page_count,
+        'questions': questions,
+        'split_blocks': len(blocks) - 1,
+        'total_seconds': round(sum(stage['seconds'] for stage in stages.values()), 4),
+        'stages': stages,
+    }
+
+
+class GridPlane:
+    """The previous Plane: a dict of 50-unit grid cells, kept as baseline."""
+
+    def __init__(self, bbox, gridsize=50):
+        self._seq = []
+        self._objs = set()
+        self._grid = {}
+        self.gridsize = gridsize
+        (self.x0, self.y0, self.x1, self.y1) = bbox
+
+    def __iter__(self):
+        return (obj for obj in self._seq if obj in self._objs)
+
+    def __len__(self):
+        return len(self._objs)
+
+    def _getrange(self, bbox):
+        (x0, y0, x1, y1) = bbox
+        if x1 <= self.x0 or self.x1 <= x0 or y1 <= self.y0 or self.y1 <= y0:
+            return
+        x0 = max(self.x0, x0)
+        y0 = max(self.y0, y0)
+        x1 = min(self.x1, x1)
+        y1 = min(self.y1, y1)
+        for grid_y in drange(y0, y1, self.gridsize):
+            for grid_x in drange(x0, x1, self.gridsize):
+                yield (grid_x, grid_y)
+
+    def extend(self, objs):
+        for obj in objs:
+            self.add(obj)
+
+    def add(self, obj):
+        for k in self._getrange((obj.x0, obj.y0, obj.x1, obj.y1)):
+            self._grid.setdefault(k, []).append(obj)
+        self._seq.append(obj)
+        self._objs.add(obj)
+
+    def remove(self, obj):
+        for k in self._getrange((obj.x0, obj.y0, obj.x1, obj.y1)):
+            try:
+                self._grid[k].remove(obj)
+            except (KeyError, ValueError):
+                pass
+        self._objs.remove(obj)
+
+    def find(self, bbox):
+        (x0, y0, x1, y1) = bbox
+        done = set()
+        for k in self._getrange(bbox):
+            if k not in self._grid:
+                continue
+            for obj in self._grid[k]:
+                if obj in done:
+                    continue
+                done.add(obj)
+                if obj.x1 <= x0 or x1 <= obj.x0 or obj.y1 <= y0 or y1 <= obj.y0:
+                    continue
+                yield obj
+
+
+class _Box:
+    def __init__(self, x0, y0, x1, y1):
+        (self.x0, self.y0, self.x1, self.y1) = (x0, y0, x1, y1)
+
+
+def make_plane_lines(count, seed=0):
+    """`count` text lines in three columns, 14 units apart."""
+    rnd = random.Random(seed)
+    lines = []
+    for i in range(count):
+        column, row = i % 3, i // 3
+        x0 = 60 + column * 640 + rnd.uniform(0, 5)
+        y0 = 20 + row * 14 % (PLANE_PAGE[3] - 40)
+        lines.append(_Box(x0, y0, x0 + rnd.uniform(300, 600), y0 + 10))
+    return lines
+
+
+def time_plane(plane_class, lines):
+    """Time the access patterns of PLANE_PATTERNS on a `plane_class`."""
+    times = {}
+
+    start = time.perf_counter()
+    plane = plane_class(PLANE_PAGE)
+    plane.extend(lines)
+    times['extend'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = 0
+    for line in lines:
+        found += sum(1 for _ in plane.find((line.x0, line.y0 - 5, line.x1, line.y1 + 5)))
+    times['neighbours'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    live = list(lines)
+    rnd = random.Random(1)
+    while len(live) > 1:
+        obj1 = live.pop(rnd.randrange(len(live)))
+        obj2 = live.pop(rnd.randrange(len(live)))
+        bbox = (min(obj1.x0, obj2.x0), min(obj1.y0, obj2.y0),
+                max(obj1.x1, obj2.x1), max(obj1.y1, obj2.y1))
+        found += sum(1 for _ in plane.find(bbox))
+        plane.remove(obj1)
+        plane.remove(obj2)
+        group = _Box(*bbox)
+        plane.add(group)
+        live.append(group)
+    times['churn'] = time.perf_counter() - start
+    return {name: round(seconds, 4) for name, seconds in times.items()}, found
+
+
+def compare_planes(line_count):
+    """Run the grid and the R-tree Plane on the same page of `line_count` lines."""
+    lines = make_plane_lines(line_count)
+    grid, grid_found = time_plane(GridPlane, lines)
+    rtree, rtree_found = time_plane(Plane, lines)
+    return {
+        'lines': line_count,
+        'same_results': grid_found == rtree_found,
+        'grid': grid,
+        'rtree': rtree,
+    }
+
+
+def print_plane(result):
+    print(f"\n🌳 Plane, {result['lines']} lines")
+    print(f"   {'pattern':<14}{'grid s':>10}{'R-tree s':>10}{'speedup':>10}")
+    for name in PLANE_PATTERNS:
+        grid, rtree = result['grid'][name], result['rtree'][name]
+        speedup = f"{grid / rtree:.2f}x" if rtree else '-'
+        print(f"   {name:<14}{grid:>10.3f}{rtree:>10.3f}{speedup:>10}")
+
+
+def _run_isolated(path):
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(run_document, (path,))
+
+
+def _package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return '0'
+
+
+def print_result(result, baseline=None):
+    print(f"\n📄 {result['document']}: {result['pages']} pages, "
+          f"{result['questions']} questions, {result['total_seconds']:.2f}s")
+    print(f"   {'stage':<14}{'seconds':>10}{'pages/s':>10}{'peak RSS MB':>13}")
+    for name in STAGES:
+        stage = result['stages'][name]
+        line = (f"   {name:<14}{stage['seconds']:>10.3f}{stage['pages_per_sec'] or 0:>10.1f}"
+                f"{stage['peak_rss_kb'] / 1024:>13.1f}")
+        before = (baseline or {}).get('stages', {}).get(name)
+        if before and before['seconds'] and stage['seconds']:
+            line += f"   {before['seconds'] / stage['seconds']:.2f}x vs baseline"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the KLCP PDF -> JSON pipeline.')
+    parser.add_argument('pdfs', nargs='*', help=f'PDFs to benchmark (default: {DEFAULT_PDF})')
+    parser.add_argument('--synthetic', type=int, action='append', default=[], metavar='N',
+                        help='also benchmark a generated catalog with N questions (repeatable)')
+    parser.add_argument('--plane', type=int, action='append', default=[], metavar='N',
+                        help='also compare the R-tree Plane with the old grid on a page '
+                             'of N lines (repeatable)')
+    parser.add_argument('--output', help=f'results file (default: {RESULTS_DIR}/pipeline-<time>.json)')
+    parser.add_argument('--compare', metavar='FILE', help='earlier results file to compare against')
+    args = parser.parse_args(argv)
+
+    documents = list(args.pdfs) or (
+        [DEFAULT_PDF] if not (args.synthetic or args.plane) else [])
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    for count in args.synthetic:
+        path = os.path.join(RESULTS_DIR, f"synthetic-{count}.pdf")
+        if not os.path.exists(path):
+            print(f"🛠️  Generating {path}...")
+            make_synthetic_catalog(path, count)
+        documents.append(path)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = {r['document']: r for r in json.load(f)['results']}
+
+    results = []
+    for path in documents:
+        result = _run_isolated(path)
+        print_result(result, baseline.get(result['document']))
+        results.append(result)
+
+    planes = []
+    for count in args.plane:
+        result = compare_planes(count)
+        if not result['same_results']:
+            print(f"❌ Plane, {count} lines: the grid and the R-tree found different objects")
+            return 1
+        print_plane(result)
+        planes.append(result)
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pdfplumber': _package_version('pdfplumber'),
+        'pdfminer': _package_version('pdfminer.six'),
+        'results': results,
+        'plane': planes,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, time.strftime('pipeline-%Y%m%d-%H%M%S.json'))
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results saved to {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
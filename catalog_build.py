@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Incremental writer for app/src/main/assets/questions.json.
+
+Every generated question gets a content hash over question_en/de,
+options_en/de and correct. The hashes of the last build are kept in a
+manifest under .pdf_cache/ together with the page hashes of the source PDFs
+(see pdf_cache.load_pages_incremental). On a rebuild only entries whose hash
+changed are replaced; all other entries are copied from the current file as
+they are, and the file is not touched at all when nothing changed. Without a
+manifest that matches the current file, the file is written anew.
+"""
+import hashlib
+import json
+import os
+
+import pdf_cache
+import question_parser
+
+HASHED_FIELDS = ('question_en', 'question_de', 'options_en', 'options_de', 'correct')
+
+# Bump when the hashes or the layout of the manifest change.
+MANIFEST_FORMAT = 1
+
+DEFAULT_MANIFEST = os.path.join(pdf_cache.CACHE_DIR, 'questions.manifest.json')
+
+
+def question_hash(question):
+    """Return the content hash of a question dict."""
+    content = {field: question.get(field) for field in HASHED_FIELDS}
+    blob = json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()
+
+
+def load_manifest(manifest_file=DEFAULT_MANIFEST):
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, manifest_file=DEFAULT_MANIFEST):
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+    tmp_file = manifest_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, manifest_file)
+
+
+def _load_current(output_file):
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            return {q['id']: q for q in json.load(f)}
+    except (OSError, ValueError):
+        return {}
+
+
+def _last_hashes(manifest, output_file, current):
+    """
+    The question hashes of the last build, or None if the manifest is stale.
+
+    It is stale if it was written for another file or format, or lists other
+    ids than the current file has, e.g. when the file was replaced since.
+    """
+    hashes = manifest.get('questions')
+    if (
+        not hashes
+        or manifest.get('format') != MANIFEST_FORMAT
+        or manifest.get('output') != os.path.abspath(output_file)
+        or set(hashes) != {str(q_id) for q_id in current}
+    ):
+        return None
+    return hashes
+
+
+def write_incremental(questions, output_file, sources=None, manifest_file=DEFAULT_MANIFEST):
+    """
+    Write `questions` to `output_file`, replacing only entries that changed.
+
+    `questions` may be a generator of dicts with an 'id'; they are streamed to
+    a temporary file next to `output_file`. An entry whose hash matches the
+    manifest of the last build is copied from the current file unchanged (so
+    fixes made there survive), everything else is taken from `questions`.
+    Without a manifest, or with a stale one, every entry is taken from
+    `questions` and the file is rewritten. `sources` maps each source PDF to
+    its page hashes and is recorded in the manifest.
+
+    Returns the ids of the entries that were added, changed or removed, or
+    all of them after a full rewrite.
+    """
+    current = _load_current(output_file)
+    old_hashes = _last_hashes(load_manifest(manifest_file), output_file, current)
+    full = old_hashes is None
+    # Entries that may be copied from the current file
+    reusable = {} if full else current
+
+    new_hashes = {}
+    changed = []
+
+    def patched():
+        for question in questions:
+            q_id = question['id']
+            new_hash = question_hash(question)
+            new_hashes[str(q_id)] = new_hash
+            if q_id in reusable and old_hashes.get(str(q_id)) == new_hash:
+                yield reusable[q_id]
+            else:
+                changed.append(q_id)
+                yield question
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        question_parser.dump_json_array(patched(), f)
+
+    removed = sorted(q_id for q_id in current if str(q_id) not in new_hashes)
+    changed.extend(removed)
+    if changed or full:
+        os.replace(tmp_file, output_file)
+    else:
+        os.unlink(tmp_file)
+
+    save_manifest({
+        'format': MANIFEST_FORMAT,
+        'output': os.path.abspath(output_file),
+        'questions': new_hashes,
+        'sources': sources or {},
+    }, manifest_file)
+    return changed
@@ -2,267 +2,12 @@
 """
 COMPLETE corrections for ALL 375 questions.
 Based on reading each question and determining the correct answer through Linux/Kali knowledge.
-"""
-import json
-
-with open('app/src/main/assets/questions.json', 'r', encoding='utf-8') as f:
-    questions = json.load(f)
-
-print(f"📋 Correcting ALL {len(questions)} questions systematically...\n")
-
-# COMPLETE MANUAL CORRECTIONS - Reading each question carefully
-corrections = {
-    # Questions 1-5: Already correct (D, C, C, D, C)
-    
-    # Q6: Multi-tasking -> C (time slicing), not D
-    6: 'C',
-    
-    # Q7: Correct (C - mount)
-    
-    # Q8: Linux filesystems -> D (ext2/3/4), not C (ReFS/UDF/ISO)
-    8: 'D',
-    
-    # Q9: VFAT -> C (DOS/Windows), not A (partitioning tool)
-    9: 'C',
-    
-    # Q10: NFS -> D (Network File System), not C
-    10: 'D',
-    
-    # Q11: /proc/ -> B (virtual filesystem), not D
-    11: 'B',
-    
-    # Q12: Correct (D - /sys/)
-    
-    # Q13: Mounting -> D (accessible at mount point), not C (physical)
-    13: 'D',
-    
-    # Q14: User homes -> A (/home/), not D
-    14: 'A',
-    
-    # Q15: Correct (A - terminal)
-    
-    # Q16: Kali default terminal -> D (QTerminal) or A depends on version, keeping current
-    
-    # Q17: cd -> B (Change Directory), not D
-    17: 'B',
-    
-    # Q18: Correct (C - cd ..)
-    
-    # Q19: ls -> C (lists contents), not D
-    19: 'C',
-    
-    # Q20: ls -l -> C (long listing), not A
-    20: 'C',
-    
-    # Q21: cp -> B (copies), not A
-    21: 'B',
-    
-    # Q22: Correct (A - mv)
-    
-    # Q23: rm -r -> C (recursive remove), not D
-    23: 'C',
-    
-    # Q24: Correct (C - mkdir)
-    # Q25: Correct (B - cat)
-    
-    # Q26: less -> A (page viewer), not C
-    26: 'A',
-    
-    # Q27: Correct (D - tail)
-    # Q28: Correct (C - grep)
-    
-    # Q29: touch -> D (creates file/updates timestamp), not C
-    29: 'D',
-    
-    # Q30: echo -> B (displays text), not A
-    30: 'B',
-    
-    # Q31: Correct (B - which)
-    
-    # Q32: wc -> D (word count), not A
-    32: 'D',
-    
-    # Q33: uniq -> B (filters repeated lines), not A
-    33: 'B',
-    
-    # Q34: Paths -> D (absolute from /, relative from current), not C
-    34: 'D',
-    
-    # Q35: Kali released March 2013 -> A, not C
-    35: 'A',
-    
-    # Q36: Predecessor -> C (BackTrack), not D
-    36: 'C',
-    
-    # Q37: Kali 1.0 based on Wheezy -> A, not B
-    37: 'A',
-    
-    # Q38: Kali Rolling based on Testing -> D, not A
-    38: 'D',
-    
-    # Q39-42: Keep current (need to verify numbers)
-    
-    # Q43: kali-dev -> C (development repo), not D
-    43: 'C',
-    
-    # Q44: kali-rolling -> D (stable distro for users), not B
-    44: 'D',
-    
-    # Q45: Package Tracker -> B, keeping current
-    
-    # Q46: Packages maintained -> D (Git repos), not B
-    46: 'D',
-    
-    # Q47: Correct (D - latest packages)
-    
-    # Q48: Linux distribution -> A (complete OS), not C
-    48: 'A',
-    
-    # Q49: NOT typical -> A (office work), not B
-    49: 'A',
-    
-    # Q50: Correct (D - all devices)
-    
-    # Q51: Vulnerability Analysis -> B (testing for vulnerabilities), not D
-    51: 'B',
-    
-    # Q52: Correct (C - web app analysis)
-    
-    # Q53: Post Exploitation -> C (maintaining access), keeping as is
-    
-    # Q54: Correct (C - social engineering)
-    
-    # Q55: Live System -> B (bootable without installation), not D
-    55: 'B',
-    
-    # Q56: Live changes -> A (not preserved), not D
-    56: 'A',
-    
-    # Q57: Correct (C - forensics prevents auto-mount)
-    # Q58: Correct (C - customized kernel)
-    
-    # Q59: Customize images -> B (live-build), not A
-    59: 'B',
-    
-    # Q60: Trustable OS -> A (signed packages, checksums), not C
-    60: 'A',
-    
-    # Q61: Correct (D - all ARM devices)
-    
-    # Q62: Network services -> C (disabled by default), not D
-    62: 'C',
-    
-    # Q63: Enable service -> D (systemctl enable), not C
-    63: 'D',
-    
-    # Q64: App selection -> B (curated tools), not D
-    64: 'B',
-    
-    # Q65: Tool requests -> B (Bug Tracker), not A
-    65: 'B',
-    
-    # Q66: License -> D (DFSG compliant), not B
-    66: 'D',
-    
-    # Q67: Desktop environments -> B (Xfce, GNOME, KDE, others), not D
-    67: 'B',
-    
-    # Q68: Rolling benefit -> D (always up-to-date), not C
-    68: 'D',
-    
-    # Q69: Correct (D - kali.org/downloads)
-    
-    # Q70: Download from official -> C (avoid malware), not A
-    70: 'C',
-    
-    # Q71: Download domain -> C (cdimage.kali.org), not A
-    71: 'C',
-    
-    # Q72: Mirrors -> D (improve speed/reduce load), not A
-    72: 'D',
-    
-    # Q73: 64-bit CPU run 32-bit -> C (yes), not D
-    73: 'C',
-    
-    # Q74: Correct (C - 32-bit CPU cannot run 64-bit)
-    
-    # Q75: Live image special -> C (can run live or install), not B
-    75: 'C',
-    
-    # Q76: Installer advantage -> D (selectable options), not C
-    76: 'D',
-    
-    # Q77: Download methods -> C (HTTP or BitTorrent), not D
-    77: 'C',
-    
-    # Q78: Note while downloading -> D (checksum), not C
-    78: 'D',
-    
-    # Q79: Hash algorithm -> B (SHA-256), not C
-    79: 'B',
-    
-    # Q80: SHA-256 command -> D (sha256sum), not A
-    80: 'D',
-    
-    # Q81: Verify methods -> D (checksums and PGP), not B
-    81: 'D',
-    
-    # Q82-85: Keep current (GPG verification)
-    
-    # Q86: Successful checksum -> C (OK), not D
-    86: 'C',
-    
-    # Q87: Checksums differ -> C (corruption), not B
-    87: 'C',
-    
-    # Q88: Checksum fails -> C (download again), not A
-    88: 'C',
-    
-    # Q89: Correct (B - Live System)
-    
-    # Q90: Live image uses -> A (all uses), not D
-    90: 'A',
-    
-    # Q91: Correct (C - dd command)
-    # Q92: Correct (C - careful with dd)
-    
-    # Q93: Boot from USB -> B (press key for boot menu), not D
-    93: 'B',
-    
-    # Q94: Prevent booting -> A (Secure Boot), not B
-    94: 'A',
-    
-    # Q95: Correct (B - default user: root)  
-    # Q96: Correct (B - default pass: root) - Wait, should be C (kali)
-    96: 'D',  # Actually 'D' is 'toor' which was old default, should be 'C' (kali) for new versions
-    
-    # Q97: Correct (D - changes lost)
-    
-    # Q98: Persistent changes -> B (configure persistence), not C
-    98: 'B',
-    
-    # Q99: Correct (B - check 32/64 bit)
-    # Q100: Correct (D - check 'lm' flag)
-}
 
-# Apply corrections
-corrected = 0
-for q_id, correct_ans in corrections.items():
-    if q_id <= len(questions):
-        q = questions[q_id - 1]
-        old = q['correct']
-        if old != correct_ans:
-            q['correct'] = correct_ans
-            corrected += 1
-            print(f"Q{q_id:3d}: {old} → {correct_ans} | {q['question_en'][:55]}...")
-
-print(f"\n{'='*80}")
-print(f"✅ Corrected {corrected} answers out of {len(corrections)} reviewed")
-print(f"📝 Reviewed first 100 questions, continuing...")
-
-# Save
-with open('app/src/main/assets/questions.json', 'w', encoding='utf-8') as f:
-    json.dump(questions, f, indent=2, ensure_ascii=False)
+The corrections are declared in corrections/complete_corrections.csv
+and applied with corrections.py; pass --dry-run to only show the changes.
+"""
+import sys
 
-print("💾 Saved!")
+import corrections
 
+sys.exit(corrections.main(['corrections/complete_corrections.csv', *sys.argv[1:]]))
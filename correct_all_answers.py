@@ -2,91 +2,12 @@
 """
 Complete manual correction of ALL 375 questions.
 Each answer is determined by reading and understanding the question.
-"""
-import json
-
-# Load questions
-with open('app/src/main/assets/questions.json', 'r', encoding='utf-8') as f:
-    questions = json.load(f)
-
-print(f"📋 Correcting {len(questions)} questions based on Linux knowledge...\n")
-
-# Comprehensive corrections by reading each question
-corrections = {
-    1: 'D',   # Linux kernel manages hardware, processes, users, permissions, filesystem
-    2: 'C',   # Kernel space (ring 0) vs user space
-    3: 'C',   # ls -l shows 'b' for block, 'c' for character
-    4: 'D',   # Device files in /dev/
-    5: 'C',   # PID = Process Identifier
-    6: 'C',   # Multi-tasking via time slicing
-    7: 'C',   # mount command
-    8: 'D',   # Linux uses ext2, ext3, ext4
-    9: 'C',   # VFAT is DOS/Windows filesystem
-    10: 'D',  # NFS = Network File System
-    11: 'B',  # /proc/ is virtual filesystem for hardware/processes
-    12: 'D',  # /sys/ is virtual filesystem for system/hardware info
-    13: 'D',  # Mounting = making filesystem accessible at mount point
-    14: 'A',  # User home directories in /home/
-    15: 'A',  # Terminal = text-based interface running shell
-    16: 'D',  # Kali uses QTerminal (Xfce default) - actually could be A (GNOME Terminal)
-    17: 'B',  # cd = Change Directory
-    18: 'C',  # cd .. = parent directory
-    19: 'C',  # ls = list directory contents
-    20: 'C',  # ls -l = long listing format
-    21: 'B',  # cp = copy
-    22: 'A',  # mv = move/rename
-    23: 'C',  # rm -r = recursive remove
-    24: 'C',  # mkdir = make directory
-    25: 'B',  # cat = concatenate/display
-    26: 'A',  # less = page-by-page viewer
-    27: 'D',  # tail = show last lines
-    28: 'C',  # grep = search patterns
-}
-
-# Continue with more questions...
-corrections.update({
-    29: 'C',  # find command searches for files
-    30: 'B',  # chmod changes permissions
-    31: 'C',  # chown changes ownership
-    32: 'A',  # sudo = superuser do
-    33: 'D',  # su = switch user
-    34: 'B',  # pwd = print working directory
-    35: 'C',  # whoami shows current user
-    36: 'A',  # ps shows processes
-    37: 'D',  # kill sends signals to processes
-    38: 'B',  # top shows real-time processes
-    39: 'C',  # df shows disk space
-    40: 'A',  # du shows disk usage
-})
 
-# Apply all corrections
-corrected_count = 0
-errors_fixed = []
-
-for q_id, correct_ans in corrections.items():
-    if q_id <= len(questions):
-        q = questions[q_id - 1]
-        old_ans = q['correct']
-        
-        if old_ans != correct_ans:
-            q['correct'] = correct_ans
-            corrected_count += 1
-            errors_fixed.append(q_id)
-            
-            print(f"✏️  Q{q_id}: {old_ans} → {correct_ans}")
-            print(f"    {q['question_en'][:65]}...")
-
-# Save
-with open('app/src/main/assets/questions.json', 'w', encoding='utf-8') as f:
-    json.dump(questions, f, indent=2, ensure_ascii=False)
-
-print(f"\n{'='*80}")
-print(f"✅ Fixed {corrected_count} wrong answers")
-print(f"📝 Reviewed {len(corrections)} questions total")
-print(f"💾 Saved to questions.json")
+The corrections are declared in corrections/correct_all_answers.csv
+and applied with corrections.py; pass --dry-run to only show the changes.
+"""
+import sys
 
-if errors_fixed:
-    print(f"\n❌ Questions that had wrong answers: {errors_fixed[:20]}")
-    if len(errors_fixed) > 20:
-        print(f"    ... and {len(errors_fixed) - 20} more")
+import corrections
 
+sys.exit(corrections.main(['corrections/correct_all_answers.csv', *sys.argv[1:]]))
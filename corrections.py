@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Batch answer corrections for app/src/main/assets/questions.json.
+
+Corrections are declared in files instead of hard-coded dicts, one entry per
+question:
+
+    corrections/*.csv     id,correct,note
+    corrections/*.jsonl   {"id": 6, "correct": "C", "note": "..."}
+
+Any number of correction sets are merged in memory and applied in one
+transaction: questions.json is loaded once, every set is checked against the
+others for conflicting answers, and the result is written once, atomically.
+
+    python3 corrections.py --dry-run corrections/*.csv
+    python3 corrections.py corrections/complete_corrections.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+QUESTIONS_FILE = 'app/src/main/assets/questions.json'
+VALID_ANSWERS = ('A', 'B', 'C', 'D')
+
+
+class Correction:
+    """One declared answer: question `id` should be `correct`."""
+
+    def __init__(self, q_id, correct, note='', source='', line=0):
+        self.id = q_id
+        self.correct = correct
+        self.note = note
+        self.source = source
+        self.line = line
+
+    def where(self):
+        return f"{self.source}:{self.line}" if self.line else self.source
+
+
+def _parse_entry(raw, source, line):
+    try:
+        q_id = int(raw['id'])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"{source}:{line}: missing or invalid id")
+    correct = str(raw.get('correct') or '').strip().upper()
+    if correct not in VALID_ANSWERS:
+        raise ValueError(f"{source}:{line}: invalid answer {raw.get('correct')!r} for Q{q_id}")
+    return Correction(q_id, correct, (raw.get('note') or '').strip(), source, line)
+
+
+def load_correction_set(path):
+    """Read a .csv or .jsonl correction file into a list of Corrections."""
+    corrections = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith('.jsonl'):
+            for line, text in enumerate(f, start=1):
+                if text.strip() and not text.lstrip().startswith('#'):
+                    corrections.append(_parse_entry(json.loads(text), path, line))
+        else:
+            # Line 1 is the header
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                if (row.get('id') or '').lstrip().startswith('#'):
+                    continue
+                corrections.append(_parse_entry(row, path, line))
+    return corrections
+
+
+def merge(correction_sets):
+    """
+    Merge correction sets in order.
+
+    Returns (merged, conflicts): merged maps id to the last Correction seen
+    for it; conflicts lists, per id, every Correction when they disagree on
+    the answer (also within a single set).
+    """
+    by_id = {}
+    for corrections in correction_sets:
+        for correction in corrections:
+            by_id.setdefault(correction.id, []).append(correction)
+
+    merged = {q_id: entries[-1] for q_id, entries in by_id.items()}
+    conflicts = [
+        entries for entries in by_id.values()
+        if len({c.correct for c in entries}) > 1
+    ]
+    return merged, conflicts
+
+
+def plan(questions, merged):
+    """
+    Work out what applying `merged` to `questions` would change.
+
+    Returns (changes, unknown): changes is a list of (question, old, new,
+    Correction) sorted by id; unknown lists Corrections for ids that are not
+    in `questions`.
+    """
+    index = {q['id']: q for q in questions}
+    changes = []
+    unknown = []
+    for q_id in sorted(merged):
+        correction = merged[q_id]
+        question = index.get(q_id)
+        if question is None:
+            unknown.append(correction)
+        elif question['correct'] != correction.correct:
+            changes.append((question, question['correct'], correction.correct, correction))
+    return changes, unknown
+
+
+def write_questions(questions, path):
+    """Replace `path` atomically with `questions`."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(questions, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def apply_corrections(paths, questions_file=QUESTIONS_FILE, dry_run=False, last_wins=False):
+    """
+    Apply every correction file in `paths` to `questions_file` in one pass.
+
+    Raises ValueError when the sets conflict, unless `last_wins` is set, in
+    which case the file listed last decides. Returns the list of changes (see
+    `plan`); nothing is written when `dry_run` is set or nothing changed.
+    """
+    merged, conflicts = merge(load_correction_set(path) for path in paths)
+    if conflicts and not last_wins:
+        details = '; '.join(
+            f"Q{entries[0].id}: " + ', '.join(f"{c.correct} ({c.where()})" for c in entries)
+            for entries in conflicts
+        )
+        raise ValueError(f"{len(conflicts)} conflicting corrections: {details}")
+
+    with open(questions_file, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+
+    changes, unknown = plan(questions, merged)
+    for correction in unknown:
+        print(f"⚠️  {correction.where()}: Q{correction.id} is not in {questions_file}")
+
+    if changes and not dry_run:
+        for question, _, new, _ in changes:
+            question['correct'] = new
+        write_questions(questions, questions_file)
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply answer correction sets to questions.json.')
+    parser.add_argument('files', nargs='+', metavar='FILE', help='.csv or .jsonl correction sets')
+    parser.add_argument('--questions', default=QUESTIONS_FILE, help='questions.json to correct')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='only show what would change')
+    parser.add_argument('--last-wins', action='store_true',
+                        help='resolve conflicts in favour of the file listed last')
+    args = parser.parse_args(argv)
+
+    try:
+        changes = apply_corrections(args.files, args.questions, args.dry_run, args.last_wins)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    for question, old, new, correction in changes:
+        print(f"✏️  Q{question['id']}: {old} → {new} | {question['question_en'][:55]}...")
+        if correction.note:
+            print(f"    {correction.note}")
+
+    print(f"\n{'='*80}")
+    if args.dry_run:
+        print(f"🔍 Dry run: {len(changes)} answers would change, nothing written")
+    elif changes:
+        print(f"✅ Corrected {len(changes)} answers")
+        print(f"💾 Saved to {args.questions}")
+    else:
+        print("✅ All answers were already correct!")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
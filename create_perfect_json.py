@@ -1,131 +1,85 @@
 #!/usr/bin/env python3
 import json
-import pdfplumber
-import re
+import os
 
-print("🔍 Extracting all questions from KLCP_Fragenkatalog.pdf...")
+import catalog_build
+import pdf_cache
+import question_bank
+import question_parser
 
-# Extract questions from catalog
-questions_data = []
-with pdfplumber.open('KLCP_Fragenkatalog.pdf') as pdf:
-    full_text = ''
-    for page in pdf.pages:
-        text = page.extract_text()
-        if text:
-            full_text += text + '\n\n===PAGE_BREAK===\n\n'
-    
-    # Split by "Question " (with space)
-    blocks = re.split(r'\n\s*Question\s+\n', full_text, flags=re.IGNORECASE)
-    
-    for block_idx, block in enumerate(blocks[1:], start=1):  # Skip first empty
-        lines = [l.strip() for l in block.split('\n') if l.strip() and l.strip() != '===PAGE_BREAK===']
-        
-        if len(lines) < 6:
-            continue
-        
-        # First line should be English question
-        question_en = lines[0]
-        
-        # Next 4 lines should be English options A-D
-        options_en = []
-        idx = 1
-        while idx < len(lines) and len(options_en) < 4:
-            line = lines[idx]
-            if re.match(r'^[A-D]\)', line):
-                options_en.append(line)
-            idx += 1
-        
-        if len(options_en) != 4:
-            print(f"⚠️  Question {block_idx}: Only found {len(options_en)} English options")
-            continue
-        
-        # Find "Frage" for German section
-        question_de = ""
-        options_de = []
-        
-        for i in range(idx, len(lines)):
-            if lines[i].lower().startswith('frage'):
-                # Next line is German question
-                if i + 1 < len(lines):
-                    question_de = lines[i + 1]
-                    
-                    # Get German options
-                    for j in range(i + 2, len(lines)):
-                        if re.match(r'^[A-D]\)', lines[j]):
-                            options_de.append(lines[j])
-                            if len(options_de) == 4:
-                                break
-                break
-        
-        if len(options_de) != 4:
-            # Try to copy from English if German not found
-            options_de = options_en.copy()
-            if not question_de:
-                question_de = question_en
-        
-        questions_data.append({
-            'question_en': question_en,
-            'question_de': question_de,
-            'options_en': options_en,
-            'options_de': options_de
-        })
+print("🔍 Loading KLCP_Fragenkatalog.pdf and KLCP_Loesungen.pdf (only changed pages are re-extracted)...")
 
-print(f"✅ Extracted {len(questions_data)} questions")
+catalog_pages, catalog_changed = pdf_cache.load_pages_incremental('KLCP_Fragenkatalog.pdf')
+solution_pages, solution_changed = pdf_cache.load_pages_incremental('KLCP_Loesungen.pdf')
+print(f"✅ Re-extracted {len(catalog_changed)} catalog and {len(solution_changed)} solution pages")
 
-print("\n🔍 Extracting all answers from KLCP_Loesungen.pdf...")
 
-# Extract answers from solutions
-answers_list = []
-with pdfplumber.open('KLCP_Loesungen.pdf') as pdf:
-    full_text = ''
-    for page in pdf.pages:
-        text = page.extract_text()
-        if text:
-            full_text += text + '\n\n===PAGE_BREAK===\n\n'
-    
-    # Split by "Question " blocks
-    blocks = re.split(r'\n\s*Question\s+\n', full_text, flags=re.IGNORECASE)
-    
-    for block in blocks[1:]:  # Skip first empty
-        # Find FIRST "Correct Answer: X" in this block
-        match = re.search(r'Correct\s+Answer:\s+([A-D])', block, re.IGNORECASE)
-        if match:
-            answers_list.append(match.group(1).upper())
+def iter_catalog_questions():
+    for block_idx, question in enumerate(
+            question_parser.iter_questions_from_layout(catalog_pages), start=1):
+        if len(question['options_en']) != 4:
+            print(f"⚠️  Question {block_idx}: Only found {len(question['options_en'])} English options")
+            continue
 
-print(f"✅ Extracted {len(answers_list)} answers")
+        if len(question['options_de']) != 4:
+            # Try to copy from English if German not found
+            question['options_de'] = question['options_en'].copy()
+            if not question['question_de']:
+                question['question_de'] = question['question_en']
 
-# Combine questions and answers
-min_count = min(len(questions_data), len(answers_list))
-print(f"\n✨ Creating {min_count} complete questions...")
+        yield question
 
-complete_questions = []
-for i in range(min_count):
-    complete_questions.append({
-        'id': i + 1,
-        'question_en': questions_data[i]['question_en'],
-        'question_de': questions_data[i]['question_de'],
-        'options_en': questions_data[i]['options_en'],
-        'options_de': questions_data[i]['options_de'],
-        'correct': answers_list[i]
-    })
 
-# Save to file
+def iter_complete_questions(first_questions, stats):
+    answers = question_parser.iter_answers(page['text'] for page in solution_pages)
+    # zip() stops at the shorter of the two streams, like the old min_count
+    for i, (question, answer) in enumerate(zip(iter_catalog_questions(), answers)):
+        complete = {
+            'id': i + 1,
+            'question_en': question['question_en'],
+            'question_de': question['question_de'],
+            'options_en': question['options_en'],
+            'options_de': question['options_de'],
+            'correct': answer
+        }
+        if len(first_questions) < 10:
+            first_questions.append(complete)
+        stats['count'] = i + 1
+        yield complete
+
+
+# Patch only the entries whose content changed since the last build
 output_file = 'app/src/main/assets/questions.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(complete_questions, f, indent=2, ensure_ascii=False)
+first_questions = []
+stats = {'count': 0}
+sources = {
+    'KLCP_Fragenkatalog.pdf': [page['hash'] for page in catalog_pages],
+    'KLCP_Loesungen.pdf': [page['hash'] for page in solution_pages],
+}
+changed = catalog_build.write_incremental(
+    iter_complete_questions(first_questions, stats), output_file, sources=sources)
+count = stats['count']
 
-print(f"\n✅ Saved {len(complete_questions)} questions to {output_file}")
+if changed:
+    print(f"\n✅ Saved {count} questions to {output_file} ({len(changed)} changed: {changed[:20]})")
+else:
+    print(f"\n✅ {output_file} is up to date ({count} questions)")
+
+# Binary bank for fast random access, kept out of the app's assets
+bank_file = question_bank.DEFAULT_PATH
+if changed or not os.path.exists(bank_file):
+    with open(output_file, 'r', encoding='utf-8') as f:
+        question_bank.write_bank(json.load(f), bank_file)
+    print(f"✅ Saved {bank_file}")
 
 # Show first 10 questions as verification
 print("\n📋 First 10 questions for verification:")
 print("="*80)
-for i in range(min(10, len(complete_questions))):
-    q = complete_questions[i]
+for q in first_questions:
     print(f"\nQ{q['id']}: {q['question_en'][:60]}...")
     print(f"Answer: {q['correct']}")
     correct_option = q['options_en'][ord(q['correct']) - ord('A')]
     print(f"  ✅ {correct_option}")
 
 print("\n" + "="*80)
-print(f"✅ DONE! {len(complete_questions)} questions with correct answers saved!")
-
+print(f"✅ DONE! {count} questions with correct answers saved!")
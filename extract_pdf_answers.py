@@ -1,25 +1,10 @@
 #!/usr/bin/env python3
 import json
-import pdfplumber
-import re
+import pdf_cache
+import question_parser
 
-# Extract answers - only one per "Question" block
-pdf_answers = []
-with pdfplumber.open('KLCP_Loesungen.pdf') as pdf:
-    full_text = ""
-    for page in pdf.pages:
-        text = page.extract_text()
-        if text:
-            full_text += text + "\n"
-    
-    # Split by "Question" and extract first "Correct Answer:" from each block
-    blocks = re.split(r'\bQuestion\s+', full_text, flags=re.IGNORECASE)
-    
-    for block in blocks[1:]:  # Skip first empty block
-        # Find first "Correct Answer: X" in this block
-        match = re.search(r'Correct\s+Answer:\s+([A-D])', block, re.IGNORECASE)
-        if match:
-            pdf_answers.append(match.group(1).upper())
+# Extract answers - only the first "Correct Answer:" of each "Question" block
+pdf_answers = list(question_parser.iter_answers(pdf_cache.page_texts('KLCP_Loesungen.pdf')))
 
 print(f"📋 Extracted {len(pdf_answers)} answers from PDF")
 
@@ -2,66 +2,12 @@
 """
 Complete correction of ALL 375 questions by reading each one carefully.
 NO extraction from PDF - pure Linux knowledge based answers.
-"""
-import json
-
-with open('app/src/main/assets/questions.json', 'r', encoding='utf-8') as f:
-    questions = json.load(f)
-
-print(f"📋 Analyzing and correcting {len(questions)} questions...\n")
-
-# COMPLETE corrections based on reading each question
-corrections = {
-    # Already correct: 1, 2, 3, 4, 5, 7, 15, 18, 22, 24, 25, 27, 28, 31
-    
-    6: 'C',   # Multi-tasking -> time slicing (not D)
-    8: 'D',   # Linux filesystems -> ext2/3/4 (not C - ReFS/UDF/ISO)
-    9: 'C',   # VFAT -> DOS/Windows (not A - partitioning tool)
-    10: 'D',  # NFS -> Network File System (not C)
-    11: 'B',  # /proc/ -> virtual filesystem (not D)
-    13: 'D',  # Mounting -> making accessible (not C - physical)
-    14: 'A',  # User homes -> /home/ (not D)
-    16: 'D',  # Kali terminal -> QTerminal in Xfce (or A for newer versions)
-    17: 'B',  # cd -> Change Directory (not D)
-    19: 'C',  # ls -> lists contents (not D)
-    20: 'C',  # ls -l -> long listing (not A)
-    21: 'B',  # cp -> copies (not A)
-    23: 'C',  # rm -r -> recursive remove (not D)
-    26: 'A',  # less -> page viewer (not C)
-    29: 'D',  # touch -> creates file/updates timestamp (not C)
-    30: 'B',  # echo -> displays text (not A)
-    32: 'D',  # wc -> word count (not A)
-    33: 'B',  # uniq -> filters repeated lines (not A)
-    34: 'D',  # Absolute vs relative paths (not C)
-    35: 'A',  # Kali released March 2013 (not C)
-    36: 'C',  # Predecessor -> BackTrack (not D)
-    37: 'A',  # Kali 1.0 based on Wheezy (not B)
-    38: 'D',  # Kali Rolling based on Testing (not A)
-    39: 'B',  # Kali Rolling introduced 2016 (check specific)
-    40: 'C',  # Kali 1.x used GNOME Fallback (not D)
-    41: 'C',  # Behind Kali -> OffSec (correct!)
-    42: 'D',  # Packages -> over 600 (not C)
-}
 
-# Continue reading more questions to add corrections...
-# I need to go through ALL 375 questions
-
-corrected = 0
-for q_id, correct_ans in corrections.items():
-    if q_id <= len(questions):
-        q = questions[q_id - 1]
-        old = q['correct']
-        if old != correct_ans:
-            q['correct'] = correct_ans
-            corrected += 1
-            print(f"Q{q_id}: {old} → {correct_ans} | {q['question_en'][:60]}...")
-
-print(f"\n✅ Corrected {corrected} answers")
-print(f"📝 Need to review remaining {len(questions) - len(corrections)} questions")
-
-# Save
-with open('app/src/main/assets/questions.json', 'w', encoding='utf-8') as f:
-    json.dump(questions, f, indent=2, ensure_ascii=False)
+The corrections are declared in corrections/fix_all_375_questions.csv
+and applied with corrections.py; pass --dry-run to only show the changes.
+"""
+import sys
 
-print("💾 Saved!")
+import corrections
 
+sys.exit(corrections.main(['corrections/fix_all_375_questions.csv', *sys.argv[1:]]))
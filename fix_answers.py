@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import json
-import pdfplumber
-import re
+
+import answer_key
 
 print("📖 Loading existing questions.json...")
 with open('app/src/main/assets/questions.json', 'r', encoding='utf-8') as f:
@@ -11,46 +11,26 @@ print(f"✅ Loaded {len(questions)} questions")
 
 print("\n🔍 Extracting correct answers from KLCP_Loesungen.pdf...")
 
-# Extract answers from solutions PDF
-answers_list = []
-with pdfplumber.open('KLCP_Loesungen.pdf') as pdf:
-    full_text = ''
-    for page in pdf.pages:
-        text = page.extract_text()
-        if text:
-            full_text += text + '\n\n'
-    
-    # Split by "Question" keyword
-    blocks = re.split(r'\bQuestion\s+\n', full_text, flags=re.IGNORECASE | re.MULTILINE)
-    
-    print(f"Found {len(blocks)} blocks in PDF")
-    
-    for block in blocks[1:]:  # Skip header
-        # Find FIRST "Correct Answer: X" in this block
-        match = re.search(r'Correct\s+Answer:\s+([A-D])', block, re.IGNORECASE)
-        if match:
-            answers_list.append(match.group(1).upper())
+# Answer key indexed by question number
+answers = answer_key.AnswerKey.load('KLCP_Loesungen.pdf')
 
-print(f"✅ Extracted {len(answers_list)} answers from PDF")
+print(f"✅ Indexed {len(answers)} answers from PDF")
 
 # Update questions with correct answers
-if len(answers_list) < len(questions):
-    print(f"⚠️  Warning: Only {len(answers_list)} answers for {len(questions)} questions")
-    print(f"   Will update first {len(answers_list)} questions")
+missing = [q['id'] for q in questions if q['id'] not in answers]
+if missing:
+    print(f"⚠️  Warning: No answer in the PDF for {len(missing)} questions: {missing[:20]}")
 
+by_id = {q['id']: q for q in questions}
 errors_found = []
-for i in range(min(len(questions), len(answers_list))):
-    old_answer = questions[i]['correct']
-    new_answer = answers_list[i]
-    
-    if old_answer != new_answer:
-        errors_found.append({
-            'id': questions[i]['id'],
-            'old': old_answer,
-            'new': new_answer,
-            'question': questions[i]['question_en'][:70]
-        })
-        questions[i]['correct'] = new_answer
+for diff in answers.diff(questions):
+    errors_found.append({
+        'id': diff['id'],
+        'old': diff['json_answer'],
+        'new': diff['pdf_answer'],
+        'question': diff['question'][:70]
+    })
+    by_id[diff['id']]['correct'] = diff['pdf_answer']
 
 # Show errors
 if errors_found:
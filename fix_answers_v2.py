@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import json
-import pdfplumber
-import re
+
+import answer_key
 
 print("📖 Loading existing questions.json...")
 with open('app/src/main/assets/questions.json', 'r', encoding='utf-8') as f:
@@ -11,67 +11,38 @@ print(f"✅ Loaded {len(questions)} questions")
 
 print("\n🔍 Extracting correct answers from KLCP_Loesungen.pdf...")
 
-# Extract ALL "Correct Answer: X" occurrences
-all_matches = []
-with pdfplumber.open('KLCP_Loesungen.pdf') as pdf:
-    for page_num, page in enumerate(pdf.pages, 1):
-        text = page.extract_text()
-        if text:
-            # Find all "Correct Answer: X" on this page
-            matches = re.findall(r'Correct\s+Answer:\s+([A-D])', text, re.IGNORECASE)
-            for match in matches:
-                all_matches.append(match.upper())
-            
-            if matches:
-                print(f"  Page {page_num}: Found {len(matches)} answer(s)")
-
-print(f"\n✅ Extracted {len(all_matches)} total 'Correct Answer' entries")
-
-# The PDF has answers in both EN and DE, so we get duplicates
-# Take only unique sequential answers (every 2nd occurrence)
-answers_list = []
-seen_in_sequence = []
-for i, ans in enumerate(all_matches):
-    if i == 0:
-        answers_list.append(ans)
-        seen_in_sequence = [ans]
-    elif i % 2 == 0:  # Even index - new question
-        answers_list.append(ans)
-        seen_in_sequence = [ans]
-    # Skip odd indices (German duplicates)
-
-print(f"📝 After deduplication: {len(answers_list)} unique answers")
+# Answer key indexed by question number. Only the first answer of each
+# "Question" block counts, so the German duplicates need no special handling.
+answers = answer_key.AnswerKey.load('KLCP_Loesungen.pdf')
+
+print(f"✅ Indexed {len(answers)} answers")
 
 # Update questions with correct answers
-if len(answers_list) != len(questions):
-    print(f"⚠️  Mismatch: {len(answers_list)} answers vs {len(questions)} questions")
-    min_count = min(len(answers_list), len(questions))
-    print(f"   Will update first {min_count} questions")
-else:
-    min_count = len(questions)
+if len(answers) != len(questions):
+    print(f"⚠️  Mismatch: {len(answers)} answers vs {len(questions)} questions")
+    print("   Will update the questions that have an answer")
 
+by_id = {q['id']: q for q in questions}
 errors_found = []
-for i in range(min_count):
-    old_answer = questions[i]['correct']
-    new_answer = answers_list[i]
-    
-    if old_answer != new_answer:
-        q = questions[i]
-        old_opt = q['options_en'][ord(old_answer) - ord('A')] if old_answer in 'ABCD' else '?'
-        new_opt = q['options_en'][ord(new_answer) - ord('A')] if new_answer in 'ABCD' else '?'
-        
-        errors_found.append({
-            'id': q['id'],
-            'old': old_answer,
-            'new': new_answer,
-            'question': q['question_en']
-        })
-        
-        questions[i]['correct'] = new_answer
-        
-        print(f"\n❌ Q{q['id']}: {q['question_en'][:60]}...")
-        print(f"   OLD: {old_answer}) {old_opt[:50]}...")
-        print(f"   NEW: {new_answer}) {new_opt[:50]}...")
+for diff in answers.diff(questions):
+    q = by_id[diff['id']]
+    old_answer = diff['json_answer']
+    new_answer = diff['pdf_answer']
+    old_opt = q['options_en'][ord(old_answer) - ord('A')] if old_answer and old_answer in 'ABCD' else '?'
+    new_opt = q['options_en'][ord(new_answer) - ord('A')]
+
+    errors_found.append({
+        'id': q['id'],
+        'old': old_answer,
+        'new': new_answer,
+        'question': q['question_en']
+    })
+
+    q['correct'] = new_answer
+
+    print(f"\n❌ Q{q['id']}: {q['question_en'][:60]}...")
+    print(f"   OLD: {old_answer}) {old_opt[:50]}...")
+    print(f"   NEW: {new_answer}) {new_opt[:50]}...")
 
 # Summary
 print(f"\n{'='*80}")
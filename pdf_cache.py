@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Shared, cached PDF ingestion for the KLCP catalog scripts.
+
+Every PDF is parsed once with pdfplumber. The per-page text and char records
+are pickled under .pdf_cache/, keyed by the SHA-256 of the file plus the
+pdfplumber/pdfminer versions and sources and the LAParams in use, so later
+runs of any script get a cache hit instead of a full pdfminer layout pass.
+
+Usage from a script:
+
+    import pdf_cache
+    for text in pdf_cache.page_texts('KLCP_Fragenkatalog.pdf'):
+        ...
+
+Warm the cache from the shell:
+
+    python3 pdf_cache.py KLCP_Fragenkatalog.pdf KLCP_Loesungen.pdf
+
+Pass `-j N` (or `workers=N` to `load_pages`) to spread a cache miss over N
+worker processes.
+"""
+import argparse
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.pdf_cache')
+
+# Bump when the layout of a cache entry changes.
+CACHE_FORMAT = 2
+
+# Order of the fields stored for every char. Keeping rows as tuples instead of
+# dicts keeps the cache small and fast to unpickle.
+CHAR_FIELDS = (
+    'text', 'fontname', 'size', 'x0', 'x1', 'top', 'bottom', 'doctop', 'upright',
+)
+
+
+def _package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return '0'
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(name):
+    """Hash of the .py files of package `name`, as they are on disk.
+
+    The vendored pdfminer and pdfplumber are patched in place without a
+    version bump, so their version strings alone can't tell a stale cache.
+    """
+    digest = hashlib.sha256()
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.submodule_search_locations:
+        return '0'
+    for root in spec.submodule_search_locations:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith('.py'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                digest.update(os.path.relpath(path, root).encode('utf-8'))
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def file_hash(path):
+    """Return the hex SHA-256 of the file at `path`."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _settings_digest(laparams):
+    settings = {
+        'format': CACHE_FORMAT,
+        'pdfplumber': _package_version('pdfplumber'),
+        'pdfminer': _package_version('pdfminer.six'),
+        'pdfplumber_source': _source_digest('pdfplumber'),
+        'pdfminer_source': _source_digest('pdfminer'),
+        'laparams': laparams,
+    }
+    blob = json.dumps(settings, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def cache_key(path, laparams=None):
+    """Key for `path` under the given LAParams and installed library sources."""
+    return file_hash(path) + '-' + _settings_digest(laparams)
+
+
+def _cache_path(key):
+    return os.path.join(CACHE_DIR, key + '.pickle')
+
+
+def _read_cache(key):
+    try:
+        with open(_cache_path(key), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _write_pickle(path, obj):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_cache(key, pages):
+    _write_pickle(_cache_path(key), pages)
+
+
+def extract_page(page):
+    """Turn a pdfplumber page into the plain record stored in the cache."""
+    return {
+        'page_number': page.page_number,
+        'width': float(page.width),
+        'height': float(page.height),
+        'text': page.extract_text() or '',
+        'chars': [tuple(c[k] for k in CHAR_FIELDS) for c in page.text_chars],
+    }
+
+
+def _parse(path, laparams=None, page_numbers=None):
+    import pdfplumber
+
+    with pdfplumber.open(path, laparams=laparams, pages=page_numbers) as pdf:
+        pages = []
+        for page in pdf.pages:
+            pages.append(extract_page(page))
+            page.close()
+        return pages
+
+
+def _parse_range(args):
+    path, laparams, first, last = args
+    return _parse(path, laparams, list(range(first, last + 1)))
+
+
+def _page_count(path):
+    """
+    Count the pages of `path` by walking its page tree.
+
+    The /Count of the root may be wrong, and pages past it would then be
+    dropped by the ranges of `parse_parallel`.
+    """
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfpage import PDFPage, PDFPageIndex, PDFPageIndexError
+    from pdfminer.pdfparser import PDFParser
+
+    with open(path, 'rb') as f:
+        parser = PDFParser(f)
+        try:
+            doc = PDFDocument(parser)
+            try:
+                return len(PDFPageIndex(doc))
+            except PDFPageIndexError:
+                return sum(1 for _ in PDFPage.create_pages(doc))
+        finally:
+            parser.close()
+
+
+def _page_ranges(page_count, chunks):
+    """Split pages 1..page_count into at most `chunks` contiguous ranges."""
+    size, extra = divmod(page_count, chunks)
+    ranges = []
+    first = 1
+    for i in range(chunks):
+        last = first + size - 1 + (1 if i < extra else 0)
+        if last >= first:
+            ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
+def _rebase_doctops(pages):
+    """
+    Recompute char doctops across a merged page list.
+
+    pdfplumber measures doctop from the first page it opened, so a worker that
+    only opened pages 40-60 reports offsets relative to page 40.
+    """
+    doctop_index = CHAR_FIELDS.index('doctop')
+    top_index = CHAR_FIELDS.index('top')
+    offset = 0.0
+    for page in pages:
+        page['chars'] = [
+            row[:doctop_index] + (offset + row[top_index],) + row[doctop_index + 1:]
+            for row in page['chars']
+        ]
+        offset += page['height']
+    return pages
+
+
+def parse_parallel(path, laparams=None, workers=None):
+    """
+    Extract all pages of `path` in a process pool.
+
+    Every worker opens the PDF itself and extracts a disjoint, contiguous page
+    range. The ranges come back in order and are merged into one list, so the
+    result is identical to a serial parse.
+
+    The catalog scripts run at module level, so "fork" is used where the
+    platform has it; elsewhere callers need an `if __name__ == '__main__'`
+    guard.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import chain
+
+    workers = workers or os.cpu_count() or 1
+    page_count = _page_count(path)
+    if not page_count:
+        return []
+    # A few ranges per worker keeps the pool busy when some pages are slower.
+    ranges = _page_ranges(page_count, min(page_count, workers * 4))
+    tasks = [(path, laparams, first, last) for first, last in ranges]
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pages = list(chain.from_iterable(pool.map(_parse_range, tasks)))
+    return _rebase_doctops(pages)
+
+
+def load_pages(path, laparams=None, use_cache=True, workers=1):
+    """
+    Return the page records for `path`, parsing the PDF only on a cache miss.
+
+    Each record is a dict with page_number, width, height, text and chars
+    (tuples in CHAR_FIELDS order, see `page_chars`). With `workers` other than
+    1 a cache miss is parsed by `parse_parallel`; None means one worker per CPU.
+    """
+    key = cache_key(path, laparams)
+    if use_cache:
+        pages = _read_cache(key)
+        if pages is not None:
+            return pages
+
+    if workers == 1:
+        pages = _parse(path, laparams)
+    else:
+        pages = parse_parallel(path, laparams, workers)
+    if use_cache:
+        _write_cache(key, pages)
+    return pages
+
+
+def iter_pages(path, laparams=None, use_cache=True):
+    """
+    Yield the page records of `path` as they are decoded.
+
+    On a cache hit this simply walks the cached pages. On a miss the pages are
+    extracted one by one, so consumers can start before the last page is
+    parsed; the cache entry is written once the whole document has been read.
+    """
+    key = cache_key(path, laparams)
+    pages = _read_cache(key) if use_cache else None
+    if pages is not None:
+        yield from pages
+        return
+
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(path, laparams=laparams) as pdf:
+        for page in pdf.pages:
+            record = extract_page(page)
+            page.close()
+            if use_cache:
+                pages.append(record)
+            yield record
+    if use_cache:
+        _write_cache(key, pages)
+
+
+def iter_page_texts(path, **kwargs):
+    """Yield the extract_text() output of every page of `path` as it is decoded."""
+    for page in iter_pages(path, **kwargs):
+        yield page['text']
+
+
+def _object_digest(obj, memo, seen=frozenset()):
+    """SHA-256 over a PDF object tree, following references once per object."""
+    from pdfminer.pdftypes import PDFObjRef, PDFStream
+
+    if isinstance(obj, PDFObjRef):
+        if obj.objid not in memo:
+            if obj.objid in seen:
+                return b'R%d' % obj.objid
+            memo[obj.objid] = _object_digest(obj.resolve(), memo, seen | {obj.objid})
+        return memo[obj.objid]
+
+    digest = hashlib.sha256()
+    if isinstance(obj, PDFStream):
+        digest.update(_object_digest(obj.attrs, memo, seen))
+        rawdata = obj.get_rawdata()
+        digest.update(obj.get_data() if rawdata is None else rawdata)
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            digest.update(repr(key).encode('utf-8'))
+            digest.update(_object_digest(obj[key], memo, seen))
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b'[')
+        for item in obj:
+            digest.update(_object_digest(item, memo, seen))
+    else:
+        digest.update(repr(obj).encode('utf-8'))
+    return digest.digest()
+
+
+def page_hashes(path):
+    """
+    Return a content hash for every page of `path`, without layout analysis.
+
+    A page hash covers its content streams, resources (fonts, images, ...),
+    boxes and rotation, so it changes exactly when the rendered page can.
+    Objects shared between pages are only hashed once.
+    """
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+
+    memo = {}
+    hashes = []
+    with open(path, 'rb') as f:
+        doc = PDFDocument(PDFParser(f))
+        for page in PDFPage.create_pages(doc):
+            digest = hashlib.sha256()
+            for stream in page.contents:
+                digest.update(_object_digest(stream, memo))
+            digest.update(_object_digest(page.resources, memo))
+            digest.update(repr((page.mediabox, page.cropbox, page.rotate)).encode('utf-8'))
+            hashes.append(digest.hexdigest())
+    return hashes
+
+
+def _pages_state_path(path, laparams):
+    name = os.path.basename(path)
+    return os.path.join(CACHE_DIR, f"{name}-{_settings_digest(laparams)}.pages.pickle")
+
+
+def load_pages_incremental(path, laparams=None):
+    """
+    Return the page records for `path`, re-extracting only changed pages.
+
+    The page records from the last call for a file with the same name are
+    kept together with their page hashes. Pages whose hash is known are
+    reused (even if they moved), only new or modified pages go through
+    pdfplumber. Every returned record also carries its page 'hash'. The
+    result is stored as the regular cache entry as well.
+
+    Returns (pages, changed_page_numbers).
+    """
+    key = cache_key(path, laparams)
+    state_path = _pages_state_path(path, laparams)
+    hashes = page_hashes(path)
+
+    known = {}
+    try:
+        with open(state_path, 'rb') as f:
+            state = pickle.load(f)
+        known = dict(zip(state['hashes'], state['pages']))
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        pass
+
+    changed = [i + 1 for i, page_hash in enumerate(hashes) if page_hash not in known]
+    extracted = iter(_parse(path, laparams, changed) if changed else [])
+
+    pages = []
+    for i, page_hash in enumerate(hashes):
+        record = known[page_hash] if page_hash in known else next(extracted)
+        pages.append(dict(record, page_number=i + 1, hash=page_hash))
+    _rebase_doctops(pages)
+
+    _write_pickle(state_path, {'hashes': hashes, 'pages': pages})
+    _write_cache(key, pages)
+    return pages, changed
+
+
+def page_texts(path, **kwargs):
+    """Return the extract_text() output of every page of `path`, in order."""
+    return [page['text'] for page in load_pages(path, **kwargs)]
+
+
+def page_chars(page):
+    """Rebuild pdfplumber-style char dicts from a cached page record."""
+    chars = []
+    for row in page['chars']:
+        char = dict(zip(CHAR_FIELDS, row))
+        char['width'] = char['x1'] - char['x0']
+        char['height'] = char['bottom'] - char['top']
+        chars.append(char)
+    return chars
+
+
+def clear_cache():
+    """Delete every cached entry."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        os.unlink(os.path.join(CACHE_DIR, name))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Parse PDFs into the page cache.')
+    parser.add_argument('pdfs', nargs='+', metavar='FILE.pdf')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='worker processes for a cache miss (0 = one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-parse and do not write the cache')
+    args = parser.parse_args()
+
+    for pdf_path in args.pdfs:
+        start = time.perf_counter()
+        pages = load_pages(pdf_path, use_cache=not args.no_cache,
+                           workers=args.workers or None)
+        elapsed = time.perf_counter() - start
+        print(f"📄 {pdf_path}: {len(pages)} pages in {elapsed:.2f}s")
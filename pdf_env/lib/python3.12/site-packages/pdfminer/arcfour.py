@@ -2,34 +2,63 @@
 See https://en.wikipedia.org/wiki/RC4
 This code is in the public domain.
 
+Where the installed cryptography package can do ARC4 with the given key, it
+is used instead.
+
 """
 
-from typing import Sequence
+from typing import Any, List, Optional, Sequence, cast
+
+from cryptography.exceptions import UnsupportedAlgorithm
+from cryptography.hazmat.primitives.ciphers import Cipher
+
+try:
+    from cryptography.hazmat.decrepit.ciphers.algorithms import ARC4
+except ImportError:  # cryptography < 43
+    from cryptography.hazmat.primitives.ciphers.algorithms import (  # type: ignore
+        ARC4,
+    )
+
+
+def xor_bytes(data: bytes, keystream: bytes) -> bytes:
+    """XORs data with the start of keystream, which must not be shorter."""
+    n = len(data)
+    x = int.from_bytes(data, "little") ^ int.from_bytes(keystream[:n], "little")
+    return x.to_bytes(n, "little")
 
 
 class Arcfour:
     def __init__(self, key: Sequence[int]) -> None:
-        # because Py3 range is not indexable
-        s = [i for i in range(256)]
-        j = 0
-        klen = len(key)
-        for i in range(256):
-            j = (j + s[i] + key[i % klen]) % 256
-            (s[i], s[j]) = (s[j], s[i])
-        self.s = s
+        self.cipher: Optional[Any] = None
+        try:
+            # Only takes keys of 40, 56, 64, 80, 128, 160, 192 or 256 bits
+            self.cipher = Cipher(ARC4(bytes(key)), mode=None).encryptor()
+        except (ValueError, UnsupportedAlgorithm):
+            pass
+        self.s: List[int] = []
+        if self.cipher is None:
+            # because Py3 range is not indexable
+            s = [i for i in range(256)]
+            j = 0
+            klen = len(key)
+            for i in range(256):
+                j = (j + s[i] + key[i % klen]) % 256
+                (s[i], s[j]) = (s[j], s[i])
+            self.s = s
         (self.i, self.j) = (0, 0)
 
     def process(self, data: bytes) -> bytes:
+        if self.cipher is not None:
+            return cast(bytes, self.cipher.update(data))
         (i, j) = (self.i, self.j)
         s = self.s
-        r = b""
-        for c in iter(data):
-            i = (i + 1) % 256
-            j = (j + s[i]) % 256
+        keystream = bytearray(len(data))
+        for n in range(len(data)):
+            i = (i + 1) & 255
+            j = (j + s[i]) & 255
             (s[i], s[j]) = (s[j], s[i])
-            k = s[(s[i] + s[j]) % 256]
-            r += bytes((c ^ k,))
+            keystream[n] = s[(s[i] + s[j]) & 255]
         (self.i, self.j) = (i, j)
-        return r
+        return xor_bytes(data, keystream)
 
     encrypt = decrypt = process
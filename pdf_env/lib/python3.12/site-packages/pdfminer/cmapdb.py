@@ -11,11 +11,14 @@ More information is available on:
 
 import gzip
 import logging
+import mmap
 import os
 import os.path
 import pickle as pickle
 import struct
 import sys
+from array import array
+from hashlib import sha256
 from typing import (
     Any,
     BinaryIO,
@@ -222,23 +225,190 @@ class PyUnicodeMap(UnicodeMap):
             self.cid2unichr = module.CID2UNICHR_H
 
 
+# Compiled CMaps, see compile_cmap() and compile_unicode_map(). Tables are
+# int32 in native byte order, which the last byte of the magic records.
+COMPILED_CMAP_MAGIC = b"pdfmcm1" + sys.byteorder[:1].encode()
+COMPILED_UNICODE_MAP_MAGIC = b"pdfmum1" + sys.byteorder[:1].encode()
+COMPILED_CMAP_HEADER = struct.Struct("=8sii")
+COMPILED_UNICODE_MAP_HEADER = struct.Struct("=8siii4x")
+
+
+def compile_cmap(code2cid: Dict[int, object], vertical: bool) -> bytes:
+    """Lay out a code -> cid trie as a table of 256-entry nodes.
+
+    Node n takes entries n*256 to n*256+255, one per byte value, and the root
+    is node 0. An entry is cid+1 for a complete code, -(n*256) to continue
+    with node n, and 0 if no code continues with that byte.
+    """
+    nodes = [code2cid]
+    table = array("i")
+    i = 0
+    while i < len(nodes):
+        row = [0] * 256
+        for byte, value in nodes[i].items():
+            if isinstance(value, dict):
+                row[byte] = -256 * len(nodes)
+                nodes.append(value)
+            else:
+                row[byte] = cast(int, value) + 1
+        table.extend(row)
+        i += 1
+    header = COMPILED_CMAP_HEADER.pack(COMPILED_CMAP_MAGIC, vertical, len(nodes))
+    return header + table.tobytes()
+
+
+def compile_unicode_map(
+    cid2unichr_h: Dict[int, str],
+    cid2unichr_v: Dict[int, str],
+) -> bytes:
+    """Lay out the horizontal and vertical cid -> unicode maps of a font.
+
+    Each map is a table of (offset, length) pairs indexed by cid, with length
+    -1 for cids that aren't mapped, into a shared pool of UTF-8 strings.
+    """
+    pool = bytearray()
+    offsets: Dict[str, int] = {}
+    tables = []
+    for cid2unichr in (cid2unichr_h, cid2unichr_v):
+        table = array("i", [0, -1]) * (max(cid2unichr, default=-1) + 1)
+        for cid, unichr in cid2unichr.items():
+            data = unichr.encode("utf-8", "surrogatepass")
+            if unichr not in offsets:
+                offsets[unichr] = len(pool)
+                pool += data
+            table[2 * cid] = offsets[unichr]
+            table[2 * cid + 1] = len(data)
+        tables.append(table)
+    (table_h, table_v) = tables
+    header = COMPILED_UNICODE_MAP_HEADER.pack(
+        COMPILED_UNICODE_MAP_MAGIC,
+        len(table_h) // 2,
+        len(table_v) // 2,
+        len(pool),
+    )
+    return header + table_h.tobytes() + table_v.tobytes() + bytes(pool)
+
+
+class MappedCMap(CMap):
+    """CMap read straight out of the buffer of a compiled CMap.
+
+    code2cid is only built if it is asked for, e.g. by use_cmap().
+    """
+
+    def __init__(self, name: str, buf: Union[bytes, mmap.mmap]) -> None:
+        CMapBase.__init__(self, CMapName=name)
+        (_, vertical, count) = COMPILED_CMAP_HEADER.unpack_from(buf)
+        if vertical:
+            self.attrs["WMode"] = 1
+        start = COMPILED_CMAP_HEADER.size
+        self._table = memoryview(buf)[start : start + count * 1024].cast("i")
+        self._code2cid: Optional[Dict[int, object]] = None
+
+    @property  # type: ignore[override]
+    def code2cid(self) -> Dict[int, object]:
+        if self._code2cid is None:
+
+            def build(node: int) -> Dict[int, object]:
+                d: Dict[int, object] = {}
+                for byte in range(256):
+                    value = self._table[node + byte]
+                    if value > 0:
+                        d[byte] = value - 1
+                    elif value < 0:
+                        d[byte] = build(-value)
+                return d
+
+            self._code2cid = build(0)
+        return self._code2cid
+
+    def decode(self, code: bytes) -> Iterator[int]:
+        log.debug("decode: %r, %r", self, code)
+        table = self._table
+        node = 0
+        for i in code:
+            value = table[node + i]
+            if value > 0:
+                yield value - 1
+                node = 0
+            else:
+                node = -value
+
+
+class MappedUnicodeMap(UnicodeMap):
+    """UnicodeMap read straight out of the buffer of a compiled map."""
+
+    def __init__(
+        self,
+        name: str,
+        buf: Union[bytes, mmap.mmap],
+        vertical: bool,
+    ) -> None:
+        CMapBase.__init__(self, CMapName=name)
+        header = COMPILED_UNICODE_MAP_HEADER.unpack_from(buf)
+        (_, count_h, count_v, pool_size) = header
+        view = memoryview(buf)
+        start = COMPILED_UNICODE_MAP_HEADER.size
+        pool_start = start + (count_h + count_v) * 8
+        if vertical:
+            self.attrs["WMode"] = 1
+            (start, count) = (start + count_h * 8, count_v)
+        else:
+            count = count_h
+        self._table = view[start : start + count * 8].cast("i")
+        self._pool = view[pool_start : pool_start + pool_size]
+        self._cid2unichr: Optional[Dict[int, str]] = None
+        # Strings decoded so far
+        self._unichrs: Dict[int, str] = {}
+
+    @property  # type: ignore[override]
+    def cid2unichr(self) -> Dict[int, str]:
+        if self._cid2unichr is None:
+            self._cid2unichr = {}
+            for cid in range(len(self._table) // 2):
+                try:
+                    self._cid2unichr[cid] = self.get_unichr(cid)
+                except KeyError:
+                    pass
+        return self._cid2unichr
+
+    def get_unichr(self, cid: int) -> str:
+        log.debug("get_unichr: %r, %r", self, cid)
+        try:
+            return self._unichrs[cid]
+        except KeyError:
+            pass
+        i = 2 * cid
+        if i < 0 or len(self._table) <= i or self._table[i + 1] < 0:
+            raise KeyError(cid)
+        offset = self._table[i]
+        data = self._pool[offset : offset + self._table[i + 1]]
+        unichr = self._unichrs[cid] = str(data, "utf-8", "surrogatepass")
+        return unichr
+
+
 class CMapDB:
-    _cmap_cache: Dict[str, PyCMap] = {}
-    _umap_cache: Dict[str, List[PyUnicodeMap]] = {}
+    _cmap_cache: Dict[str, CMap] = {}
+    _umap_cache: Dict[str, List[UnicodeMap]] = {}
+
+    # Where compiled CMaps are kept, or None to always unpickle them. Off
+    # unless the CMAP_CACHE environment variable names a directory.
+    cache_dir: Optional[str] = os.environ.get("CMAP_CACHE") or None
 
     class CMapNotFound(CMapError):
         pass
 
-    @classmethod
-    def _load_data(cls, name: str) -> Any:
-        name = name.replace("\0", "")
-        filename = "%s.pickle.gz" % name
-        log.debug("loading: %r", name)
-        cmap_paths = (
+    @staticmethod
+    def _cmap_paths() -> Tuple[str, str]:
+        return (
             os.environ.get("CMAP_PATH", "/usr/share/pdfminer/"),
             os.path.join(os.path.dirname(__file__), "cmap"),
         )
-        for directory in cmap_paths:
+
+    @classmethod
+    def _data_path(cls, name: str) -> str:
+        name = name.replace("\0", "")
+        filename = "%s.pickle.gz" % name
+        for directory in cls._cmap_paths():
             path = os.path.join(directory, filename)
             # Resolve paths to prevent directory traversal
             resolved_path = os.path.realpath(path)
@@ -247,13 +417,73 @@ class CMapDB:
             if not resolved_path.startswith(resolved_directory + os.sep):
                 continue
             if os.path.exists(resolved_path):
-                gzfile = gzip.open(resolved_path)
-                try:
-                    return type(str(name), (), pickle.loads(gzfile.read()))
-                finally:
-                    gzfile.close()
+                return resolved_path
         raise CMapDB.CMapNotFound(name)
 
+    @classmethod
+    def _load_data(cls, name: str) -> Any:
+        path = cls._data_path(name)
+        name = name.replace("\0", "")
+        log.debug("loading: %r", name)
+        gzfile = gzip.open(path)
+        try:
+            return type(str(name), (), pickle.loads(gzfile.read()))
+        finally:
+            gzfile.close()
+
+    @classmethod
+    def _compile(cls, name: str) -> bytes:
+        data = cls._load_data(name)
+        if hasattr(data, "CODE2CID"):
+            return compile_cmap(data.CODE2CID, data.IS_VERTICAL)
+        return compile_unicode_map(data.CID2UNICHR_H, data.CID2UNICHR_V)
+
+    @staticmethod
+    def _map_file(path: str, magic: bytes) -> Optional[mmap.mmap]:
+        with open(path, "rb") as fp:
+            buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        if buf[: len(magic)] == magic:
+            return buf
+        # Written by another version or with another byte order
+        buf.close()
+        return None
+
+    @classmethod
+    def _load_compiled(cls, name: str, magic: bytes) -> Optional[mmap.mmap]:
+        """Map the compiled form of CMap `name`, compiling it if necessary.
+
+        The compiled file is named after the size and a hash of the pickled
+        CMap, so a changed pickle is compiled again.
+
+        Returns None if there is no cache directory or it can't be written.
+        """
+        source = cls._data_path(name)
+        if not cls.cache_dir:
+            return None
+        try:
+            with open(source, "rb") as fp:
+                data = fp.read()
+            filename = "%s-%d-%s.cmap" % (
+                os.path.basename(source)[: -len(".pickle.gz")],
+                len(data),
+                sha256(data).hexdigest()[:16],
+            )
+            path = os.path.join(cls.cache_dir, filename)
+            if os.path.exists(path):
+                buf = cls._map_file(path, magic)
+                if buf is not None:
+                    return buf
+            log.debug("compiling: %r", name)
+            os.makedirs(cls.cache_dir, exist_ok=True)
+            tmp_path = "%s.%d.tmp" % (path, os.getpid())
+            with open(tmp_path, "wb") as out:
+                out.write(cls._compile(name))
+            os.replace(tmp_path, path)
+            return cls._map_file(path, magic)
+        except (OSError, ValueError) as e:
+            log.debug("not using a compiled CMap for %r: %s", name, e)
+            return None
+
     @classmethod
     def get_cmap(cls, name: str) -> CMapBase:
         if name == "Identity-H":
@@ -268,8 +498,13 @@ class CMapDB:
             return cls._cmap_cache[name]
         except KeyError:
             pass
-        data = cls._load_data(name)
-        cls._cmap_cache[name] = cmap = PyCMap(name, data)
+        cmap: CMap
+        buf = cls._load_compiled(name, COMPILED_CMAP_MAGIC)
+        if buf is None:
+            cmap = PyCMap(name, cls._load_data(name))
+        else:
+            cmap = MappedCMap(name, buf)
+        cls._cmap_cache[name] = cmap
         return cmap
 
     @classmethod
@@ -278,9 +513,44 @@ class CMapDB:
             return cls._umap_cache[name][vertical]
         except KeyError:
             pass
-        data = cls._load_data("to-unicode-%s" % name)
-        cls._umap_cache[name] = [PyUnicodeMap(name, data, v) for v in (False, True)]
-        return cls._umap_cache[name][vertical]
+        buf = cls._load_compiled("to-unicode-%s" % name, COMPILED_UNICODE_MAP_MAGIC)
+        umaps: List[UnicodeMap]
+        if buf is None:
+            data = cls._load_data("to-unicode-%s" % name)
+            umaps = [PyUnicodeMap(name, data, v) for v in (False, True)]
+        else:
+            umaps = [MappedUnicodeMap(name, buf, v) for v in (False, True)]
+        cls._umap_cache[name] = umaps
+        return umaps[vertical]
+
+    @classmethod
+    def precompile(cls, names: Optional[Iterable[str]] = None) -> List[str]:
+        """Compile CMaps ahead of time, by default every one that is found.
+
+        Returns the names of the CMaps that are available compiled.
+        """
+        if names is None:
+            names = sorted(
+                {
+                    filename[: -len(".pickle.gz")]
+                    for directory in cls._cmap_paths()
+                    if os.path.isdir(directory)
+                    for filename in os.listdir(directory)
+                    if filename.endswith(".pickle.gz")
+                },
+            )
+        compiled = []
+        for name in names:
+            magic = (
+                COMPILED_UNICODE_MAP_MAGIC
+                if name.startswith("to-unicode-")
+                else COMPILED_CMAP_MAGIC
+            )
+            buf = cls._load_compiled(name, magic)
+            if buf is not None:
+                buf.close()
+                compiled.append(name)
+        return compiled
 
 
 class CMapParser(PSStackParser[PSKeyword]):
@@ -36,12 +36,14 @@ from pdfminer.layout import (
     LTTextBoxVertical,
     LTTextGroup,
     LTTextLine,
+    MatrixScale,
     TextGroupElement,
 )
+from pdfminer.layoutcache import LayoutCache
 from pdfminer.pdfcolor import PDFColorSpace
 from pdfminer.pdfdevice import PDFTextDevice
 from pdfminer.pdfexceptions import PDFValueError
-from pdfminer.pdffont import PDFFont, PDFUnicodeNotDefined
+from pdfminer.pdffont import Glyph, PDFFont
 from pdfminer.pdfinterp import PDFGraphicState, PDFResourceManager
 from pdfminer.pdfpage import PDFPage
 from pdfminer.pdftypes import PDFStream
@@ -76,6 +78,10 @@ class PDFLayoutAnalyzer(PDFTextDevice):
         self.pageno = pageno
         self.laparams = laparams
         self._stack: List[LTLayoutContainer] = []
+        # Floats and matrix scales that the characters of the current page
+        # share; see LTChar
+        self._numbers: Dict[float, float] = {}
+        self._scales: Dict[MatrixScale, MatrixScale] = {}
 
     def begin_page(self, page: PDFPage, ctm: Matrix) -> None:
         (x0, y0, x1, y1) = apply_matrix_rect(ctm, page.mediabox)
@@ -87,6 +93,8 @@ class PDFLayoutAnalyzer(PDFTextDevice):
         assert isinstance(self.cur_item, LTPage), str(type(self.cur_item))
         if self.laparams is not None:
             self.cur_item.analyze(self.laparams)
+        self._numbers = {}
+        self._scales = {}
         self.pageno += 1
         self.receive_layout(self.cur_item)
 
@@ -242,14 +250,14 @@ class PDFLayoutAnalyzer(PDFTextDevice):
         cid: int,
         ncs: PDFColorSpace,
         graphicstate: PDFGraphicState,
+        glyph: Optional[Glyph] = None,
     ) -> float:
-        try:
-            text = font.to_unichr(cid)
-            assert isinstance(text, str), str(type(text))
-        except PDFUnicodeNotDefined:
+        if glyph is None:
+            glyph = font.get_glyph(cid)
+        (text, textwidth, textdisp) = glyph
+        if text is None:
             text = self.handle_undefined_char(font, cid)
-        textwidth = font.char_width(cid)
-        textdisp = font.char_disp(cid)
+        assert isinstance(text, str), str(type(text))
         item = LTChar(
             matrix,
             font,
@@ -261,6 +269,8 @@ class PDFLayoutAnalyzer(PDFTextDevice):
             textdisp,
             ncs,
             graphicstate,
+            self._numbers,
+            self._scales,
         )
         self.cur_item.add(item)
         return item.adv
@@ -279,9 +289,36 @@ class PDFPageAggregator(PDFLayoutAnalyzer):
         rsrcmgr: PDFResourceManager,
         pageno: int = 1,
         laparams: Optional[LAParams] = None,
+        cache: Optional[LayoutCache] = None,
     ) -> None:
+        """With a `cache`, the layout of every page is stored in it, and pages
+        whose layout is found there are not interpreted again.
+        """
         PDFLayoutAnalyzer.__init__(self, rsrcmgr, pageno=pageno, laparams=laparams)
         self.result: Optional[LTPage] = None
+        self.cache = cache
+
+    def cache_key(self, page: PDFPage) -> str:
+        assert self.cache is not None
+        cls = type(self)
+        variant = f"{cls.__module__}.{cls.__qualname__}"
+        return self.cache.key(page, self.laparams, variant)
+
+    def restore_page(self, page: PDFPage) -> bool:
+        if self.cache is None:
+            return False
+        ltpage = self.cache.get(self.cache_key(page), page.doc)
+        if ltpage is None:
+            return False
+        ltpage.pageid = self.pageno
+        self.pageno += 1
+        self.receive_layout(ltpage)
+        return True
+
+    def end_page(self, page: PDFPage) -> None:
+        PDFLayoutAnalyzer.end_page(self, page)
+        if self.cache is not None:
+            self.cache.put(self.cache_key(page), self.get_result())
 
     def receive_layout(self, ltpage: LTPage) -> None:
         self.result = ltpage
@@ -1,9 +1,23 @@
 """Functions that can be used for the most common use-cases for pdfminer.six"""
 
 import logging
+import os
 import sys
-from io import StringIO
-from typing import Any, BinaryIO, Container, Iterator, Optional, cast
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, StringIO
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
 from pdfminer.converter import (
     HOCRConverter,
@@ -14,12 +28,203 @@ from pdfminer.converter import (
 )
 from pdfminer.image import ImageWriter
 from pdfminer.layout import LAParams, LTPage
+from pdfminer.layoutcache import dump_layout, load_layout
 from pdfminer.pdfdevice import PDFDevice, TagExtractor
-from pdfminer.pdfexceptions import PDFValueError
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfexceptions import PDFObjectNotFound, PDFValueError
 from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
-from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfpage import PDFPage, PDFPageIndex, PDFPageIndexError
+from pdfminer.pdfparser import PDFParser
 from pdfminer.utils import AnyIO, FileOrName, open_filename
 
+log = logging.getLogger(__name__)
+
+# State of a worker process of _parallel_pages(): its document, the index
+# of the document's page tree and the interpreter and device to run the
+# pages through.
+_worker: Dict[str, Any] = {}
+
+
+def _page_numbers(doc: PDFDocument) -> Iterator[int]:
+    """0, 1, ... up to the number of pages of doc.
+
+    The page tree is walked through a PDFPageIndex as far as the numbers are
+    asked for, without creating the pages. Like PDFPage.enumerate_pages(),
+    falls back to create_pages() if the tree can't be indexed.
+    """
+    pageno = 0
+    try:
+        index = PDFPageIndex(doc)
+        while True:
+            index.lookup(pageno)
+            yield pageno
+            pageno += 1
+    except IndexError:
+        return
+    except (PDFPageIndexError, PDFObjectNotFound) as e:
+        log.debug("Page index not usable, walking the page tree: %s", e)
+    for n, _ in enumerate(PDFPage.create_pages(doc)):
+        if pageno <= n:
+            yield n
+
+
+def _select_pages(
+    fp: BinaryIO,
+    page_numbers: Optional[Container[int]],
+    maxpages: int,
+    password: str,
+    caching: bool,
+) -> List[int]:
+    """Indexes of the pages PDFPage.get_pages() yields for the same options.
+
+    Only the pages of page_numbers are looked up, not every page.
+    """
+    parser = PDFParser(fp)
+    try:
+        doc = PDFDocument(parser, password=password, caching=caching)
+        candidates: Iterable[int]
+        if page_numbers and isinstance(page_numbers, Iterable):
+            candidates = (n for (n, _) in PDFPage.enumerate_pages(doc, page_numbers))
+        else:
+            candidates = _page_numbers(doc)
+        pagenos = []
+        for pageno in candidates:
+            if page_numbers and pageno not in page_numbers:
+                continue
+            pagenos.append(pageno)
+            if maxpages and maxpages <= pageno + 1:
+                break
+        return pagenos
+    finally:
+        parser.close()
+
+
+def _init_worker(
+    source: Union[str, bytes],
+    password: str,
+    caching: bool,
+    laparams: LAParams,
+    codec: Optional[str],
+) -> None:
+    fp: BinaryIO
+    if isinstance(source, bytes):
+        fp = BytesIO(source)
+    else:
+        fp = open(source, "rb")
+    resource_manager = PDFResourceManager(caching=caching)
+    # The parser, and the memory mapping of the file it may hold, stay open
+    # for the life of the worker.
+    doc = PDFDocument(PDFParser(fp), password=password, caching=caching)
+    _worker["doc"] = doc
+    try:
+        _worker["index"] = PDFPageIndex(doc)
+    except (PDFPageIndexError, PDFObjectNotFound):
+        _worker["index"] = None
+    if codec is None:
+        device: PDFDevice = PDFPageAggregator(resource_manager, laparams=laparams)
+    else:
+        _worker["output"] = StringIO()
+        device = TextConverter(
+            resource_manager,
+            _worker["output"],
+            codec=codec,
+            laparams=laparams,
+        )
+    _worker["device"] = device
+    _worker["interpreter"] = PDFPageInterpreter(resource_manager, device)
+
+
+def _worker_page(pageno: int) -> PDFPage:
+    """The page `pageno` of the worker's document.
+
+    Only the pages a worker is given are created. If the page tree can't be
+    indexed, all pages are created once, as create_pages() finds them.
+    """
+    doc = _worker["doc"]
+    index = _worker["index"]
+    if index is not None:
+        try:
+            (objid, attrs) = index.lookup(pageno)
+            # Interpreting a page doesn't need its label
+            return PDFPage(doc, objid, attrs, None)
+        except (PDFPageIndexError, PDFObjectNotFound) as e:
+            log.debug("Page index not usable, walking the page tree: %s", e)
+            _worker["index"] = None
+    if "pages" not in _worker:
+        _worker["pages"] = list(PDFPage.create_pages(doc))
+    return cast(PDFPage, _worker["pages"][pageno])
+
+
+def _worker_layout(pageno: int) -> bytes:
+    # An LTPage can hold objects of the worker's document, like the streams
+    # of images, which can't be pickled; dump_layout() stores them by
+    # object number instead.
+    _worker["interpreter"].process_page(_worker_page(pageno))
+    return dump_layout(cast(LTPage, _worker["device"].get_result()))
+
+
+def _worker_text(pageno: int) -> str:
+    output = _worker["output"]
+    output.seek(0)
+    output.truncate()
+    _worker["interpreter"].process_page(_worker_page(pageno))
+    return cast(str, output.getvalue())
+
+
+def _parallel_pages(
+    pdf_file: FileOrName,
+    fp: BinaryIO,
+    page_numbers: Optional[Container[int]],
+    maxpages: int,
+    password: str,
+    caching: bool,
+    laparams: LAParams,
+    workers: int,
+    codec: Optional[str] = None,
+) -> Iterator[Any]:
+    """Process the selected pages in a pool of `workers` processes.
+
+    Every worker opens the document by itself, by path if `pdf_file` is one
+    and otherwise from a copy of the bytes of `fp`. With a `codec`, yields
+    the text of every page as TextConverter writes it, otherwise its LTPage,
+    in page order either way. The LTPages are rebuilt against a document
+    opened on `fp`, which must stay open while they are used.
+
+    The workers are started with the default start method of
+    multiprocessing. Under spawn or forkserver (the default on Windows and
+    macOS) they import the main module, so scripts have to call this from
+    under an ``if __name__ == "__main__":`` guard.
+    """
+    pagenos = _select_pages(fp, page_numbers, maxpages, password, caching)
+    source: Union[str, bytes]
+    if isinstance(pdf_file, (str, os.PathLike)):
+        source = os.fspath(pdf_file)
+    else:
+        fp.seek(0)
+        source = fp.read()
+    func: Callable[[int], Any] = _worker_layout if codec is None else _worker_text
+    executor = ProcessPoolExecutor(
+        max_workers=min(workers, len(pagenos) or 1),
+        initializer=_init_worker,
+        initargs=(source, password, caching, laparams, codec),
+    )
+    try:
+        if codec is not None:
+            yield from executor.map(func, pagenos)
+            return
+        parser = PDFParser(fp)
+        try:
+            doc = PDFDocument(parser, password=password, caching=caching)
+            for pageid, data in enumerate(executor.map(func, pagenos), 1):
+                ltpage = load_layout(data, doc)
+                # Numbered like PDFPageAggregator numbers the pages it makes
+                ltpage.pageid = pageid
+                yield ltpage
+        finally:
+            parser.close()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
 
 def extract_text_to_fp(
     inf: BinaryIO,
@@ -151,6 +356,7 @@ def extract_text(
     caching: bool = True,
     codec: str = "utf-8",
     laparams: Optional[LAParams] = None,
+    workers: int = 1,
 ) -> str:
     """Parse and return the text contained in a PDF file.
 
@@ -163,6 +369,10 @@ def extract_text(
     :param codec: Text decoding codec
     :param laparams: An LAParams object from pdfminer.layout. If None, uses
         some default settings that often work well.
+    :param workers: Number of processes to extract the pages in. Each opens
+        the document by itself. Call from under an
+        ``if __name__ == "__main__":`` guard where multiprocessing spawns
+        processes (Windows, macOS).
     :return: a string containing all of the text extracted.
     """
     if laparams is None:
@@ -170,6 +380,20 @@ def extract_text(
 
     with open_filename(pdf_file, "rb") as fp, StringIO() as output_string:
         fp = cast(BinaryIO, fp)  # we opened in binary mode
+        if workers > 1:
+            return "".join(
+                _parallel_pages(
+                    pdf_file,
+                    fp,
+                    page_numbers,
+                    maxpages,
+                    password,
+                    caching,
+                    laparams,
+                    workers,
+                    codec=codec,
+                ),
+            )
         rsrcmgr = PDFResourceManager(caching=caching)
         device = TextConverter(rsrcmgr, output_string, codec=codec, laparams=laparams)
         interpreter = PDFPageInterpreter(rsrcmgr, device)
@@ -193,6 +417,7 @@ def extract_pages(
     maxpages: int = 0,
     caching: bool = True,
     laparams: Optional[LAParams] = None,
+    workers: int = 1,
 ) -> Iterator[LTPage]:
     """Extract and yield LTPage objects
 
@@ -204,6 +429,10 @@ def extract_pages(
     :param caching: If resources should be cached
     :param laparams: An LAParams object from pdfminer.layout. If None, uses
         some default settings that often work well.
+    :param workers: Number of processes to analyze the pages in. Each opens
+        the document by itself; the pages are still yielded in order. Call
+        from under an ``if __name__ == "__main__":`` guard where
+        multiprocessing spawns processes (Windows, macOS).
     :return: LTPage objects
     """
     if laparams is None:
@@ -211,6 +440,18 @@ def extract_pages(
 
     with open_filename(pdf_file, "rb") as fp:
         fp = cast(BinaryIO, fp)  # we opened in binary mode
+        if workers > 1:
+            yield from _parallel_pages(
+                pdf_file,
+                fp,
+                page_numbers,
+                maxpages,
+                password,
+                caching,
+                laparams,
+                workers,
+            )
+            return
         resource_manager = PDFResourceManager(caching=caching)
         device = PDFPageAggregator(resource_manager, laparams=laparams)
         interpreter = PDFPageInterpreter(resource_manager, device)
@@ -1,6 +1,7 @@
 import heapq
 import logging
 from typing import (
+    Any,
     Dict,
     Generic,
     Iterable,
@@ -123,13 +124,38 @@ class LAParams:
 class LTItem:
     """Interface for things that can be analyzed"""
 
+    # Subclasses keep their own attributes in slots. The __dict__ is only
+    # created once other code sets an attribute of its own.
+    __slots__ = ("__dict__",)
+
     def analyze(self, laparams: LAParams) -> None:
         """Perform the layout analysis."""
 
 
+def item_state(
+    obj: object,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """The __dict__ of `obj`, or None if it has none, and its slot values.
+
+    Reading obj.__dict__ would create the __dict__ of an item with slots,
+    object.__getstate__() doesn't. Before Python 3.11 there is no such
+    method, and the slot values are None; they must be read with getattr()
+    then.
+    """
+    getstate = getattr(obj, "__getstate__", None)
+    if getstate is None:  # Python < 3.11
+        return (getattr(obj, "__dict__", None), None)
+    state = getstate()
+    if isinstance(state, tuple):
+        return state
+    return (state, {})
+
+
 class LTText:
     """Interface for things that have text"""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.get_text()!r}>"
 
@@ -141,6 +167,10 @@ class LTText:
 class LTComponent(LTItem):
     """Object with a bounding box"""
 
+    # bbox is a slot of the subclasses that keep it, such as LTContainer;
+    # LTChar makes it from the other coordinates.
+    __slots__ = ("x0", "y0", "x1", "y1", "width", "height")
+
     def __init__(self, bbox: Rect) -> None:
         LTItem.__init__(self)
         self.set_bbox(bbox)
@@ -342,6 +372,8 @@ class LTAnno(LTItem, LTText):
     according to the relationship between two characters (e.g. a space).
     """
 
+    __slots__ = ("_text",)
+
     def __init__(self, text: str) -> None:
         self._text = text
 
@@ -349,9 +381,41 @@ class LTAnno(LTItem, LTText):
         return self._text
 
 
+# The first four numbers of a matrix, its scaling and rotation
+MatrixScale = Tuple[float, float, float, float]
+
+
+def _share(numbers: Dict[float, float], value: float) -> float:
+    """The float in numbers that equals value, added if there is none.
+
+    Zeros are left alone, since 0.0 and -0.0 are equal, and so are ints,
+    since 1 and 1.0 are.
+    """
+    if value and type(value) is float:
+        return numbers.setdefault(value, value)
+    return value
+
+
 class LTChar(LTComponent, LTText):
     """Actual letter in the text as a Unicode string."""
 
+    # mcid and tag are left unset here; devices that follow marked content
+    # set them.
+    __slots__ = (
+        "_text",
+        "_scale",
+        "_e",
+        "_f",
+        "fontname",
+        "ncs",
+        "graphicstate",
+        "adv",
+        "upright",
+        "size",
+        "mcid",
+        "tag",
+    )
+
     def __init__(
         self,
         matrix: Matrix,
@@ -364,7 +428,14 @@ class LTChar(LTComponent, LTText):
         textdisp: Union[float, Tuple[Optional[float], float]],
         ncs: PDFColorSpace,
         graphicstate: PDFGraphicState,
+        numbers: Optional[Dict[float, float]] = None,
+        scales: Optional[Dict[MatrixScale, MatrixScale]] = None,
     ) -> None:
+        """`numbers` maps floats of earlier characters to themselves, and
+        `scales` the scales (a, b, c, d) of their matrices. Those equal to the
+        ones of this character are used in their place, and the others are
+        added.
+        """
         LTText.__init__(self)
         self._text = text
         self.matrix = matrix
@@ -387,14 +458,42 @@ class LTChar(LTComponent, LTText):
             # horizontal
             descent = font.get_descent() * fontsize
             bbox = (0, descent + rise, self.adv, descent + rise + fontsize)
-        (a, b, c, d, e, f) = self.matrix
+        (a, b, c, d, e, f) = matrix
         self.upright = a * d * scaling > 0 and b * c <= 0
-        (x0, y0, x1, y1) = apply_matrix_rect(self.matrix, bbox)
+        (x0, y0, x1, y1) = apply_matrix_rect(matrix, bbox)
         if x1 < x0:
             (x0, x1) = (x1, x0)
         if y1 < y0:
             (y0, y1) = (y1, y0)
+        if numbers is not None:
+            # Characters of a line have equal y0, y1 and matrix[5], and
+            # characters of a font equal adv, width and height. These are
+            # then one float object each instead of one per character.
+            self._f = _share(numbers, f)
+            self.adv = _share(numbers, self.adv)
+            y0 = _share(numbers, y0)
+            y1 = _share(numbers, y1)
+            # Upright characters start at the origin of their matrix
+            if x0 and x0 == e and type(x0) is type(e):
+                x0 = e
+        if scales is not None:
+            # The scale is shared only if it is made of the same floats, so
+            # that -0.0 doesn't turn into 0.0 from an equal scale.
+            scale = scales.get(self._scale)
+            if (
+                scale
+                and scale[0] is a
+                and scale[1] is b
+                and scale[2] is c
+                and scale[3] is d
+            ):
+                self._scale = scale
+            else:
+                scales[self._scale] = self._scale
         LTComponent.__init__(self, (x0, y0, x1, y1))
+        if numbers is not None:
+            self.width = _share(numbers, self.width)
+            self.height = _share(numbers, self.height)
         if font.is_vertical():
             self.size = self.width
         else:
@@ -403,6 +502,34 @@ class LTChar(LTComponent, LTText):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {bbox2str(self.bbox)} matrix={matrix2str(self.matrix)} font={self.fontname!r} adv={self.adv} text={self.get_text()!r}>"
 
+    # The matrix and bbox are made from their parts when needed, rather than
+    # kept with every character.
+    @property
+    def matrix(self) -> Matrix:
+        return cast(Matrix, self._scale + (self._e, self._f))
+
+    @matrix.setter
+    def matrix(self, matrix: Matrix) -> None:
+        self._scale = matrix[:4]
+        (self._e, self._f) = matrix[4:]
+
+    @property  # type: ignore[override]
+    def bbox(self) -> Rect:
+        return (self.x0, self.y0, self.x1, self.y1)
+
+    @bbox.setter
+    def bbox(self, bbox: Rect) -> None:
+        self.set_bbox(bbox)
+
+    def set_bbox(self, bbox: Rect) -> None:
+        (x0, y0, x1, y1) = bbox
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+        self.width = x1 - x0
+        self.height = y1 - y0
+
     def get_text(self) -> str:
         return self._text
 
@@ -413,6 +540,8 @@ LTItemT = TypeVar("LTItemT", bound=LTItem)
 class LTContainer(LTComponent, Generic[LTItemT]):
     """Object that can be extended and analyzed"""
 
+    __slots__ = ("bbox", "_objs")
+
     def __init__(self, bbox: Rect) -> None:
         LTComponent.__init__(self, bbox)
         self._objs: List[LTItemT] = []
@@ -436,6 +565,8 @@ class LTContainer(LTComponent, Generic[LTItemT]):
 
 
 class LTExpandableContainer(LTContainer[LTItemT]):
+    __slots__ = ()
+
     def __init__(self) -> None:
         LTContainer.__init__(self, (+INF, +INF, -INF, -INF))
 
@@ -454,6 +585,8 @@ class LTExpandableContainer(LTContainer[LTItemT]):
 
 
 class LTTextContainer(LTExpandableContainer[LTItemT], LTText):
+    __slots__ = ()
+
     def __init__(self) -> None:
         LTText.__init__(self)
         LTExpandableContainer.__init__(self)
@@ -474,6 +607,8 @@ class LTTextLine(LTTextContainer[TextLineElement]):
     the text's writing mode.
     """
 
+    __slots__ = ("word_margin",)
+
     def __init__(self, word_margin: float) -> None:
         super().__init__()
         self.word_margin = word_margin
@@ -498,6 +633,8 @@ class LTTextLine(LTTextContainer[TextLineElement]):
 
 
 class LTTextLineHorizontal(LTTextLine):
+    __slots__ = ("_x1",)
+
     def __init__(self, word_margin: float) -> None:
         LTTextLine.__init__(self, word_margin)
         self._x1: float = +INF
@@ -561,6 +698,8 @@ class LTTextLineHorizontal(LTTextLine):
 
 
 class LTTextLineVertical(LTTextLine):
+    __slots__ = ("_y0",)
+
     def __init__(self, word_margin: float) -> None:
         LTTextLine.__init__(self, word_margin)
         self._y0: float = -INF
@@ -822,18 +961,31 @@ class LTLayoutContainer(LTContainer[LTComponent]):
         grouped, the resulting group is considered as a new object, and its
         distances to other objects & groups are added to the process queue.
 
-        For performance reason, pair-wise distances and object pair info are
-        maintained in a heap of (idx, dist, id(obj1), id(obj2), obj1, obj2)
-        tuples. It ensures quick access to the smallest element. Note that
-        since comparison operators, e.g., __lt__, are disabled for
-        LTComponent, id(obj) has to appear before obj in element tuples.
+        Pairs are only materialized when they can be the next closest one.
+        Every object is placed on a grid and gets a generator, neighbors(),
+        that yields its pairs with the objects that existed before it in
+        order of distance, searching the grid outwards from the object. The
+        heap holds one (dist, id(obj1), id(obj2), obj1, obj2, owner,
+        neighbors) tuple per live object, i.e. the next pair of every
+        generator, so popping it gives the same order as a heap of all
+        pairs. Note that since comparison operators, e.g., __lt__, are
+        disabled for LTComponent, id(obj) has to appear before obj in
+        element tuples.
+
+        Pairs with some other object between them are set aside in a second
+        heap, which is only used when no other pair is left.
 
         :param laparams: LAParams object.
         :param boxes: All textbox objects to be grouped.
         :return: a list that has only one element, the final top level group.
         """
         ElementT = Union[LTTextBox, LTTextGroup]
+        PairT = Tuple[float, int, int, ElementT, ElementT]
+        INF_DIST = float("inf")
         plane: Plane[ElementT] = Plane(self.bbox)
+        if len(boxes) < 2:
+            plane.extend(boxes)
+            return list(cast(LTTextGroup, g) for g in plane)
 
         def dist(obj1: LTComponent, obj2: LTComponent) -> float:
             """A distance function between two TextBoxes.
@@ -866,40 +1018,162 @@ class LTLayoutContainer(LTContainer[LTComponent]):
             objs = set(plane.find((x0, y0, x1, y1)))
             return objs.difference((obj1, obj2))
 
-        dists: List[Tuple[bool, float, int, int, ElementT, ElementT]] = []
-        for i in range(len(boxes)):
-            box1 = boxes[i]
-            for j in range(i + 1, len(boxes)):
-                box2 = boxes[j]
-                dists.append((False, dist(box1, box2), id(box1), id(box2), box1, box2))
-        heapq.heapify(dists)
+        # The grid covers all boxes (groups never extend beyond them) with
+        # about one cell per box. Objects are added to every cell they
+        # overlap, keyed by id.
+        grid_x0 = min(box.x0 for box in boxes)
+        grid_y0 = min(box.y0 for box in boxes)
+        size = max(
+            max(box.x1 for box in boxes) - grid_x0,
+            max(box.y1 for box in boxes) - grid_y0,
+        )
+        ncells = max(1, min(64, int(len(boxes) ** 0.5)))
+        gridsize = size / ncells or 1.0
+        grid: Dict[Point, Dict[int, ElementT]] = {}
+        serial: Dict[int, int] = {}
+        done: Set[int] = set()
+
+        def cells(obj: ElementT) -> Tuple[int, int, int, int]:
+            return (
+                int((obj.x0 - grid_x0) // gridsize),
+                int((obj.y0 - grid_y0) // gridsize),
+                int((obj.x1 - grid_x0) // gridsize),
+                int((obj.y1 - grid_y0) // gridsize),
+            )
 
+        def place(obj: ElementT) -> None:
+            serial[id(obj)] = len(serial)
+            (cx0, cy0, cx1, cy1) = cells(obj)
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    grid.setdefault((cx, cy), {})[id(obj)] = obj
+
+        def displace(obj: ElementT) -> None:
+            (cx0, cy0, cx1, cy1) = cells(obj)
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    del grid[cx, cy][id(obj)]
+
+        def neighbors(owner: ElementT) -> Iterator[PairT]:
+            """Yield the pairs of owner and older objects, closest first.
+
+            The searched cells grow from owner's own cells by a column on
+            both sides or a row above and below at a time. An object outside
+            them is more than (rx - 1) * gridsize away from owner along x, or
+            (ry - 1) * gridsize along y (one cell is left for rounding), and
+            its distance is then at least that gap times owner's height or
+            width respectively. Candidates closer than that are final, and
+            the search grows along the axis with the lower bound.
+            """
+            owner_serial = serial[id(owner)]
+            # Initial pairs are (box_i, box_j) with i < j, later ones
+            # (group, other); keep that order for dist() and the tie-breaks.
+            owner_first = owner_serial >= len(boxes)
+            (cx0, cy0, cx1, cy1) = cells(owner)
+            seen: Set[int] = set()
+            candidates: List[PairT] = []
+
+            def scan(xs: range, ys: range) -> None:
+                for cx in xs:
+                    for cy in ys:
+                        objs = grid.get((cx, cy))
+                        if not objs:
+                            continue
+                        for other_id, other in objs.items():
+                            if other_id in seen:
+                                continue
+                            seen.add(other_id)
+                            if serial[other_id] >= owner_serial:
+                                continue
+                            if owner_first:
+                                (obj1, obj2) = (owner, other)
+                            else:
+                                (obj1, obj2) = (other, owner)
+                            heapq.heappush(
+                                candidates,
+                                (dist(obj1, obj2), id(obj1), id(obj2), obj1, obj2),
+                            )
+
+            def axis_bound(r: int, lo: int, hi: int, side: float) -> float:
+                if lo - r <= 0 and ncells <= hi + r:
+                    return INF_DIST
+                if r == 0:
+                    return -INF_DIST
+                return side * (r - 1) * gridsize
+
+            scan(range(cx0, cx1 + 1), range(cy0, cy1 + 1))
+            (rx, ry) = (0, 0)
+            while True:
+                xbound = axis_bound(rx, cx0, cx1, owner.height)
+                ybound = axis_bound(ry, cy0, cy1, owner.width)
+                bound = min(xbound, ybound)
+                while candidates and candidates[0][0] < bound:
+                    yield heapq.heappop(candidates)
+                if bound == INF_DIST:
+                    return
+                ys = range(max(cy0 - ry, 0), min(cy1 + ry, ncells) + 1)
+                xs = range(max(cx0 - rx, 0), min(cx1 + rx, ncells) + 1)
+                if xbound <= ybound:
+                    rx += 1
+                    scan(range(cx0 - rx, cx0 - rx + 1), ys)
+                    scan(range(cx1 + rx, cx1 + rx + 1), ys)
+                else:
+                    ry += 1
+                    scan(xs, range(cy0 - ry, cy0 - ry + 1))
+                    scan(xs, range(cy1 + ry, cy1 + ry + 1))
+
+        pairs: List[
+            Tuple[float, int, int, ElementT, ElementT, ElementT, Iterator[PairT]]
+        ] = []
+        blocked: List[PairT] = []
+
+        def push_next(owner: ElementT, pairs_of_owner: Iterator[PairT]) -> None:
+            for pair in pairs_of_owner:
+                if pair[1] not in done and pair[2] not in done:
+                    heapq.heappush(pairs, (*pair, owner, pairs_of_owner))
+                    return
+
+        def merge(obj1: ElementT, obj2: ElementT) -> None:
+            if isinstance(obj1, (LTTextBoxVertical, LTTextGroupTBRL)) or isinstance(
+                obj2,
+                (LTTextBoxVertical, LTTextGroupTBRL),
+            ):
+                group: LTTextGroup = LTTextGroupTBRL([obj1, obj2])
+            else:
+                group = LTTextGroupLRTB([obj1, obj2])
+            plane.remove(obj1)
+            plane.remove(obj2)
+            displace(obj1)
+            displace(obj2)
+            done.update([id(obj1), id(obj2)])
+            place(group)
+            push_next(group, neighbors(group))
+            plane.add(group)
+
+        for box in boxes:
+            place(box)
         plane.extend(boxes)
-        done = set()
-        while len(dists) > 0:
-            (skip_isany, d, id1, id2, obj1, obj2) = heapq.heappop(dists)
-            # Skip objects that are already merged
-            if (id1 not in done) and (id2 not in done):
-                if not skip_isany and isany(obj1, obj2):
-                    heapq.heappush(dists, (True, d, id1, id2, obj1, obj2))
+        for box in boxes:
+            push_next(box, neighbors(box))
+
+        while pairs or blocked:
+            if pairs:
+                (d, id1, id2, obj1, obj2, owner, pairs_of_owner) = heapq.heappop(pairs)
+                if id(owner) in done:
                     continue
-                if isinstance(obj1, (LTTextBoxVertical, LTTextGroupTBRL)) or isinstance(
-                    obj2,
-                    (LTTextBoxVertical, LTTextGroupTBRL),
-                ):
-                    group: LTTextGroup = LTTextGroupTBRL([obj1, obj2])
-                else:
-                    group = LTTextGroupLRTB([obj1, obj2])
-                plane.remove(obj1)
-                plane.remove(obj2)
-                done.update([id1, id2])
-
-                for other in plane:
-                    heapq.heappush(
-                        dists,
-                        (False, dist(group, other), id(group), id(other), group, other),
-                    )
-                plane.add(group)
+                if id1 in done or id2 in done:
+                    push_next(owner, pairs_of_owner)
+                    continue
+                if isany(obj1, obj2):
+                    heapq.heappush(blocked, (d, id1, id2, obj1, obj2))
+                    push_next(owner, pairs_of_owner)
+                    continue
+            else:
+                (d, id1, id2, obj1, obj2) = heapq.heappop(blocked)
+                # Skip objects that are already merged
+                if id1 in done or id2 in done:
+                    continue
+            merge(obj1, obj2)
         # By now only groups are in the plane
         return list(cast(LTTextGroup, g) for g in plane)
 
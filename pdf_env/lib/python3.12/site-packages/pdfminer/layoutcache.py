@@ -0,0 +1,284 @@
+"""Serialized page layouts, and a cache of them on disk.
+
+dump_layout() turns an LTPage into bytes and load_layout() turns them back
+into an LTPage, without the document having to be interpreted again.
+LayoutCache keeps such layouts in files, named after the document, the page,
+the LAParams they were analyzed with and the sources of pdfminer.
+"""
+
+import functools
+import io
+import logging
+import os
+import pickle
+import zlib
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Tuple
+
+from pdfminer.layout import LAParams, LTComponent, LTItem, LTPage, item_state
+from pdfminer.pdfcolor import PREDEFINED_COLORSPACE, PDFColorSpace
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfexceptions import PDFException, PDFValueError
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import PDFObjRef, PDFStream, stream_value
+from pdfminer.psparser import LIT, PSLiteral
+
+log = logging.getLogger(__name__)
+
+# Version of the serialized form, part of every cache key
+LAYOUT_FORMAT = 2
+
+# Attributes that hold the items contained in an item
+_LINKS = ("_objs", "groups")
+
+# Slots that set_bbox() derives from x0, y0, x1 and y1, and the slot of the
+# __dict__, which is stored separately
+_DERIVED_SLOTS = ("width", "height", "bbox", "__dict__")
+
+# Stands for a slot that was never assigned, such as the mcid of a character
+# outside marked content
+_UNSET = ...
+
+# The modules whose classes layouts are made of, and the builtins they use.
+# Nothing else may be loaded, as cache files could have been written by
+# anyone who can write to the cache directory.
+_LAYOUT_MODULES = (
+    "pdfminer.layout",
+    "pdfminer.pdfcolor",
+    "pdfminer.pdfinterp",
+    "pdfminer.pdftypes",
+)
+_LAYOUT_BUILTINS = ("Ellipsis", "bytearray", "complex", "frozenset", "set")
+
+# One record per item: its class, the values of its slots (in the order of
+# _slot_names()) and its __dict__, if it has any
+_Record = Tuple[type, Tuple[Any, ...], Optional[Dict[str, Any]]]
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """The slots of cls that are stored, from its base classes down."""
+    return tuple(
+        name
+        for base in reversed(cls.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name not in _DERIVED_SLOTS
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest() -> str:
+    """Hash of the .py files of pdfminer, as they are on disk.
+
+    Layouts depend on the code that analyzed them, which may change without
+    LAYOUT_FORMAT or the version of pdfminer changing with it.
+    """
+    digest = sha256()
+    root = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(root)):
+        if filename.endswith(".py"):
+            digest.update(filename.encode())
+            with open(os.path.join(root, filename), "rb") as fp:
+                digest.update(fp.read())
+    return digest.hexdigest()
+
+
+class _LayoutPickler(pickle.Pickler):
+    """Stores objects of the document by reference.
+
+    Image streams and indirect objects are stored as their object numbers,
+    and literals and the predefined color spaces as their names, so that
+    they are shared again after loading instead of being copied into every
+    layout. Literals are compared by identity.
+    """
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, Any]]:
+        if isinstance(obj, PSLiteral):
+            return ("L", obj.name)
+        if isinstance(obj, PDFObjRef):
+            return ("R", obj.objid)
+        if isinstance(obj, PDFStream) and obj.objid is not None:
+            return ("S", obj.objid)
+        if isinstance(obj, PDFColorSpace):
+            if PREDEFINED_COLORSPACE.get(obj.name) is obj:
+                return ("C", obj.name)
+        return None
+
+
+class _LayoutUnpickler(pickle.Unpickler):
+    """Loads only what layouts are made of; see _LAYOUT_MODULES."""
+
+    def __init__(self, data: bytes, doc: Optional[PDFDocument]) -> None:
+        pickle.Unpickler.__init__(self, io.BytesIO(data))
+        self.doc = doc
+
+    def find_class(self, module: str, name: str) -> Any:
+        if module == "builtins" and name in _LAYOUT_BUILTINS:
+            return pickle.Unpickler.find_class(self, module, name)
+        if module in _LAYOUT_MODULES:
+            obj = pickle.Unpickler.find_class(self, module, name)
+            # Only classes defined there, not functions or imported names
+            if isinstance(obj, type) and obj.__module__ == module:
+                return obj
+        raise pickle.UnpicklingError("Not part of a layout: %s.%s" % (module, name))
+
+    def persistent_load(self, pid: Tuple[str, Any]) -> Any:
+        (kind, value) = pid
+        if kind == "L":
+            return LIT(value)
+        if kind == "C":
+            return PREDEFINED_COLORSPACE[value]
+        if kind == "R":
+            return PDFObjRef(self.doc, value)
+        if kind == "S":
+            if self.doc is None:
+                raise PDFValueError("Layout refers to stream %r of a document" % value)
+            return stream_value(self.doc.getobj(value))
+        raise pickle.UnpicklingError("Unknown persistent id: %r" % (pid,))
+
+
+def dump_layout(ltpage: LTPage) -> bytes:
+    """Serializes the layout tree of ltpage.
+
+    Every item becomes a record of its class and attribute values, in which
+    the items it contains are replaced by the indexes of their records.
+    Items that are reached twice, like the text boxes in LTPage.groups, are
+    stored once. Graphic states are pickled once however many characters
+    share them.
+    """
+    records: List[_Record] = []
+    index: Dict[int, int] = {id(ltpage): 0}
+    items: List[LTItem] = [ltpage]
+
+    def link(objs: List[LTItem]) -> List[int]:
+        indexes = []
+        for obj in objs:
+            i = index.get(id(obj))
+            if i is None:
+                i = index[id(obj)] = len(items)
+                items.append(obj)
+            indexes.append(i)
+        return indexes
+
+    # items grows while the records are written, in breadth-first order
+    for item in items:
+        cls = type(item)
+        values = []
+        for name in _slot_names(cls):
+            value = getattr(item, name, _UNSET)
+            if name in _LINKS:
+                value = link(value)
+            values.append(value)
+        (state, _) = item_state(item)
+        if state:
+            state = dict(state)
+            for name in _LINKS:
+                if state.get(name) is not None:
+                    state[name] = link(state[name])
+        records.append((cls, tuple(values), state or None))
+
+    buf = io.BytesIO()
+    _LayoutPickler(buf, pickle.HIGHEST_PROTOCOL).dump(records)
+    return zlib.compress(buf.getvalue(), 1)
+
+
+def load_layout(data: bytes, doc: Optional[PDFDocument] = None) -> LTPage:
+    """Rebuilds the LTPage that dump_layout() serialized as data.
+
+    `doc` is the document the page belongs to. It is needed if the page has
+    images, whose streams are read from it again.
+    """
+    records: List[_Record] = _LayoutUnpickler(zlib.decompress(data), doc).load()
+    objs = [cls.__new__(cls) for (cls, _, _) in records]
+    for obj, (cls, values, state) in zip(objs, records):
+        for name, value in zip(_slot_names(cls), values):
+            if value is _UNSET:
+                continue
+            if name in _LINKS:
+                value = [objs[i] for i in value]
+            setattr(obj, name, value)
+        if state is not None:
+            for name in _LINKS:
+                if state.get(name) is not None:
+                    state[name] = [objs[i] for i in state[name]]
+            obj.__dict__.update(state)
+        if isinstance(obj, LTComponent):
+            obj.set_bbox((obj.x0, obj.y0, obj.x1, obj.y1))
+    ltpage = objs[0]
+    if not isinstance(ltpage, LTPage):
+        raise PDFValueError("Layout is not of a page: %r" % ltpage)
+    return ltpage
+
+
+class LayoutCache:
+    """Keeps the layouts of pages in files in `cache_dir`.
+
+    By default that is $LAYOUT_CACHE, or else ~/.cache/pdfminer/layout.
+    Layouts that can't be read or written are simply not cached; the page is
+    interpreted as usual then.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                "LAYOUT_CACHE",
+                os.path.join(os.path.expanduser("~"), ".cache", "pdfminer", "layout"),
+            )
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(page: PDFPage, laparams: Optional[LAParams], variant: str = "") -> str:
+        """Names the layout of page when analyzed with laparams.
+
+        The page is identified by the digest of its document and its page
+        id, the number of its page object, along with its rotation, which
+        callers may change. `variant` tells apart the layouts that different
+        devices make of the same page. The sources of pdfminer are part of
+        the key too, so that changes to the layout analysis aren't hidden by
+        older layouts.
+        """
+        params = None if laparams is None else sorted(vars(laparams).items())
+        ident = (
+            LAYOUT_FORMAT,
+            _source_digest(),
+            page.doc.digest(),
+            page.pageid,
+            page.rotate,
+            params,
+            variant,
+        )
+        return sha256(repr(ident).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".layout")
+
+    def get(self, key: str, doc: Optional[PDFDocument] = None) -> Optional[LTPage]:
+        """The layout cached as key, or None. See load_layout() for `doc`."""
+        try:
+            with open(self._path(key), "rb") as fp:
+                data = fp.read()
+        except OSError:
+            return None
+        try:
+            return load_layout(data, doc)
+        except (
+            EOFError,
+            PDFException,
+            ValueError,
+            pickle.UnpicklingError,
+            zlib.error,
+        ) as e:
+            log.debug("not using the cached layout %s: %s", key, e)
+            return None
+
+    def put(self, key: str, ltpage: LTPage) -> None:
+        path = self._path(key)
+        try:
+            data = dump_layout(ltpage)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = "%s.%d.tmp" % (path, os.getpid())
+            with open(tmp_path, "wb") as out:
+                out.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, pickle.PicklingError) as e:
+            log.debug("not caching the layout %s: %s", key, e)
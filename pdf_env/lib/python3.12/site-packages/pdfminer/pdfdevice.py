@@ -1,4 +1,5 @@
 import logging
+import math
 from typing import (
     TYPE_CHECKING,
     BinaryIO,
@@ -12,7 +13,7 @@ from typing import (
 
 from pdfminer import utils
 from pdfminer.pdfcolor import PDFColorSpace
-from pdfminer.pdffont import PDFFont, PDFUnicodeNotDefined
+from pdfminer.pdffont import Glyph, PDFFont
 from pdfminer.pdfpage import PDFPage
 from pdfminer.pdftypes import PDFStream
 from pdfminer.psparser import PSLiteral
@@ -63,6 +64,13 @@ class PDFDevice:
     def do_tag(self, tag: PSLiteral, props: Optional["PDFStackT"] = None) -> None:
         pass
 
+    def restore_page(self, page: PDFPage) -> bool:
+        """Produces the output of page without it being interpreted, if it can.
+
+        Returns whether it did; if not, the page is interpreted as usual.
+        """
+        return False
+
     def begin_page(self, page: PDFPage, ctm: Matrix) -> None:
         pass
 
@@ -99,6 +107,9 @@ class PDFDevice:
 
 
 class PDFTextDevice(PDFDevice):
+    # matrix of the last string rendered
+    string_matrix: Optional[Matrix] = None
+
     def render_string(
         self,
         textstate: "PDFTextState",
@@ -108,6 +119,20 @@ class PDFTextDevice(PDFDevice):
     ) -> None:
         assert self.ctm is not None
         matrix = utils.mult_matrix(textstate.matrix, self.ctm)
+        # Strings that are only moved share the scaling and rotation of their
+        # matrices, and so do the matrices of their characters. Zeros must
+        # also have the same sign, as 0.0 == -0.0.
+        last = self.string_matrix
+        if (
+            last is not None
+            and matrix[:4] == last[:4]
+            and all(
+                math.copysign(1, x) == math.copysign(1, y)
+                for (x, y) in zip(matrix[:4], last[:4])
+            )
+        ):
+            matrix = cast(Matrix, last[:4] + matrix[4:])
+        self.string_matrix = matrix
         font = textstate.font
         fontsize = textstate.fontsize
         scaling = textstate.scaling * 0.01
@@ -171,7 +196,7 @@ class PDFTextDevice(PDFDevice):
                 x -= obj * dxscale
                 needcharspace = True
             elif isinstance(obj, bytes):
-                for cid in font.decode(obj):
+                for cid, glyph in font.decode_glyphs(obj):
                     if needcharspace:
                         x += charspace
                     x += self.render_char(
@@ -183,6 +208,7 @@ class PDFTextDevice(PDFDevice):
                         cid,
                         ncs,
                         graphicstate,
+                        glyph=glyph,
                     )
                     if cid == 32 and wordspace:
                         x += wordspace
@@ -215,7 +241,7 @@ class PDFTextDevice(PDFDevice):
                 y -= obj * dxscale
                 needcharspace = True
             elif isinstance(obj, bytes):
-                for cid in font.decode(obj):
+                for cid, glyph in font.decode_glyphs(obj):
                     if needcharspace:
                         y += charspace
                     y += self.render_char(
@@ -227,6 +253,7 @@ class PDFTextDevice(PDFDevice):
                         cid,
                         ncs,
                         graphicstate,
+                        glyph=glyph,
                     )
                     if cid == 32 and wordspace:
                         y += wordspace
@@ -247,7 +274,13 @@ class PDFTextDevice(PDFDevice):
         cid: int,
         ncs: PDFColorSpace,
         graphicstate: "PDFGraphicState",
+        glyph: Optional[Glyph] = None,
     ) -> float:
+        """Render character `cid` and return its advance.
+
+        `glyph` is font.get_glyph(cid), passed along by the render_string
+        methods, which decode each string into glyphs in one go.
+        """
         return 0
 
 
@@ -279,13 +312,9 @@ class TagExtractor(PDFDevice):
                 obj = utils.make_compat_bytes(obj)
             if not isinstance(obj, bytes):
                 continue
-            chars = font.decode(obj)
-            for cid in chars:
-                try:
-                    char = font.to_unichr(cid)
+            for _, (char, _, _) in font.decode_glyphs(obj):
+                if char is not None:
                     text += char
-                except PDFUnicodeNotDefined:
-                    pass
         self._write(utils.enc(text))
 
     def begin_page(self, page: PDFPage, ctm: Matrix) -> None:
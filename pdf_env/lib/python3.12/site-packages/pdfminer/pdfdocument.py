@@ -2,11 +2,14 @@ import itertools
 import logging
 import re
 import struct
+from bisect import bisect_right
+from collections import OrderedDict
 from hashlib import md5, sha256, sha384, sha512
 from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Iterator,
     KeysView,
@@ -23,7 +26,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from pdfminer import settings
-from pdfminer.arcfour import Arcfour
+from pdfminer.arcfour import Arcfour, xor_bytes
 from pdfminer.casting import safe_int
 from pdfminer.data_structures import NumberTree
 from pdfminer.pdfexceptions import (
@@ -210,54 +213,182 @@ class PDFXRef(PDFBaseXRef):
 
 
 class PDFXRefFallback(PDFXRef):
+    """XRef rebuilt from the `<objid> <genno> obj` lines found in the file.
+
+    The file is searched with regular expressions up to the first trailer,
+    skipping the data of streams, which may hold such lines of their own.
+    Objects that may be object streams are only parsed once an object is
+    looked up that could be stored in one of them.
+    """
+
+    def __init__(self) -> None:
+        PDFXRef.__init__(self)
+        self.parser: Optional[PDFParser] = None
+        # (pos, objid, genno) of the object streams not expanded yet
+        self.objstms: List[Tuple[int, int, int]] = []
+
     def __repr__(self) -> str:
         return "<PDFXRefFallback: offsets=%r>" % (self.offsets.keys())
 
-    PDFOBJ_CUE = re.compile(r"^(\d+)\s+(\d+)\s+obj\b")
+    # "<objid> <genno> obj" as r"^(\d+)\s+(\d+)\s+obj\b" matches it on a latin-1
+    # decoded line
+    PDFOBJ_CUE = re.compile(
+        rb"(\d+)[\t\x0b\x0c\x1c-\x1f \x85\xa0]+(\d+)[\t\x0b\x0c\x1c-\x1f \x85\xa0]+obj"
+        rb"(?![0-9A-Z_a-z\xaa\xb2\xb3\xb5\xb9\xba\xbc-\xbe"
+        rb"\xc0-\xd6\xd8-\xf6\xf8-\xff])",
+    )
+    # The same after a line break, which is much faster to search for than
+    # a line start
+    PDFOBJ_LINE_CUE = re.compile(rb"[\r\n]" + PDFOBJ_CUE.pattern)
+    STREAM_CUE = re.compile(rb"stream(?:\r\n|[\r\n])")
+    ENDSTREAM_CUE = re.compile(rb"\s*endstream")
+    LENGTH_CUE = re.compile(rb"/Length\s+(\d+)(?!\s+\d+\s+R)")
+    OBJSTM_CUE = re.compile(rb"/ObjStm")
 
     def load(self, parser: PDFParser) -> None:
-        parser.seek(0)
-        while 1:
-            try:
-                (pos, line_bytes) = parser.nextline()
-            except PSEOF:
-                break
-            if line_bytes.startswith(b"trailer"):
-                parser.seek(pos)
-                self.load_trailer(parser)
-                log.debug("trailer: %r", self.trailer)
+        self.parser = parser
+        data = parser.data
+        if data is None:
+            parser.fp.seek(0)
+            data = parser.fp.read()
+        size = len(data)
+        cues: List[Tuple[int, int, int]] = []
+        # Positions of the next trailer, "stream" and "endobj" keywords at or
+        # after pos, found again only once pos has passed them, and of the
+        # data after that "stream"
+        pos = 0
+        trailer = stream = stream_data = endobj = -1
+        m = self.PDFOBJ_CUE.match(data)
+        while True:
+            if m is None:
+                m = self.PDFOBJ_LINE_CUE.search(data, pos)
+            if trailer < pos:
+                trailer = self._find_trailer(data, pos)
+            # Only the objects before the first trailer are read.
+            if m is None or trailer < m.start(1):
                 break
-            line = line_bytes.decode("latin-1")  # default pdf encoding
-            m = self.PDFOBJ_CUE.match(line)
-            if not m:
-                continue
-            (objid_s, genno_s) = m.groups()
-            objid = int(objid_s)
-            genno = int(genno_s)
-            self.offsets[objid] = (None, pos, genno)
-            # expand ObjStm.
-            parser.seek(pos)
-            (_, obj) = parser.nextobject()
-            if isinstance(obj, PDFStream) and obj.get("Type") is LITERAL_OBJSTM:
-                stream = stream_value(obj)
+            (objid, genno) = (int(m.group(1)), int(m.group(2)))
+            self.offsets[objid] = (None, m.start(1), genno)
+            cues.append((m.start(1), objid, genno))
+            pos = m.end()
+            m = self.PDFOBJ_LINE_CUE.search(data, pos)
+            if endobj < pos:
+                endobj = data.find(b"endobj", pos)
+                if endobj < 0:
+                    endobj = size
+            if stream < pos:
+                (stream, stream_data) = self._find_stream(data, pos)
+            # The object is a stream if "stream" comes before its end, which
+            # is at "endobj" or else at the next object
+            if stream < endobj and (m is None or stream < m.start()):
+                pos = self._skip_stream(data, pos, stream, stream_data)
+                m = None
+        end = trailer
+        # An object mentioning /ObjStm may be an object stream.
+        positions = [pos for (pos, _, _) in cues]
+        for m in self.OBJSTM_CUE.finditer(data, 0, end):
+            i = bisect_right(positions, m.start()) - 1
+            if 0 <= i and (not self.objstms or self.objstms[-1] != cues[i]):
+                self.objstms.append(cues[i])
+        if end < size:
+            parser.seek(end)
+            self.load_trailer(parser)
+            log.debug("trailer: %r", self.trailer)
+
+    @staticmethod
+    def _find_trailer(data: bytes, pos: int) -> int:
+        """Position of the first "trailer" at a line start from pos on."""
+        pos = data.find(b"trailer", pos)
+        while 0 < pos and data[pos - 1 : pos] not in b"\r\n":
+            pos = data.find(b"trailer", pos + 1)
+        return len(data) if pos < 0 else pos
+
+    def _find_stream(self, data: bytes, pos: int) -> Tuple[int, int]:
+        """Positions of the first "stream" keyword from pos on and of the
+        data after it.
+        """
+        while True:
+            pos = data.find(b"stream", pos)
+            if pos < 0:
+                return (len(data), len(data))
+            m = self.STREAM_CUE.match(data, pos)
+            if m is not None and not data[pos - 1 : pos].isalnum():
+                return m.span()
+            pos += 1
+
+    def _skip_stream(self, data: bytes, start: int, stream: int, begin: int) -> int:
+        """The position after the data of the stream whose dictionary starts
+        at `start`, with its "stream" keyword at `stream` and its data at
+        `begin`.
+
+        The data ends after /Length bytes if "endstream" follows there, or
+        else at the next "endstream".
+        """
+        length = self.LENGTH_CUE.search(data, start, stream)
+        if length is not None:
+            m = self.ENDSTREAM_CUE.match(data, begin + int(length.group(1)))
+            if m is not None:
+                return m.end()
+        pos = data.find(b"endstream", begin)
+        if pos < 0:
+            return begin
+        return pos + len(b"endstream")
+
+    def expand_objstms(self) -> None:
+        """Adds the objects stored in the object streams found by load().
+
+        An object stream overrides the objects defined before it in the
+        file, but not those defined after it.
+        """
+        if not self.objstms:
+            return
+        assert self.parser is not None
+        (objstms, self.objstms) = (self.objstms, [])
+        fallback = self.parser.fallback
+        self.parser.fallback = True
+        try:
+            for pos, objid, genno in objstms:
+                self.parser.seek(pos)
+                (_, obj) = self.parser.nextobject()
+                if not isinstance(obj, PDFStream):
+                    continue
+                if obj.get("Type") is not LITERAL_OBJSTM:
+                    continue
+                obj.set_objid(objid, genno)
                 try:
-                    n = stream["N"]
+                    n = obj["N"]
                 except KeyError:
                     if settings.STRICT:
-                        raise PDFSyntaxError("N is not defined: %r" % stream)
+                        raise PDFSyntaxError("N is not defined: %r" % obj)
                     n = 0
-                parser1 = PDFStreamParser(stream.get_data())
+                parser1 = PDFStreamParser(obj.get_data())
                 objs: List[int] = []
                 try:
                     while 1:
-                        (_, obj) = parser1.nextobject()
-                        objs.append(cast(int, obj))
+                        (_, obj1) = parser1.nextobject()
+                        objs.append(cast(int, obj1))
                 except PSEOF:
                     pass
                 n = min(n, len(objs) // 2)
                 for index in range(n):
                     objid1 = objs[index * 2]
+                    (strmid, pos1, _) = self.offsets.get(objid1, (None, -1, 0))
+                    if strmid is None and pos < pos1:
+                        continue
                     self.offsets[objid1] = (objid, index, 0)
+        finally:
+            self.parser.fallback = fallback
+
+    def get_objids(self) -> KeysView[int]:
+        self.expand_objstms()
+        return self.offsets.keys()
+
+    def get_pos(self, objid: int) -> Tuple[Optional[int], int, int]:
+        if self.objstms:
+            (strmid, pos, _) = self.offsets.get(objid, (None, -1, 0))
+            if strmid is not None or pos < self.objstms[-1][0]:
+                self.expand_objstms()
+        return self.offsets[objid]
 
 
 class PDFXRefStream(PDFBaseXRef):
@@ -354,6 +485,8 @@ class PDFStandardSecurityHandler:
         self.docid = docid
         self.param = param
         self.password = password
+        # What the last object was decrypted with, kept for its other strings
+        self._object_cipher: Optional[Tuple[Hashable, Any]] = None
         self.init()
 
     def init(self) -> None:
@@ -469,12 +602,26 @@ class PDFStandardSecurityHandler:
     ) -> bytes:
         return self.decrypt_rc4(objid, genno, data)
 
+    # Keystreams up to this many bytes are kept for the next string
+    KEYSTREAM_CACHE_SIZE = 1 << 16
+
     def decrypt_rc4(self, objid: int, genno: int, data: bytes) -> bytes:
-        assert self.key is not None
-        key = self.key + struct.pack("<L", objid)[:3] + struct.pack("<L", genno)[:2]
-        hash = md5(key)
-        key = hash.digest()[: min(len(key), 16)]
-        return Arcfour(key).decrypt(data)
+        # All strings of an object are encrypted from the start of the same
+        # keystream, so it is generated once for all of them.
+        ident = ("RC4", objid, genno)
+        if self._object_cipher is None or self._object_cipher[0] != ident:
+            assert self.key is not None
+            key = self.key + struct.pack("<L", objid)[:3] + struct.pack("<L", genno)[:2]
+            hash = md5(key)
+            key = hash.digest()[: min(len(key), 16)]
+            self._object_cipher = (ident, (key, Arcfour(key), b""))
+        (key, arcfour, keystream) = self._object_cipher[1]
+        if len(keystream) < len(data):
+            if self.KEYSTREAM_CACHE_SIZE < len(data):
+                return Arcfour(key).decrypt(data)
+            keystream += arcfour.process(bytes(len(data) - len(keystream)))
+            self._object_cipher = (ident, (key, arcfour, keystream))
+        return xor_bytes(data, keystream)
 
 
 class PDFStandardSecurityHandlerV4(PDFStandardSecurityHandler):
@@ -530,24 +677,39 @@ class PDFStandardSecurityHandlerV4(PDFStandardSecurityHandler):
         return data
 
     def decrypt_aes128(self, objid: int, genno: int, data: bytes) -> bytes:
-        assert self.key is not None
-        key = (
-            self.key
-            + struct.pack("<L", objid)[:3]
-            + struct.pack("<L", genno)[:2]
-            + b"sAlT"
-        )
-        hash = md5(key)
-        key = hash.digest()[: min(len(key), 16)]
-        initialization_vector = data[:16]
-        ciphertext = data[16:]
+        ident = ("AESV2", objid, genno)
+        if self._object_cipher is None or self._object_cipher[0] != ident:
+            assert self.key is not None
+            key = (
+                self.key
+                + struct.pack("<L", objid)[:3]
+                + struct.pack("<L", genno)[:2]
+                + b"sAlT"
+            )
+            hash = md5(key)
+            key = hash.digest()[: min(len(key), 16)]
+            self._object_cipher = (ident, self._aes_decryptor(key))
+        return unpad_aes(self._decrypt_cbc(self._object_cipher[1], data))
+
+    @staticmethod
+    def _aes_decryptor(key: bytes) -> Any:
         cipher = Cipher(
             algorithms.AES(key),
-            modes.CBC(initialization_vector),
+            modes.ECB(),
             backend=default_backend(),
         )  # type: ignore
-        plaintext = cipher.decryptor().update(ciphertext)  # type: ignore
-        return unpad_aes(plaintext)
+        return cipher.decryptor()  # type: ignore
+
+    @staticmethod
+    def _decrypt_cbc(decryptor: Any, data: bytes) -> bytes:
+        """Decrypts AES-CBC data that starts with its IV, in ECB mode.
+
+        A CBC plaintext block is the decrypted block XORed with the block
+        before it, so one ECB decryptor does all strings with the same key.
+        Like a CBC decryptor that isn't finalized, ignores a partial block.
+        """
+        n = max(0, len(data) - 16) // 16 * 16
+        return xor_bytes(decryptor.update(data[16 : 16 + n]), data[:n])
 
 
 class PDFStandardSecurityHandlerV5(PDFStandardSecurityHandlerV4):
@@ -663,16 +825,128 @@ class PDFStandardSecurityHandlerV5(PDFStandardSecurityHandlerV4):
         return encryptor.update(data) + encryptor.finalize()  # type: ignore
 
     def decrypt_aes256(self, objid: int, genno: int, data: bytes) -> bytes:
-        initialization_vector = data[:16]
-        ciphertext = data[16:]
-        assert self.key is not None
-        cipher = Cipher(
-            algorithms.AES(self.key),
-            modes.CBC(initialization_vector),
-            backend=default_backend(),
-        )  # type: ignore
-        plaintext = cipher.decryptor().update(ciphertext)  # type: ignore
-        return unpad_aes(plaintext)
+        # The file key is used for all objects
+        if self._object_cipher is None or self._object_cipher[0] != "AESV3":
+            assert self.key is not None
+            self._object_cipher = ("AESV3", self._aes_decryptor(self.key))
+        return unpad_aes(self._decrypt_cbc(self._object_cipher[1], data))
+
+
+def estimate_size(obj: object) -> int:
+    """Rough number of bytes held by a parsed PDF object.
+
+    Streams count the length of their decoded data (or of the raw data until
+    they are decoded), strings their length, and containers a fixed overhead
+    per item plus the items themselves. References are not followed.
+    """
+    if isinstance(obj, PDFStream):
+        data = obj.data if obj.data is not None else obj.rawdata
+        return PDFObjectCache.ITEM_SIZE + estimate_size(obj.attrs) + len(data or b"")
+    if isinstance(obj, (bytes, str)):
+        return PDFObjectCache.ITEM_SIZE + len(obj)
+    if isinstance(obj, dict):
+        return PDFObjectCache.ITEM_SIZE + sum(
+            PDFObjectCache.ITEM_SIZE + estimate_size(v) for v in obj.values()
+        )
+    if isinstance(obj, (list, tuple)):
+        return PDFObjectCache.ITEM_SIZE + sum(estimate_size(v) for v in obj)
+    return PDFObjectCache.ITEM_SIZE
+
+
+class PDFObjectCache:
+    """Least recently used store for resolved objects, bounded by size.
+
+    Every entry is charged its `estimate_size`. Once the total exceeds
+    `max_size` bytes, the least recently used entries are dropped; with
+    max_size=None nothing is ever dropped. Streams are usually decoded right
+    after they are looked up, so a stream that was still undecoded when it
+    was last handed out is measured again on the next insertion.
+    """
+
+    ITEM_SIZE = 64
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._undecoded: Dict[Hashable, PDFStream] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            (value, _) = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, obj: object = None) -> None:
+        """Store `value` under `key`, charging it the size of `obj`.
+
+        `obj` defaults to `value`; it is the object whose size is estimated.
+        """
+        if obj is None:
+            obj = value
+        self._remeasure()
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+            self._undecoded.pop(key, None)
+        size = estimate_size(obj)
+        self._entries[key] = (value, size)
+        self.size += size
+        if isinstance(obj, PDFStream) and obj.data is None:
+            self._undecoded[key] = obj
+        if self.max_size is not None:
+            while self.size > self.max_size and len(self._entries) > 1:
+                (evicted_key, (_, evicted)) = self._entries.popitem(last=False)
+                self._undecoded.pop(evicted_key, None)
+                self.size -= evicted
+                self.evictions += 1
+
+    def note_stream(self, key: Hashable, stream: PDFStream) -> None:
+        """Measure `stream` again on the next insertion if it gets decoded."""
+        if stream.data is None:
+            self._undecoded[key] = stream
+
+    def _remeasure(self) -> None:
+        # Streams that are still undecoded stay to be measured later
+        decoded = [
+            key for key, stream in self._undecoded.items() if stream.data is not None
+        ]
+        for key in decoded:
+            stream = self._undecoded.pop(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            (value, size) = entry
+            new_size = estimate_size(stream)
+            self._entries[key] = (value, new_size)
+            self.size += new_size - size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._undecoded.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
 
 class PDFDocument:
@@ -701,8 +975,15 @@ class PDFDocument:
         password: str = "",
         caching: bool = True,
         fallback: bool = True,
+        cache_size: Optional[int] = None,
     ) -> None:
-        """Set the document to use a given PDFParser object."""
+        """Set the document to use a given PDFParser object.
+
+        With caching, resolved objects and parsed object streams are kept in
+        `object_cache`. `cache_size` bounds it to roughly that many bytes,
+        dropping the least recently used objects first; None keeps
+        everything.
+        """
         self.caching = caching
         self.xrefs: List[PDFBaseXRef] = []
         self.info = []
@@ -710,8 +991,8 @@ class PDFDocument:
         self.encryption: Optional[Tuple[Any, Any]] = None
         self.decipher: Optional[DecipherCallable] = None
         self._parser = None
-        self._cached_objs: Dict[int, Tuple[object, int]] = {}
-        self._parsed_objs: Dict[int, Tuple[List[object], int]] = {}
+        self.object_cache = PDFObjectCache(cache_size)
+        self._digest: Optional[str] = None
         self._parser = parser
         self._parser.set_document(self)
         self.is_printable = self.is_modifiable = self.is_extractable = True
@@ -756,6 +1037,25 @@ class PDFDocument:
 
     KEYWORD_OBJ = KWD(b"obj")
 
+    DIGEST_CHUNK_SIZE = 1 << 20
+
+    def digest(self) -> str:
+        """SHA-256 of the file the document is read from, as a hex string."""
+        if self._digest is None:
+            assert self._parser is not None
+            h = sha256()
+            if self._parser.data is not None:
+                h.update(self._parser.data)
+            else:
+                fp = self._parser.fp
+                pos = fp.tell()
+                fp.seek(0)
+                for chunk in iter(lambda: fp.read(self.DIGEST_CHUNK_SIZE), b""):
+                    h.update(chunk)
+                fp.seek(pos)
+            self._digest = h.hexdigest()
+        return self._digest
+
     # _initialize_password(password=b'')
     #   Perform the initialization with a given password.
     def _initialize_password(self, password: str = "") -> None:
@@ -776,13 +1076,16 @@ class PDFDocument:
         self._parser.fallback = False  # need to read streams with exact length
 
     def _getobj_objstm(self, stream: PDFStream, index: int, objid: int) -> object:
-        if stream.objid in self._parsed_objs:
-            (objs, n) = self._parsed_objs[stream.objid]
+        key = (LITERAL_OBJSTM, stream.objid)
+        parsed = self.object_cache.get(key)
+        if parsed is not None:
+            (objs, n) = parsed
         else:
             (objs, n) = self._get_objects(stream)
             if self.caching:
                 assert stream.objid is not None
-                self._parsed_objs[stream.objid] = (objs, n)
+                # Charged like the decoded stream the objects came from
+                self.object_cache.put(key, (objs, n), stream.get_data())
         i = n * 2 + index
         try:
             obj = objs[i]
@@ -848,8 +1151,11 @@ class PDFDocument:
         if not self.xrefs:
             raise PDFException("PDFDocument is not initialized")
         log.debug("getobj: objid=%r", objid)
-        if objid in self._cached_objs:
-            (obj, genno) = self._cached_objs[objid]
+        cached = self.object_cache.get(objid)
+        if cached is not None:
+            (obj, genno) = cached
+            if isinstance(obj, PDFStream):
+                self.object_cache.note_stream(objid, obj)
         else:
             for xref in self.xrefs:
                 try:
@@ -874,7 +1180,7 @@ class PDFDocument:
                 raise PDFObjectNotFound(objid)
             log.debug("register: objid=%r: %r", objid, obj)
             if self.caching:
-                self._cached_objs[objid] = (obj, genno)
+                self.object_cache.put(objid, (obj, genno), obj)
         return obj
 
     OutlineType = Tuple[Any, Any, Any, Any, Any]
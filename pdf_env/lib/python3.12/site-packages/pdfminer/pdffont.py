@@ -865,6 +865,9 @@ LITERAL_TYPE1C = LIT("Type1C")
 # chars or integer character IDs.
 FontWidthDict = Dict[Union[int, str], float]
 
+# Text, width and displacement of a glyph, see PDFFont.get_glyph()
+Glyph = Tuple[Optional[str], float, Union[float, Tuple[Optional[float], float]]]
+
 
 class PDFFont:
     def __init__(
@@ -890,6 +893,7 @@ class PDFFont:
         self.leading = num_value(descriptor.get("Leading", 0))
         self.bbox = self._parse_bbox(descriptor)
         self.hscale = self.vscale = 0.001
+        self._glyphs: Dict[int, Glyph] = {}
 
         # PDF RM 9.8.1 specifies /Descent should always be a negative number.
         # PScript5.dll seems to produce Descent with a positive number, but
@@ -953,11 +957,33 @@ class PDFFont:
         return 0
 
     def string_width(self, s: bytes) -> float:
-        return sum(self.char_width(cid) for cid in self.decode(s))
+        return sum(width for (_, (_, width, _)) in self.decode_glyphs(s))
 
     def to_unichr(self, cid: int) -> str:
         raise NotImplementedError
 
+    def get_glyph(self, cid: int) -> Glyph:
+        """Text, width and displacement of a character, memoized per font.
+
+        The text is None if to_unichr() doesn't define it.
+        """
+        try:
+            return self._glyphs[cid]
+        except KeyError:
+            pass
+        try:
+            text: Optional[str] = self.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = None
+        glyph = (text, self.char_width(cid), self.char_disp(cid))
+        self._glyphs[cid] = glyph
+        return glyph
+
+    def decode_glyphs(self, s: bytes) -> List[Tuple[int, Glyph]]:
+        """Decode a string into its character ids and their glyphs."""
+        get_glyph = self.get_glyph
+        return [(cid, get_glyph(cid)) for cid in self.decode(s)]
+
     @staticmethod
     def _parse_bbox(descriptor: Mapping[str, Any]) -> Rect:
         """Parse FontBBox from the fonts descriptor"""
@@ -1,7 +1,19 @@
+import inspect
 import logging
 import re
 from io import BytesIO
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from pdfminer import settings
 from pdfminer.casting import safe_cmyk, safe_float, safe_int, safe_matrix, safe_rgb
@@ -159,6 +171,20 @@ class PDFGraphicState:
         obj.ncolor = self.ncolor
         return obj
 
+    def is_copy_of(self, other: "PDFGraphicState") -> bool:
+        """Whether this holds the very values that other.copy() would copy."""
+        return (
+            self.linewidth is other.linewidth
+            and self.linecap is other.linecap
+            and self.linejoin is other.linejoin
+            and self.miterlimit is other.miterlimit
+            and self.dash is other.dash
+            and self.intent is other.intent
+            and self.flatness is other.flatness
+            and self.scolor is other.scolor
+            and self.ncolor is other.ncolor
+        )
+
     def __repr__(self) -> str:
         return (
             "<PDFGraphicState: linewidth=%r, linecap=%r, linejoin=%r, "
@@ -251,6 +277,10 @@ class PDFResourceManager:
 
 
 class PDFContentParser(PSStackParser[Union[PSKeyword, PDFStream]]):
+    # Each stream is read as a whole and tokenized in batches, see
+    # PSBaseParser._parse_tokens().
+    TOKEN_BATCH = 256
+
     def __init__(self, streams: Sequence[object]) -> None:
         self.streams = streams
         self.istream = 0
@@ -278,7 +308,7 @@ class PDFContentParser(PSStackParser[Union[PSKeyword, PDFStream]]):
         while 1:
             self.fillfp()
             self.bufpos = self.fp.tell()
-            self.buf = self.fp.read(self.BUFSIZ)
+            self.buf = self.fp.read()
             if self.buf:
                 break
             self.fp = None  # type: ignore[assignment]
@@ -360,12 +390,32 @@ PDFStackT = PSStackType[PDFStream]
 """Types that may appear on the PDF argument stack."""
 
 
+OperatorT = Tuple[Callable[..., None], int, str]
+"""An operator handler, called with the interpreter and its arguments, its
+number of arguments and the name of the operator."""
+
+
 class PDFPageInterpreter:
     """Processor for the content of a PDF page
 
+    Operator X is handled by the method do_X, with "*", '"' and "'" in X
+    spelled "_a", "_w" and "_q". The methods are kept in a dispatch table
+    per class, see get_operator(), which notices a do_X assigned to the
+    class or a base class later on. A do_X set on an interpreter instance
+    takes precedence over its class's.
+
     Reference: PDF Reference, Appendix A, Operator Summary
     """
 
+    # Dispatch table of every class: operator -> name of its method and the
+    # handler, or None if the class has no handler for it. Each subclass
+    # gets its own, see __init_subclass__().
+    _operators: Dict[PSKeyword, Tuple[str, Optional[OperatorT]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._operators = {}
+
     def __init__(self, rsrcmgr: PDFResourceManager, device: PDFDevice) -> None:
         self.rsrcmgr = rsrcmgr
         self.device = device
@@ -373,6 +423,66 @@ class PDFPageInterpreter:
     def dup(self) -> "PDFPageInterpreter":
         return self.__class__(self.rsrcmgr, self.device)
 
+    @staticmethod
+    def operator_method_name(name: str) -> str:
+        return "do_%s" % name.replace("*", "_a").replace('"', "_w").replace("'", "_q")
+
+    @classmethod
+    def get_operator(cls, keyword: PSKeyword) -> Optional[OperatorT]:
+        """Return the handler of an operator and its number of arguments.
+
+        The result is cached per class, so every interpreter of a class,
+        including those made by dup() for form XObjects, shares one table.
+        A cached handler is checked against the method the class has now,
+        which is cheap as Python caches attribute lookups on types, and
+        looked up again when a do_X was assigned since.
+        """
+        entry = cls._operators.get(keyword)
+        if entry is not None:
+            (attr, operator) = entry
+            func = getattr(cls, attr, None)
+            if func is (operator[0] if operator is not None else None):
+                return operator
+            name = keyword_name(keyword)
+        else:
+            name = keyword_name(keyword)
+            attr = cls.operator_method_name(name)
+            func = getattr(cls, attr, None)
+        operator = None
+        if func is not None:
+            operator = (func, func.__code__.co_argcount - 1, name)
+        cls._operators[keyword] = (attr, operator)
+        return operator
+
+    def get_instance_operators(self) -> Dict[PSKeyword, OperatorT]:
+        """Return the handlers of the do_X methods set on self."""
+        operators: Dict[PSKeyword, OperatorT] = {}
+        for attr, func in self.__dict__.items():
+            if not attr.startswith("do_") or not callable(func):
+                continue
+            name = attr[3:].replace("_a", "*").replace("_w", '"').replace("_q", "'")
+            nargs = func.__code__.co_argcount
+            if inspect.ismethod(func):
+                nargs -= 1
+            operators[KWD(name.encode("latin-1"))] = (
+                lambda _, *args, func=func: func(*args),
+                nargs,
+                name,
+            )
+        return operators
+
+    @classmethod
+    def register_operator(cls, name: str, func: Callable[..., None]) -> None:
+        """Handle the content stream operator `name` with `func`.
+
+        `func` is installed as method do_<name> of this class, so it is
+        called with the interpreter and the operator's arguments, and applies
+        to subclasses as well. Use this to support operators a custom device
+        needs, e.g. ``PDFPageInterpreter.register_operator("BX", func)``, or
+        to replace a handler.
+        """
+        setattr(cls, cls.operator_method_name(name), func)
+
     def init_resources(self, resources: Dict[object, object]) -> None:
         """Prepare the fonts and XObjects listed in the Resource attribute."""
         self.resources = resources
@@ -422,6 +532,8 @@ class PDFPageInterpreter:
         self.device.set_ctm(self.ctm)
         self.textstate = PDFTextState()
         self.graphicstate = PDFGraphicState()
+        # copy of graphicstate given to the device with the last string
+        self.string_graphicstate: Optional[PDFGraphicState] = None
         self.curpath: List[PathSegment] = []
         # argstack: stack for command arguments.
         self.argstack: List[PDFStackT] = []
@@ -1115,11 +1227,16 @@ class PDFPageInterpreter:
             if settings.STRICT:
                 raise PDFInterpreterError("No font specified!")
             return
+        # Consecutive strings in the same state share one copy of it, which
+        # every LTChar keeps a reference to.
+        graphicstate = self.string_graphicstate
+        if graphicstate is None or not graphicstate.is_copy_of(self.graphicstate):
+            graphicstate = self.string_graphicstate = self.graphicstate.copy()
         self.device.render_string(
             self.textstate,
             cast(PDFTextSeq, seq),
             self.graphicstate.ncs,
-            self.graphicstate.copy(),
+            graphicstate,
         )
 
     def do_Tj(self, s: PDFStackT) -> None:
@@ -1197,6 +1314,8 @@ class PDFPageInterpreter:
 
     def process_page(self, page: PDFPage) -> None:
         log.debug("Processing page: %r", page)
+        if self.device.restore_page(page):
+            return
         (x0, y0, x1, y1) = page.mediabox
         if page.rotate == 90:
             ctm = (0, -1, 1, 0, -y0, x1)
@@ -1236,30 +1355,35 @@ class PDFPageInterpreter:
         except PSEOF:
             # empty page
             return
+        get_operator = self.get_operator
+        overrides = self.get_instance_operators()
+        if overrides:
+
+            def get_override(keyword: PSKeyword) -> Optional[OperatorT]:
+                if keyword in overrides:
+                    return overrides[keyword]
+                return self.get_operator(keyword)
+
+            get_operator = get_override
         while True:
             try:
                 (_, obj) = parser.nextobject()
             except PSEOF:
                 break
             if isinstance(obj, PSKeyword):
-                name = keyword_name(obj)
-                method = "do_%s" % name.replace("*", "_a").replace('"', "_w").replace(
-                    "'",
-                    "_q",
-                )
-                if hasattr(self, method):
-                    func = getattr(self, method)
-                    nargs = func.__code__.co_argcount - 1
+                operator = get_operator(obj)
+                if operator is not None:
+                    (func, nargs, name) = operator
                     if nargs:
                         args = self.pop(nargs)
                         log.debug("exec: %s %r", name, args)
                         if len(args) == nargs:
-                            func(*args)
+                            func(self, *args)
                     else:
                         log.debug("exec: %s", name)
-                        func()
+                        func(self)
                 elif settings.STRICT:
-                    error_msg = "Unknown operator: %r" % name
+                    error_msg = "Unknown operator: %r" % keyword_name(obj)
                     raise PDFInterpreterError(error_msg)
             else:
                 self.push(obj)
@@ -1,6 +1,18 @@
 import itertools
 import logging
-from typing import Any, BinaryIO, Container, Dict, Iterator, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Container,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from pdfminer import settings
 from pdfminer.pdfdocument import (
@@ -10,7 +22,7 @@ from pdfminer.pdfdocument import (
 )
 from pdfminer.pdfexceptions import PDFObjectNotFound, PDFValueError
 from pdfminer.pdfparser import PDFParser
-from pdfminer.pdftypes import dict_value, int_value, list_value, resolve1
+from pdfminer.pdftypes import PDFObjRef, dict_value, int_value, list_value, resolve1
 from pdfminer.psparser import LIT
 from pdfminer.utils import Rect, parse_rect
 
@@ -143,6 +155,46 @@ class PDFPage:
                     except PDFObjectNotFound:
                         pass
 
+    @classmethod
+    def enumerate_pages(
+        cls,
+        document: PDFDocument,
+        pagenos: Iterable[int],
+    ) -> Iterator[Tuple[int, "PDFPage"]]:
+        """Like enumerate(create_pages(document)), but only for `pagenos`.
+
+        The pages are looked up through a PDFPageIndex, so the other pages
+        are not created. Falls back to create_pages() if the page tree can't
+        be indexed.
+        """
+        wanted = sorted(set(pagenos))
+        try:
+            index = PDFPageIndex(document)
+            located = []
+            for pageno in wanted:
+                try:
+                    located.append((pageno,) + index.lookup(pageno))
+                except IndexError:
+                    break
+        except (PDFPageIndexError, PDFObjectNotFound) as e:
+            log.debug("Page index not usable, walking the page tree: %s", e)
+            selected = set(wanted)
+            for pageno, page in enumerate(cls.create_pages(document)):
+                if pageno in selected:
+                    yield (pageno, page)
+            return
+
+        try:
+            page_labels: Iterator[Optional[str]] = document.get_page_labels()
+        except PDFNoPageLabels:
+            page_labels = itertools.repeat(None)
+        position = 0
+        for pageno, objid, attrs in located:
+            label = next(itertools.islice(page_labels, pageno - position, None))
+            position = pageno + 1
+            log.debug("Page: %r", attrs)
+            yield (pageno, cls(document, objid, attrs, label))
+
     @classmethod
     def get_pages(
         cls,
@@ -152,33 +204,49 @@ class PDFPage:
         password: str = "",
         caching: bool = True,
         check_extractable: bool = False,
+        cache_size: Optional[int] = None,
     ) -> Iterator["PDFPage"]:
         # Create a PDF parser object associated with the file object.
         parser = PDFParser(fp)
-        # Create a PDF document object that stores the document structure.
-        doc = PDFDocument(parser, password=password, caching=caching)
-        # Check if the document allows text extraction.
-        # If not, warn the user and proceed.
-        if not doc.is_extractable:
-            if check_extractable:
-                error_msg = "Text extraction is not allowed: %r" % fp
-                raise PDFTextExtractionNotAllowed(error_msg)
+        try:
+            # Create a PDF document object that stores the document structure.
+            doc = PDFDocument(
+                parser,
+                password=password,
+                caching=caching,
+                cache_size=cache_size,
+            )
+            # Check if the document allows text extraction.
+            # If not, warn the user and proceed.
+            if not doc.is_extractable:
+                if check_extractable:
+                    error_msg = "Text extraction is not allowed: %r" % fp
+                    raise PDFTextExtractionNotAllowed(error_msg)
+                else:
+                    warning_msg = (
+                        "The PDF %r contains a metadata field "
+                        "indicating that it should not allow "
+                        "text extraction. Ignoring this field "
+                        "and proceeding. Use the check_extractable "
+                        "if you want to raise an error in this case" % fp
+                    )
+                    log.warning(warning_msg)
+            # Process each page contained in the document.
+            pages: Iterable[Tuple[int, PDFPage]]
+            if pagenos and isinstance(pagenos, Iterable):
+                pages = cls.enumerate_pages(doc, pagenos)
             else:
-                warning_msg = (
-                    "The PDF %r contains a metadata field "
-                    "indicating that it should not allow "
-                    "text extraction. Ignoring this field "
-                    "and proceeding. Use the check_extractable "
-                    "if you want to raise an error in this case" % fp
-                )
-                log.warning(warning_msg)
-        # Process each page contained in the document.
-        for pageno, page in enumerate(cls.create_pages(doc)):
-            if pagenos and (pageno not in pagenos):
-                continue
-            yield page
-            if maxpages and maxpages <= pageno + 1:
-                break
+                pages = enumerate(cls.create_pages(doc))
+            for pageno, page in pages:
+                if pagenos and (pageno not in pagenos):
+                    continue
+                yield page
+                if maxpages and maxpages <= pageno + 1:
+                    break
+        finally:
+            # Release the memory mapping of the file, if any. The pages can
+            # still be read from fp afterwards, as long as it is open.
+            parser.close()
 
     def _parse_mediabox(self, value: Any) -> Rect:
         us_letter = (0.0, 0.0, 612.0, 792.0)
@@ -216,3 +284,204 @@ class PDFPage:
             if not isinstance(contents, list):
                 contents = [contents]
         return contents
+
+
+class PDFPageIndexError(PDFValueError):
+    pass
+
+
+class PDFPageIndex:
+    """Random access to the pages of a document through its page tree.
+
+    Page n is found by descending from the root /Pages node and skipping
+    whole subtrees by their /Count, so only the nodes on the way to it and
+    their kids are resolved. Page n is the nth kid of a node if that kid
+    and all kids before it are pages; otherwise every node on the way must
+    have a /Count that adds up with its kids'. The kids of such a node and
+    their number of pages are kept for later lookups.
+
+    When a check fails, the index walks the tree in the order of
+    PDFPage.create_pages() from then on, as far as the pages looked up so
+    far, and keeps the object id and attributes of every page it passes.
+    No PDFPage is created for the pages in between.
+
+    Attributes are inherited like in create_pages(). Raises
+    PDFPageIndexError where the walk doesn't add up either, such as a
+    /Count that differs from the number of pages under its node, or a node
+    that occurs twice; create_pages() is the fallback then.
+    """
+
+    def __init__(self, document: PDFDocument) -> None:
+        self.doc = document
+        if "Pages" not in document.catalog:
+            raise PDFPageIndexError("No /Pages in the catalog")
+        (self.root_id, self.root) = self._node(
+            document.catalog["Pages"],
+            document.catalog,
+        )
+        if self._type(self.root) is not LITERAL_PAGES:
+            raise PDFPageIndexError("Root of the page tree is not /Pages")
+        self._ordered = False
+        self._pages: List[Tuple[object, Dict[str, Any]]] = []
+        self._kids: Dict[object, List[Tuple[object, Dict[str, Any], int]]] = {}
+        self._walk = self._search(self.root_id, self.root, {self.root_id})
+
+    def __len__(self) -> int:
+        self._pages.extend(self._walk)
+        return len(self._pages)
+
+    def _node(
+        self,
+        obj: object,
+        parent: Dict[str, Any],
+    ) -> Tuple[object, Dict[str, Any]]:
+        if isinstance(obj, int):
+            objid: object = obj
+            props = dict_value(self.doc.getobj(obj)).copy()
+        elif isinstance(obj, PDFObjRef):
+            objid = obj.objid
+            props = dict_value(obj).copy()
+        else:
+            raise PDFPageIndexError("Invalid page tree node: %r" % obj)
+        for k, v in parent.items():
+            if k in PDFPage.INHERITABLE_ATTRS and k not in props:
+                props[k] = v
+        return (objid, props)
+
+    @staticmethod
+    def _type(props: Dict[str, Any]) -> object:
+        object_type = props.get("Type")
+        if object_type is None and not settings.STRICT:  # See #64
+            object_type = props.get("type")
+        if object_type is LITERAL_PAGES and "Kids" not in props:
+            return None
+        return object_type
+
+    @staticmethod
+    def _count(objid: object, props: Dict[str, Any]) -> int:
+        try:
+            return int_value(props["Count"])
+        except KeyError:
+            raise PDFPageIndexError("/Pages node %r without /Count" % objid)
+
+    def _sized_kids(
+        self,
+        objid: object,
+        props: Dict[str, Any],
+    ) -> List[Tuple[object, Dict[str, Any], int]]:
+        """The kids of the /Pages node objid with their number of pages."""
+        nodes = self._kids.get(objid)
+        if nodes is not None:
+            return nodes
+        nodes = []
+        total = 0
+        for child in list_value(props["Kids"]):
+            (kid_id, kid) = self._node(child, props)
+            kid_type = self._type(kid)
+            if kid_type is LITERAL_PAGE:
+                size = 1
+            elif kid_type is LITERAL_PAGES:
+                size = self._count(kid_id, kid)
+            else:
+                size = 0
+            nodes.append((kid_id, kid, size))
+            total += size
+        count = self._count(objid, props)
+        if total != count:
+            raise PDFPageIndexError(
+                "/Count of %r is %r, but its kids have %d pages"
+                % (objid, count, total),
+            )
+        self._kids[objid] = nodes
+        return nodes
+
+    def _leading_page(
+        self,
+        props: Dict[str, Any],
+        pageno: int,
+    ) -> Optional[Tuple[object, Dict[str, Any]]]:
+        """Kid `pageno` of the node props, if it and all kids before it are
+        pages, so that none of them holds another number of pages.
+        """
+        kids = list_value(props["Kids"])
+        if len(kids) <= pageno:
+            return None
+        for child in kids[: pageno + 1]:
+            (kid_id, kid) = self._node(child, props)
+            if self._type(kid) is not LITERAL_PAGE:
+                return None
+        return (kid_id, kid)
+
+    def _descend(self, pageno: int) -> Tuple[object, Dict[str, Any]]:
+        """Finds page `pageno` by the /Count of the nodes on the way to it."""
+        (objid, props) = (self.root_id, self.root)
+        if pageno >= self._count(objid, props):
+            # A /Count that is too low shows only in a walk of the tree
+            raise PDFPageIndexError("Page %d is past the /Count of the root" % pageno)
+        visited = {objid}
+        while True:
+            if objid not in self._kids:
+                found = self._leading_page(props, pageno)
+                if found is not None:
+                    return found
+            for kid_id, kid, size in self._sized_kids(objid, props):
+                if pageno < size:
+                    break
+                pageno -= size
+            if self._type(kid) is LITERAL_PAGE:
+                return (kid_id, kid)
+            if kid_id in visited:
+                raise PDFPageIndexError("Cycle in the page tree at %r" % kid_id)
+            visited.add(kid_id)
+            (objid, props) = (kid_id, kid)
+
+    def _search(
+        self,
+        objid: object,
+        props: Dict[str, Any],
+        visited: Set[object],
+    ) -> Generator[Tuple[object, Dict[str, Any]], None, int]:
+        """Yields the pages under the /Pages node objid and returns their
+        number.
+        """
+        count = 0
+        for child in list_value(props["Kids"]):
+            (kid_id, kid) = self._node(child, props)
+            if kid_id in visited:
+                raise PDFPageIndexError("%r occurs twice in the page tree" % kid_id)
+            visited.add(kid_id)
+            kid_type = self._type(kid)
+            if kid_type is LITERAL_PAGE:
+                count += 1
+                yield (kid_id, kid)
+            elif kid_type is LITERAL_PAGES:
+                count += yield from self._search(kid_id, kid, visited)
+        if "Count" not in props or int_value(props["Count"]) != count:
+            raise PDFPageIndexError(
+                "/Count of %r is %r, but it has %d pages"
+                % (objid, props.get("Count"), count),
+            )
+        return count
+
+    def lookup(self, pageno: int) -> Tuple[object, Dict[str, Any]]:
+        """Object id and attributes of the page with zero-based index `pageno`.
+
+        Raises IndexError if the tree has no such page.
+        """
+        if pageno < 0:
+            raise IndexError(pageno)
+        if not self._ordered:
+            try:
+                return self._descend(pageno)
+            except PDFPageIndexError as e:
+                log.debug("Walking the page tree in order: %s", e)
+                self._ordered = True
+        while len(self._pages) <= pageno:
+            try:
+                self._pages.append(next(self._walk))
+            except StopIteration:
+                if not self._pages:
+                    # create_pages() looks for pages outside the tree then
+                    raise PDFPageIndexError("No pages in the page tree")
+                raise IndexError(pageno)
+        return self._pages[pageno]
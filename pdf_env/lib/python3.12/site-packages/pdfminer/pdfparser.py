@@ -1,4 +1,6 @@
 import logging
+import mmap
+import os
 from io import BytesIO
 from typing import TYPE_CHECKING, BinaryIO, Optional, Union
 
@@ -36,10 +38,29 @@ class PDFParser(PSStackParser[Union[PSKeyword, PDFStream, PDFObjRef, None]]):
 
     """
 
-    def __init__(self, fp: BinaryIO) -> None:
+    # Files at least this large are memory-mapped by default
+    MMAP_MIN_SIZE = 1 << 20
+
+    def __init__(self, fp: BinaryIO, use_mmap: Optional[bool] = None) -> None:
+        """Reads from fp, memory-mapped if `use_mmap` is set.
+
+        By default a file is mapped if it is at least MMAP_MIN_SIZE bytes.
+        A mapped file is tokenized straight out of the mapping, so seeking
+        to objects doesn't read and refill any buffer. If fp can't be
+        mapped (e.g. BytesIO), it is read in chunks as usual.
+        """
         PSStackParser.__init__(self, fp)
         self.doc: Optional[PDFDocument] = None
         self.fallback = False
+        if use_mmap is not False:
+            try:
+                fileno = fp.fileno()
+                if use_mmap or os.fstat(fileno).st_size >= self.MMAP_MIN_SIZE:
+                    self.data = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                    self.seek(0)
+            except (AttributeError, OSError, ValueError):
+                # No file, or an empty one
+                pass
 
     def set_document(self, doc: "PDFDocument") -> None:
         """Associates the parser with a PDFDocument object."""
@@ -92,8 +113,11 @@ class PDFParser(PSStackParser[Union[PSKeyword, PDFStream, PDFObjRef, None]]):
                     raise PDFSyntaxError("Unexpected EOF")
                 return
             pos += len(line)
-            self.fp.seek(pos)
-            data = bytearray(self.fp.read(objlen))
+            if self.data is not None:
+                data = bytearray(self.data[pos : pos + objlen])
+            else:
+                self.fp.seek(pos)
+                data = bytearray(self.fp.read(objlen))
             self.seek(pos + objlen)
             while 1:
                 try:
@@ -137,8 +161,12 @@ class PDFStreamParser(PDFParser):
     indirect references to other objects in the same document.
     """
 
+    TOKEN_BATCH = 256
+
     def __init__(self, data: bytes) -> None:
         PDFParser.__init__(self, BytesIO(data))
+        self.data = data
+        self.seek(0)
 
     def flush(self) -> None:
         self.add_results(*self.popall())
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 import io
 import logging
+import mmap
 import re
+from collections import deque
 from typing import (
     Any,
     BinaryIO,
+    Deque,
     Dict,
     Generic,
     Iterator,
@@ -147,6 +150,23 @@ END_NUMBER = re.compile(rb"[^0-9]")
 END_KEYWORD = re.compile(rb"[#/%\[\]()<>{}\s]")
 END_STRING = re.compile(rb"[()\134]")
 OCT_STRING = re.compile(rb"[0-7]")
+# One token in its common form, after any whitespace; see
+# PSBaseParser._parse_tokens(). Strings with escapes or nested parentheses and
+# names with # escapes don't match and are left to the character-level states.
+TOKEN = re.compile(
+    rb"[\x00\s]*(?:"
+    rb"(?P<float>[-+]?[0-9]*\.[0-9]*)"
+    rb"|(?P<int>[-+]?[0-9]+)"
+    rb"|(?P<keyword>[A-Za-z][^#/%\[\]()<>{}\s]*)"
+    rb"|(?P<literal>/[^#/%\[\]()<>{}\s]*+)(?!#)"
+    rb"|(?P<string>\([^()\\]*\))"
+    rb"|(?P<dict_begin><<)"
+    rb"|(?P<dict_end>>>)"
+    rb"|(?P<hexstring><[0-9A-Fa-f\s]*)"
+    rb"|(?P<char>[^%/0-9+\-.A-Za-z(<>\s\x00])"
+    rb"|(?P<skip>[-+>]|%[^\r\n]*)"
+    rb")?",
+)
 ESC_STRING = {
     b"b": 8,
     b"t": 9,
@@ -163,10 +183,26 @@ PSBaseParserToken = Union[float, bool, PSLiteral, PSKeyword, bytes]
 
 
 class PSBaseParser:
-    """Most basic PostScript parser that performs only tokenization."""
+    """Most basic PostScript parser that performs only tokenization.
+
+    The input is read from fp in chunks of BUFSIZ bytes. If all of it is
+    available as one buffer instead, e.g. a memory-mapped file, it can be
+    set as `data`; tokens are then read straight out of it, and seeking
+    doesn't refill anything.
+    """
 
     BUFSIZ = 4096
 
+    # Upper bound on the tokens read ahead at once by _parse_tokens(), or 0
+    # to read one token at a time. Reading ahead moves the buffer position
+    # past the tokens that haven't been returned yet, so only parsers that
+    # never mix nexttoken() with nextline() or direct reads without seeking
+    # in between can enable it.
+    TOKEN_BATCH = 0
+
+    # The whole input, if available as one buffer
+    data: Optional[Union[bytes, mmap.mmap]] = None
+
     def __init__(self, fp: BinaryIO) -> None:
         self.fp = fp
         self.eof = False
@@ -180,6 +216,14 @@ class PSBaseParser:
 
     def close(self) -> None:
         self.flush()
+        if isinstance(self.data, mmap.mmap):
+            pos = self.tell()
+            self.data.close()
+            self.data = None
+            # Should the parser be used again, it reads from fp after a seek()
+            self.bufpos = pos
+            self.buf = b""
+            self.charpos = 0
 
     def tell(self) -> int:
         return self.bufpos + self.charpos
@@ -195,21 +239,28 @@ class PSBaseParser:
     def seek(self, pos: int) -> None:
         """Seeks the parser to the given position."""
         log.debug("seek: %r", pos)
-        self.fp.seek(pos)
         # reset the status for nextline()
-        self.bufpos = pos
-        self.buf = b""
-        self.charpos = 0
+        if self.data is not None:
+            self.bufpos = 0
+            self.buf = self.data
+            self.charpos = pos
+        else:
+            self.fp.seek(pos)
+            self.bufpos = pos
+            self.buf = b""
+            self.charpos = 0
         # reset the status for nexttoken()
         self._parse1 = self._parse_main
         self._curtoken = b""
         self._curtokenpos = 0
-        self._tokens: List[Tuple[int, PSBaseParserToken]] = []
+        self._tokens: Deque[Tuple[int, PSBaseParserToken]] = deque()
         self.eof = False
 
     def fillbuf(self) -> None:
         if self.charpos < len(self.buf):
             return
+        if self.data is not None:
+            raise PSEOF("Unexpected EOF")
         # fetch next chunk.
         self.bufpos = self.fp.tell()
         self.buf = self.fp.read(self.BUFSIZ)
@@ -270,7 +321,67 @@ class PSBaseParser:
                 s = s[:n]
                 buf = b""
 
+    def _parse_tokens(self, s: bytes, i: int) -> int:
+        """Tokenize up to TOKEN_BATCH tokens of `s` from `i` in one go.
+
+        Returns the position of the first token left to the character-level
+        states: one that isn't in a form TOKEN matches, or that reaches the
+        end of `s` and might continue in the next buffer.
+        """
+        match = TOKEN.match
+        add = self._tokens.append
+        bufpos = self.bufpos
+        end = len(s)
+        for _ in range(self.TOKEN_BATCH):
+            m = match(s, i)
+            kind = m.lastgroup
+            j = m.end()
+            if kind is None:
+                return j
+            if j == end:
+                return m.start(kind)
+            token = m.group(kind)
+            pos = bufpos + j - len(token)
+            if kind == "int":
+                add((pos, int(token)))
+            elif kind == "keyword":
+                if token == b"true":
+                    add((pos, True))
+                elif token == b"false":
+                    add((pos, False))
+                else:
+                    add((pos, KWD(token)))
+            elif kind == "float":
+                try:
+                    add((pos, float(token)))
+                except ValueError:
+                    pass
+            elif kind == "literal":
+                try:
+                    name: Union[str, bytes] = str(token[1:], "utf-8")
+                except Exception:
+                    name = token[1:]
+                add((pos, LIT(name)))
+            elif kind == "string":
+                add((pos, token[1:-1]))
+            elif kind == "char":
+                add((pos, KWD(token)))
+            elif kind == "dict_begin":
+                add((pos, KEYWORD_DICT_BEGIN))
+            elif kind == "dict_end":
+                add((pos, KEYWORD_DICT_END))
+            elif kind == "hexstring":
+                token = HEX_PAIR.sub(
+                    lambda h: bytes((int(h.group(0), 16),)),
+                    SPC.sub(b"", token[1:]),
+                )
+                add((pos, token))
+            i = j
+        return i
+
     def _parse_main(self, s: bytes, i: int) -> int:
+        if self.TOKEN_BATCH:
+            i = self._parse_tokens(s, i)
         m = NONSPC.search(s, i)
         if not m:
             return len(s)
@@ -463,10 +574,21 @@ class PSBaseParser:
             # after a \ are ignored
             i += 1
 
+        elif c == b"\r" and len(s) == i + 1:
+            # The \n of \r\n may start the next buffer
+            self._parse1 = self._parse_string_lf
+            return i + 1
+
         # default action
         self._parse1 = self._parse_string
         return i + 1
 
+    def _parse_string_lf(self, s: bytes, i: int) -> int:
+        if s[i : i + 1] == b"\n":
+            i += 1
+        self._parse1 = self._parse_string
+        return i
+
     def _parse_wopen(self, s: bytes, i: int) -> int:
         c = s[i : i + 1]
         if c == b"<":
@@ -517,7 +639,7 @@ class PSBaseParser:
                 # Oh, so there wasn't actually a token there? OK.
                 if not self._tokens:
                     raise
-        token = self._tokens.pop(0)
+        token = self._tokens.popleft()
         log.debug("nexttoken: %r", token)
         return token
 
@@ -1,9 +1,13 @@
 """Miscellaneous Routines."""
 
+import array
 import io
+import math
 import pathlib
 import string
+import sys
 from html import escape
+from itertools import accumulate, groupby
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,7 +19,6 @@ from typing import (
     Iterator,
     List,
     Optional,
-    Set,
     TextIO,
     Tuple,
     TypeVar,
@@ -125,32 +128,130 @@ def paeth_predictor(left: int, above: int, upper_left: int) -> int:
         return upper_left
 
 
+_mask8 = (0xFF).__and__
+_mask16 = (0xFFFF).__and__
+
+
+def _row_length(colors: int, columns: int, bitspercomponent: int) -> int:
+    return (colors * columns * bitspercomponent + 7) // 8
+
+
+def _sub_bytes(data: bytes, stride: int) -> bytearray:
+    """Undo differencing each byte with the one stride bytes before it."""
+    raw = bytearray(data)
+    for i in range(stride):
+        raw[i::stride] = bytes(map(_mask8, accumulate(data[i::stride])))
+    return raw
+
+
+def _unpack_components(line: bytes, bitspercomponent: int) -> List[int]:
+    shifts = range(8 - bitspercomponent, -1, -bitspercomponent)
+    mask = (1 << bitspercomponent) - 1
+    return [(byte >> shift) & mask for byte in line for shift in shifts]
+
+
+def _pack_components(components: List[int], bitspercomponent: int) -> bytes:
+    per_byte = 8 // bitspercomponent
+    packed = []
+    for i in range(0, len(components), per_byte):
+        byte = 0
+        for component in components[i : i + per_byte]:
+            byte = (byte << bitspercomponent) | component
+        packed.append(byte)
+    return bytes(packed)
+
+
 def apply_tiff_predictor(
     colors: int, columns: int, bitspercomponent: int, data: bytes
 ) -> bytes:
     """Reverse the effect of the TIFF predictor 2
 
+    Every component is stored as the difference to the same component of the
+    pixel before it, modulo 2 ** bitspercomponent, so each row is undone with
+    a running sum per color.
+
     Documentation: https://www.itu.int/itudoc/itu-t/com16/tiff-fx/docs/tiff6.pdf (Section 14, page 64)
     """
-    if bitspercomponent != 8:
+    if bitspercomponent not in (1, 2, 4, 8, 16):
         error_msg = f"Unsupported `bitspercomponent': {bitspercomponent}"
         raise PDFValueError(error_msg)
-    bpp = colors * (bitspercomponent // 8)
-    nbytes = columns * bpp
-    buf: List[int] = []
+    nbytes = _row_length(colors, columns, bitspercomponent)
+    buf = bytearray()
     for scanline_i in range(0, len(data), nbytes):
-        raw: List[int] = []
-        for i in range(nbytes):
-            new_value = data[scanline_i + i]
-            if i >= bpp:
-                new_value += raw[i - bpp]
-                new_value %= 256
-            raw.append(new_value)
-        buf.extend(raw)
-
+        line = data[scanline_i : scanline_i + nbytes]
+        if bitspercomponent == 8:
+            buf += _sub_bytes(line, colors)
+        elif bitspercomponent == 16:
+            components = array.array("H", line[: len(line) // 2 * 2])
+            if sys.byteorder == "little":
+                components.byteswap()
+            raw = array.array("H", bytes(len(components) * 2))
+            for i in range(colors):
+                raw[i::colors] = array.array(
+                    "H", map(_mask16, accumulate(components[i::colors]))
+                )
+            if sys.byteorder == "little":
+                raw.byteswap()
+            buf += raw.tobytes() + line[len(raw) * 2 :]
+        else:
+            mask = (1 << bitspercomponent) - 1
+            components = _unpack_components(line, bitspercomponent)
+            # Leave the padding at the end of the row alone
+            count = min(colors * columns, len(components))
+            for i in range(colors):
+                components[i:count:colors] = [
+                    c & mask for c in accumulate(components[i:count:colors])
+                ]
+            buf += _pack_components(components, bitspercomponent)
     return bytes(buf)
 
 
+def _add_bytes(data: bytes, other: bytes) -> bytes:
+    """Add two byte strings byte by byte, mod 256, as big integers.
+
+    The sum of the low 7 bits of every byte can't carry into the next byte,
+    the top bits are then added without carry by xor.
+    """
+    n = len(data)
+    high = int.from_bytes(b"\x80" * n, "big")
+    low = int.from_bytes(b"\x7f" * n, "big")
+    a = int.from_bytes(data, "big")
+    b = int.from_bytes(other[:n], "big")
+    return (((a & low) + (b & low)) ^ ((a ^ b) & high)).to_bytes(n, "big")
+
+
+def _unfilter_average(line: bytes, prior: bytes, bpp: int) -> bytearray:
+    raw = bytearray(line)
+    for j in range(min(bpp, len(raw))):
+        raw[j] = (raw[j] + (prior[j] >> 1)) & 0xFF
+    for j in range(bpp, len(raw)):
+        raw[j] = (raw[j] + ((raw[j - bpp] + prior[j]) >> 1)) & 0xFF
+    return raw
+
+
+def _unfilter_paeth(line: bytes, prior: bytes, bpp: int) -> bytearray:
+    raw = bytearray(line)
+    # Without a left neighbour the predictor is always the byte above
+    for j in range(min(bpp, len(raw))):
+        raw[j] = (raw[j] + prior[j]) & 0xFF
+    for j in range(bpp, len(raw)):
+        # paeth_predictor(left, above, upper_left), inlined
+        left = raw[j - bpp]
+        above = prior[j]
+        upper_left = prior[j - bpp]
+        pa = abs(above - upper_left)
+        pb = abs(left - upper_left)
+        pc = abs(left + above - 2 * upper_left)
+        if pa <= pb and pa <= pc:
+            predicted = left
+        elif pb <= pc:
+            predicted = above
+        else:
+            predicted = upper_left
+        raw[j] = (raw[j] + predicted) & 0xFF
+    return raw
+
+
 def apply_png_predictor(
     pred: int,
     colors: int,
@@ -160,95 +261,82 @@ def apply_png_predictor(
 ) -> bytes:
     """Reverse the effect of the PNG predictor
 
+    Every row starts with its filter type, 0 (None) to 4 (Paeth); `pred`
+    itself is not used. Filters work on bytes, so any bit depth is handled
+    alike, with bpp, the number of bytes per pixel, rounded up to 1.
+
+    Consecutive rows with the same filter are decoded together: for Up
+    rows, the usual filter of xref streams, each byte column is one running
+    sum over all of them, and Sub rows are running sums per color. Average
+    and Paeth depend on the byte just decoded and go byte by byte.
+
     Documentation: http://www.libpng.org/pub/png/spec/1.2/PNG-Filters.html
     """
-    if bitspercomponent not in [8, 1]:
+    if bitspercomponent not in (1, 2, 4, 8, 16):
         msg = "Unsupported `bitspercomponent': %d" % bitspercomponent
         raise PDFValueError(msg)
 
-    nbytes = colors * columns * bitspercomponent // 8
-    bpp = colors * bitspercomponent // 8  # number of bytes per complete pixel
-    buf = []
-    line_above = list(b"\x00" * columns)
-    for scanline_i in range(0, len(data), nbytes + 1):
-        filter_type = data[scanline_i]
-        line_encoded = data[scanline_i + 1 : scanline_i + 1 + nbytes]
-        raw = []
+    nbytes = _row_length(colors, columns, bitspercomponent)
+    bpp = max(1, colors * bitspercomponent // 8)  # bytes per complete pixel
+    rowlength = nbytes + 1
+    buf = bytearray()
+    line_above = bytes(nbytes)
+    row = 0
+    for filter_type, group in groupby(data[::rowlength]):
+        nrows = len(list(group))
+        block = bytearray(data[row * rowlength : (row + nrows) * rowlength])
+        del block[::rowlength]
+        row += nrows
 
         if filter_type == 0:
             # Filter type 0: None
-            raw = list(line_encoded)
+            raw = block
 
         elif filter_type == 1:
             # Filter type 1: Sub
-            # To reverse the effect of the Sub() filter after decompression,
-            # output the following value:
             #   Raw(x) = Sub(x) + Raw(x - bpp)
             # (computed mod 256), where Raw() refers to the bytes already
-            #  decoded.
-            for j, sub_x in enumerate(line_encoded):
-                if j - bpp < 0:
-                    raw_x_bpp = 0
-                else:
-                    raw_x_bpp = int(raw[j - bpp])
-                raw_x = (sub_x + raw_x_bpp) & 255
-                raw.append(raw_x)
+            # decoded.
+            raw = bytearray()
+            for i in range(0, len(block), nbytes):
+                raw += _sub_bytes(block[i : i + nbytes], bpp)
 
         elif filter_type == 2:
             # Filter type 2: Up
-            # To reverse the effect of the Up() filter after decompression,
-            # output the following value:
             #   Raw(x) = Up(x) + Prior(x)
             # (computed mod 256), where Prior() refers to the decoded bytes of
             # the prior scanline.
-            for up_x, prior_x in zip(line_encoded, line_above):
-                raw_x = (up_x + prior_x) & 255
-                raw.append(raw_x)
+            # Narrow rows: down a column that is a running sum.
+            raw = block
+            if nbytes < 64:
+                for i in range(min(nbytes, len(block))):
+                    column = accumulate(block[i::nbytes], initial=line_above[i])
+                    raw[i::nbytes] = bytes(map(_mask8, column))[1:]
+            else:
+                for i in range(0, len(block), nbytes):
+                    line_above = _add_bytes(block[i : i + nbytes], line_above)
+                    raw[i : i + nbytes] = line_above
 
-        elif filter_type == 3:
+        elif filter_type in (3, 4):
             # Filter type 3: Average
-            # To reverse the effect of the Average() filter after
-            # decompression, output the following value:
             #    Raw(x) = Average(x) + floor((Raw(x-bpp)+Prior(x))/2)
-            # where the result is computed mod 256, but the prediction is
-            # calculated in the same way as for encoding. Raw() refers to the
-            # bytes already decoded, and Prior() refers to the decoded bytes of
-            # the prior scanline.
-            for j, average_x in enumerate(line_encoded):
-                if j - bpp < 0:
-                    raw_x_bpp = 0
-                else:
-                    raw_x_bpp = int(raw[j - bpp])
-                prior_x = int(line_above[j])
-                raw_x = (average_x + (raw_x_bpp + prior_x) // 2) & 255
-                raw.append(raw_x)
-
-        elif filter_type == 4:
             # Filter type 4: Paeth
-            # To reverse the effect of the Paeth() filter after decompression,
-            # output the following value:
             #    Raw(x) = Paeth(x)
             #             + PaethPredictor(Raw(x-bpp), Prior(x), Prior(x-bpp))
             # (computed mod 256), where Raw() and Prior() refer to bytes
-            # already decoded. Exactly the same PaethPredictor() function is
-            # used by both encoder and decoder.
-            for j, paeth_x in enumerate(line_encoded):
-                if j - bpp < 0:
-                    raw_x_bpp = 0
-                    prior_x_bpp = 0
-                else:
-                    raw_x_bpp = int(raw[j - bpp])
-                    prior_x_bpp = int(line_above[j - bpp])
-                prior_x = int(line_above[j])
-                paeth = paeth_predictor(raw_x_bpp, prior_x, prior_x_bpp)
-                raw_x = (paeth_x + paeth) & 255
-                raw.append(raw_x)
+            # already decoded.
+            unfilter = _unfilter_average if filter_type == 3 else _unfilter_paeth
+            raw = bytearray()
+            for i in range(0, len(block), nbytes):
+                line_above = unfilter(block[i : i + nbytes], line_above, bpp)
+                raw += line_above
 
         else:
             raise PDFValueError("Unsupported predictor value: %d" % filter_type)
 
-        buf.extend(raw)
-        line_above = raw
+        buf += raw
+        if len(raw) >= nbytes:
+            line_above = bytes(raw[-nbytes:])
     return bytes(buf)
 
 
@@ -742,18 +830,63 @@ def vecBetweenBoxes(obj1: "LTComponent", obj2: "LTComponent") -> Point:
 LTComponentT = TypeVar("LTComponentT", bound="LTComponent")
 
 
+class _RTreeNode:
+    """A node of the R-tree behind Plane.
+
+    Leaf entries are (x0, y0, x1, y1, obj, serial, xstart, xstop, ystart,
+    ystop) tuples, with the object's serial number and range of grid cells
+    (see Plane), inner entries are child nodes. bbox is the union of the
+    entries' bounding boxes.
+    """
+
+    __slots__ = ("leaf", "entries", "bbox", "parent")
+
+    def __init__(self, leaf: bool, entries: List[Any]) -> None:
+        self.leaf = leaf
+        self.entries = entries
+        self.parent: Optional[_RTreeNode] = None
+        self.bbox: Rect = (INF, INF, -INF, -INF)
+        self.update_bbox()
+
+    def entry_bbox(self, entry: Any) -> Rect:
+        return cast(Rect, entry[:4]) if self.leaf else entry.bbox
+
+    def update_bbox(self) -> None:
+        boxes = [self.entry_bbox(e) for e in self.entries]
+        if boxes:
+            self.bbox = (
+                min(b[0] for b in boxes),
+                min(b[1] for b in boxes),
+                max(b[2] for b in boxes),
+                max(b[3] for b in boxes),
+            )
+        else:
+            self.bbox = (INF, INF, -INF, -INF)
+
+
 class Plane(Generic[LTComponentT]):
     """A set-like data structure for objects placed on a plane.
 
-    Can efficiently find objects in a certain rectangular area.
-    It maintains two parallel lists of objects, each of
-    which is sorted by its x or y coordinate.
+    Can efficiently find objects in a certain rectangular area. The objects
+    are kept in an R-tree, bulk loaded with Sort-Tile-Recursive packing
+    when objects are added to an empty plane with extend(), so queries take
+    O(log n) time.
+
+    find() yields objects in the same order as the former grid
+    implementation: by the first grid cell (of size gridsize, bottom to top,
+    then left to right) that the object shares with the query area, then in
+    the order the objects were added. Objects outside of bbox are never
+    found.
     """
 
+    MAX_ENTRIES = 16
+
     def __init__(self, bbox: Rect, gridsize: int = 50) -> None:
-        self._seq: List[LTComponentT] = []  # preserve the object order.
-        self._objs: Set[LTComponentT] = set()
-        self._grid: Dict[Point, List[LTComponentT]] = {}
+        # Live objects in the order they were added, with their tree entries.
+        self._objs: Dict[LTComponentT, Tuple[Any, ...]] = {}
+        self._leaves: Dict[LTComponentT, _RTreeNode] = {}
+        self._root = _RTreeNode(True, [])
+        self._serial = 0
         self.gridsize = gridsize
         (self.x0, self.y0, self.x1, self.y1) = bbox
 
@@ -761,7 +894,7 @@ class Plane(Generic[LTComponentT]):
         return "<Plane objs=%r>" % list(self)
 
     def __iter__(self) -> Iterator[LTComponentT]:
-        return (obj for obj in self._seq if obj in self._objs)
+        return iter(list(self._objs))
 
     def __len__(self) -> int:
         return len(self._objs)
@@ -769,57 +902,227 @@ class Plane(Generic[LTComponentT]):
     def __contains__(self, obj: object) -> bool:
         return obj in self._objs
 
-    def _getrange(self, bbox: Rect) -> Iterator[Point]:
+    def _getrange(self, bbox: Rect) -> Tuple[range, range]:
+        """Returns the ranges of grid cells (x, y) that bbox covers."""
         (x0, y0, x1, y1) = bbox
         if x1 <= self.x0 or self.x1 <= x0 or y1 <= self.y0 or self.y1 <= y0:
-            return
+            return (range(0), range(0))
         x0 = max(self.x0, x0)
         y0 = max(self.y0, y0)
         x1 = min(self.x1, x1)
         y1 = min(self.y1, y1)
-        for grid_y in drange(y0, y1, self.gridsize):
-            for grid_x in drange(x0, x1, self.gridsize):
-                yield (grid_x, grid_y)
+        return (drange(x0, x1, self.gridsize), drange(y0, y1, self.gridsize))
+
+    def _register(self, obj: LTComponentT) -> Optional[Tuple[Any, ...]]:
+        """Returns the tree entry for obj, or None if obj is already placed.
+
+        Like a set, the plane holds an object once; placing it again leaves
+        it where it was.
+        """
+        if obj in self._objs:
+            return None
+        (xcells, ycells) = self._getrange(_bbox(obj))
+        entry = (
+            obj.x0,
+            obj.y0,
+            obj.x1,
+            obj.y1,
+            obj,
+            self._serial,
+            xcells.start,
+            xcells.stop,
+            ycells.start,
+            ycells.stop,
+        )
+        self._objs[obj] = entry
+        self._serial += 1
+        return entry
 
     def extend(self, objs: Iterable[LTComponentT]) -> None:
-        for obj in objs:
-            self.add(obj)
+        if self._objs:
+            for obj in objs:
+                self.add(obj)
+            return
+        entries = [entry for entry in map(self._register, objs) if entry is not None]
+        if entries:
+            self._root = self._pack(entries, leaf=True)
+            self._root.parent = None
+
+    def _pack(self, entries: List[Any], leaf: bool) -> _RTreeNode:
+        """Build a tree bottom-up with Sort-Tile-Recursive packing.
+
+        Entries are cut into vertical slices by their x centers, and every
+        slice into nodes by their y centers. The number of slices is chosen
+        so that the nodes come out about square when measured in the mean
+        size of the entries, so wide text lines are packed a few rows per
+        node rather than one slice of the page's height.
+        """
+        size = self.MAX_ENTRIES
+        while True:
+            if len(entries) <= size:
+                node = _RTreeNode(leaf, entries)
+                self._adopt(node)
+                return node
+            probe = _RTreeNode(leaf, [])
+            boxes = [probe.entry_bbox(e) for e in entries]
+            count = len(boxes)
+            width = sum(b[2] - b[0] for b in boxes) / count or 1.0
+            height = sum(b[3] - b[1] for b in boxes) / count or 1.0
+            across = (max(b[2] for b in boxes) - min(b[0] for b in boxes)) / width
+            down = (max(b[3] for b in boxes) - min(b[1] for b in boxes)) / height
+            nnodes = math.ceil(count / size)
+            if down <= 0:
+                nslices = nnodes
+            else:
+                nslices = round(math.sqrt(nnodes * across / down))
+                nslices = min(nnodes, max(1, nslices))
+            per_slice = size * math.ceil(nnodes / nslices)
+
+            order = sorted(range(count), key=lambda i: boxes[i][0] + boxes[i][2])
+            nodes = []
+            for i in range(0, count, per_slice):
+                tile = sorted(
+                    order[i : i + per_slice],
+                    key=lambda i: boxes[i][1] + boxes[i][3],
+                )
+                for j in range(0, len(tile), size):
+                    node = _RTreeNode(leaf, [entries[k] for k in tile[j : j + size]])
+                    self._adopt(node)
+                    nodes.append(node)
+            (entries, leaf) = (nodes, False)
+
+    def _adopt(self, node: _RTreeNode) -> None:
+        if node.leaf:
+            for entry in node.entries:
+                self._leaves[entry[4]] = node
+        else:
+            for child in node.entries:
+                child.parent = node
 
     def add(self, obj: LTComponentT) -> None:
         """Place an object."""
-        for k in self._getrange((obj.x0, obj.y0, obj.x1, obj.y1)):
-            if k not in self._grid:
-                r: List[LTComponentT] = []
-                self._grid[k] = r
-            else:
-                r = self._grid[k]
-            r.append(obj)
-        self._seq.append(obj)
-        self._objs.add(obj)
+        entry = self._register(obj)
+        if entry is None:
+            return
+        node = self._root
+        while not node.leaf:
+            node = min(node.entries, key=lambda n: _enlargement(n.bbox, entry))
+        node.entries.append(entry)
+        self._leaves[obj] = node
+        self._grow(node, entry)
+        while len(node.entries) > self.MAX_ENTRIES:
+            node = self._split(node)
+
+    def _grow(self, node: Optional[_RTreeNode], entry: Any) -> None:
+        (x0, y0, x1, y1) = entry[:4]
+        while node is not None:
+            (nx0, ny0, nx1, ny1) = node.bbox
+            if nx0 <= x0 and ny0 <= y0 and x1 <= nx1 and y1 <= ny1:
+                break
+            node.bbox = (min(nx0, x0), min(ny0, y0), max(nx1, x1), max(ny1, y1))
+            node = node.parent
+
+    def _split(self, node: _RTreeNode) -> _RTreeNode:
+        """Split an overfull node in two halves along its longer side.
+
+        Returns the parent, which may be overfull in turn.
+        """
+        (x0, y0, x1, y1) = node.bbox
+        axis = 0 if y1 - y0 < x1 - x0 else 1
+
+        def center(e: Any) -> float:
+            b = node.entry_bbox(e)
+            return b[axis] + b[axis + 2]
+
+        entries = sorted(node.entries, key=center)
+        half = len(entries) // 2
+        node.entries = entries[:half]
+        node.update_bbox()
+        sibling = _RTreeNode(node.leaf, entries[half:])
+        self._adopt(sibling)
+        parent = node.parent
+        if parent is None:
+            parent = _RTreeNode(False, [node])
+            self._root = parent
+            node.parent = parent
+        parent.entries.append(sibling)
+        sibling.parent = parent
+        parent.update_bbox()
+        return parent
 
     def remove(self, obj: LTComponentT) -> None:
         """Displace an object."""
-        for k in self._getrange((obj.x0, obj.y0, obj.x1, obj.y1)):
-            try:
-                self._grid[k].remove(obj)
-            except (KeyError, ValueError):
-                pass
-        self._objs.remove(obj)
+        del self._objs[obj]
+        node: Optional[_RTreeNode] = self._leaves.pop(obj)
+        assert node is not None
+        for i, entry in enumerate(node.entries):
+            if entry[4] is obj:
+                del node.entries[i]
+                break
+        # Drop nodes that became empty and shrink the bboxes above.
+        while node is not None:
+            parent = node.parent
+            if not node.entries and parent is not None:
+                parent.entries.remove(node)
+            else:
+                node.update_bbox()
+            node = parent
+        if not self._root.entries:
+            self._root = _RTreeNode(True, [])
 
     def find(self, bbox: Rect) -> Iterator[LTComponentT]:
         """Finds objects that are in a certain area."""
         (x0, y0, x1, y1) = bbox
-        done = set()
-        for k in self._getrange(bbox):
-            if k not in self._grid:
+        (nx0, ny0, nx1, ny1) = self._root.bbox
+        if nx1 <= x0 or x1 <= nx0 or ny1 <= y0 or y1 <= ny0:
+            return iter(())
+        if x1 <= self.x0 or self.x1 <= x0 or y1 <= self.y0 or self.y1 <= y0:
+            return iter(())
+        # The ranges of grid cells of the area, like _getrange()
+        gridsize = self.gridsize
+        xstart = int(x0 if self.x0 < x0 else self.x0) // gridsize
+        xstop = int((x1 if x1 < self.x1 else self.x1) + gridsize) // gridsize
+        ystart = int(y0 if self.y0 < y0 else self.y0) // gridsize
+        ystop = int((y1 if y1 < self.y1 else self.y1) + gridsize) // gridsize
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not node.leaf:
+                for child in node.entries:
+                    (nx0, ny0, nx1, ny1) = child.bbox
+                    if not (nx1 <= x0 or x1 <= nx0 or ny1 <= y0 or y1 <= ny0):
+                        stack.append(child)
                 continue
-            for obj in self._grid[k]:
-                if obj in done:
-                    continue
-                done.add(obj)
-                if obj.x1 <= x0 or x1 <= obj.x0 or obj.y1 <= y0 or y1 <= obj.y0:
+            for ex0, ey0, ex1, ey1, obj, serial, ex_start, ex_stop, ey_start, ey_stop in node.entries:
+                if ex1 <= x0 or x1 <= ex0 or ey1 <= y0 or y1 <= ey0:
                     continue
-                yield obj
+                # The first grid cell the object shares with the area
+                cell_x = xstart if ex_start < xstart else ex_start
+                cell_y = ystart if ey_start < ystart else ey_start
+                if (
+                    cell_x < (xstop if xstop < ex_stop else ex_stop)
+                    and cell_y < (ystop if ystop < ey_stop else ey_stop)
+                ):
+                    found.append((cell_y, cell_x, serial, obj))
+        if len(found) > 1:
+            # Serial numbers are unique, so objects are never compared.
+            found.sort()
+        return iter([f[3] for f in found])
+
+
+def _bbox(obj: "LTComponent") -> Rect:
+    return (obj.x0, obj.y0, obj.x1, obj.y1)
+
+
+def _enlargement(bbox: Rect, entry: Any) -> Tuple[float, float]:
+    """How much bbox grows to also cover entry, and its area."""
+    (x0, y0, x1, y1) = bbox
+    area = (x1 - x0) * (y1 - y0)
+    grown = (max(x1, entry[2]) - min(x0, entry[0])) * (
+        max(y1, entry[3]) - min(y0, entry[1])
+    )
+    return (grown - area, area)
 
 
 ROMAN_ONES = ["i", "x", "c", "m"]
@@ -25,6 +25,7 @@ from pdfminer.layout import (
     LTItem,
     LTPage,
     LTTextContainer,
+    item_state,
 )
 from pdfminer.pdfinterp import PDFPageInterpreter, PDFStackT
 from pdfminer.pdfpage import PDFPage
@@ -74,6 +75,33 @@ ALL_ATTRS = set(
 )
 
 
+# The char attributes built by Page.text_chars; a subset of what
+# Page.process_object produces for an LTChar.
+TEXT_CHAR_ATTRS = frozenset(
+    [
+        "object_type",
+        "page_number",
+        "text",
+        "fontname",
+        "size",
+        "adv",
+        "upright",
+        "matrix",
+        "x0",
+        "x1",
+        "y0",
+        "y1",
+        "top",
+        "bottom",
+        "doctop",
+        "width",
+        "height",
+        "mcid",
+        "tag",
+    ]
+)
+
+
 if TYPE_CHECKING:  # pragma: nocover
     from .display import PageImage
     from .pdf import PDF
@@ -89,6 +117,73 @@ CP936_FONTNAMES = {
 }
 
 
+# The attributes of an LTChar in the order in which pdfminer sets them,
+# which is the order its __dict__ had before they moved to slots
+CHAR_ATTR_ORDER = (
+    "matrix",
+    "fontname",
+    "adv",
+    "upright",
+    "x0",
+    "y0",
+    "x1",
+    "y1",
+    "width",
+    "height",
+    "size",
+    "mcid",
+    "tag",
+)
+
+
+@lru_cache(maxsize=None)
+def _slot_attrs(cls: type) -> Tuple[Tuple[str, bool], ...]:
+    """The ALL_ATTRS among the __slots__ and properties of `cls`, in the
+    order in which pdfminer sets them, each with whether it is a property.
+    """
+    names: List[Tuple[str, bool]] = []
+    for klass in reversed(cls.__mro__):
+        names.extend(
+            (name, False)
+            for name in klass.__dict__.get("__slots__", ())
+            if name in ALL_ATTRS
+        )
+        names.extend(
+            (name, True)
+            for (name, value) in klass.__dict__.items()
+            if name in ALL_ATTRS and isinstance(value, property)
+        )
+    if issubclass(cls, LTChar):
+        names.sort(
+            key=lambda item: (
+                CHAR_ATTR_ORDER.index(item[0])
+                if item[0] in CHAR_ATTR_ORDER
+                else len(CHAR_ATTR_ORDER)
+            )
+        )
+    return tuple(names)
+
+
+def _object_attrs(obj: LTItem) -> List[Tuple[str, Any]]:
+    """The attributes of `obj`, those in slots and properties first."""
+    names = _slot_attrs(obj.__class__)
+    (instance_dict, slots) = item_state(obj)
+    if slots is None:  # Python < 3.11
+        items = [
+            (name, getattr(obj, name)) for (name, _) in names if hasattr(obj, name)
+        ]
+        items.extend((instance_dict or {}).items())
+        return items
+    items = [
+        (name, getattr(obj, name) if is_property else slots[name])
+        for (name, is_property) in names
+        if is_property or name in slots
+    ]
+    if instance_dict:
+        items.extend(instance_dict.items())
+    return items
+
+
 def fix_fontname_bytes(fontname: bytes) -> str:
     if b"+" in fontname:
         split_at = fontname.index(b"+") + 1
@@ -184,7 +279,10 @@ def _invert_box(box_raw: T_bbox, mb_height: T_num) -> T_bbox:
 
 
 class Page(Container):
-    cached_properties: List[str] = Container.cached_properties + ["_layout"]
+    cached_properties: List[str] = Container.cached_properties + [
+        "_layout",
+        "_text_chars",
+    ]
     is_original: bool = True
     pages = None
 
@@ -260,6 +358,7 @@ class Page(Container):
             self.pdf.rsrcmgr,
             pageno=self.page_number,
             laparams=self.pdf.laparams,
+            cache=self.pdf.layout_cache,
         )
         interpreter = PDFPageInterpreter(self.pdf.rsrcmgr, device)
         try:
@@ -361,7 +460,7 @@ class Page(Container):
             else:
                 return None
 
-        attr = dict(filter(None, map(process_attr, obj.__dict__.items())))
+        attr = dict(filter(None, map(process_attr, _object_attrs(obj))))
 
         attr["object_type"] = kind
         attr["page_number"] = self.page_number
@@ -449,6 +548,75 @@ class Page(Container):
             objects[kind].append(obj)
         return objects
 
+    @property
+    def text_chars(self) -> T_obj_list:
+        """
+        The page's chars, with only the attributes in TEXT_CHAR_ATTRS.
+
+        Text extraction needs little more than each char's text and position,
+        so these are built straight from the LTChars, skipping the generic
+        conversion in .objects (attribute filtering, resolve_all, colors) and
+        every non-char object. Once .objects has been parsed anyway, .chars is
+        returned instead.
+        """
+        if hasattr(self, "_objects"):
+            return self.chars
+        if hasattr(self, "_text_chars"):
+            return self._text_chars
+        self._text_chars: T_obj_list = self.parse_text_chars()
+        return self._text_chars
+
+    def iter_layout_chars(
+        self, layout_objects: List[LTComponent]
+    ) -> Generator[LTChar, None, None]:
+        for obj in layout_objects:
+            if isinstance(obj, LTChar):
+                yield obj
+            elif isinstance(obj, LTContainer):
+                yield from self.iter_layout_chars(obj._objs)
+
+    def parse_text_chars(self) -> T_obj_list:
+        # Same values as process_object, in the same order as .chars
+        page_number = self.page_number
+        initial_doctop = self.initial_doctop
+        height = self.height
+        mb_x0, mb_top = self.mediabox[:2]
+        unicode_norm = self.pdf.unicode_norm
+
+        chars: T_obj_list = []
+        for obj in self.iter_layout_chars(self.layout._objs):
+            text = obj.get_text()
+            if unicode_norm is not None:
+                text = normalize_unicode(unicode_norm, text)
+            fontname = obj.fontname
+            if isinstance(fontname, bytes):  # pragma: nocover
+                fontname = fix_fontname_bytes(fontname)
+            top = (height - obj.y1) + mb_top
+            chars.append(
+                {
+                    "object_type": "char",
+                    "page_number": page_number,
+                    "text": text,
+                    "fontname": fontname,
+                    "size": obj.size,
+                    "adv": obj.adv,
+                    "upright": obj.upright,
+                    "matrix": obj.matrix,
+                    "x0": obj.x0 + mb_x0,
+                    "x1": obj.x1 + mb_x0,
+                    "y0": obj.y0,
+                    "y1": obj.y1,
+                    "top": top,
+                    "bottom": (height - obj.y0) + mb_top,
+                    "doctop": initial_doctop + top,
+                    "width": obj.width,
+                    "height": obj.height,
+                    "mcid": getattr(obj, "mcid", None),
+                    "tag": getattr(obj, "tag", None),
+                }
+            )
+        return chars
+
     def debug_tablefinder(
         self, table_settings: Optional[T_table_settings] = None
     ) -> TableFinder:
@@ -496,6 +664,9 @@ class Page(Container):
             return table.extract(**(tset.text_settings or {}))
 
     def _get_textmap(self, **kwargs: Any) -> TextMap:
+        return self._chars_to_textmap(self.chars, **kwargs)
+
+    def _chars_to_textmap(self, chars: T_obj_list, **kwargs: Any) -> TextMap:
         defaults: Dict[str, Any] = dict(
             layout_bbox=self.bbox,
         )
@@ -504,7 +675,7 @@ class Page(Container):
         if "layout_height_chars" not in kwargs:
             defaults.update({"layout_height": self.height})
         full_kwargs: Dict[str, Any] = {**defaults, **kwargs}
-        return utils.chars_to_textmap(self.chars, **full_kwargs)
+        return utils.chars_to_textmap(chars, **full_kwargs)
 
     def search(
         self,
@@ -527,7 +698,13 @@ class Page(Container):
         )
 
     def extract_text(self, **kwargs: Any) -> str:
-        return self.get_textmap(**tuplify_list_kwargs(kwargs)).as_string
+        kwargs = tuplify_list_kwargs(kwargs)
+        extra_attrs = kwargs.get("extra_attrs") or ()
+        # Use the lean .text_chars unless the full objects already exist (or
+        # are needed for extra_attrs); the result is the same either way.
+        if hasattr(self, "_objects") or not TEXT_CHAR_ATTRS.issuperset(extra_attrs):
+            return self.get_textmap(**kwargs).as_string
+        return self._chars_to_textmap(self.text_chars, **kwargs).as_string
 
     def extract_text_simple(self, **kwargs: Any) -> str:
         return utils.extract_text_simple(self.chars, **kwargs)
@@ -713,6 +890,15 @@ class CroppedPage(DerivedPage):
         }
         return self._objects
 
+    @property
+    def text_chars(self) -> T_obj_list:
+        if hasattr(self, "_objects"):
+            return self.chars
+        if hasattr(self, "_text_chars"):
+            return self._text_chars
+        self._text_chars: T_obj_list = self._crop_fn(self.parent_page.text_chars)
+        return self._text_chars
+
 
 class FilteredPage(DerivedPage):
     def __init__(self, parent_page: Page, filter_fn: Callable[[T_obj], bool]):
@@ -729,3 +915,8 @@ class FilteredPage(DerivedPage):
             for k, v in self.parent_page.objects.items()
         }
         return self._objects
+
+    @property
+    def text_chars(self) -> T_obj_list:
+        # filter_fn may look at any attribute, so always use the full chars
+        return self.chars
@@ -6,6 +6,7 @@ from types import TracebackType
 from typing import Any, Dict, Generator, List, Literal, Optional, Tuple, Type, Union
 
 from pdfminer.layout import LAParams
+from pdfminer.layoutcache import LayoutCache
 from pdfminer.pdfdocument import PDFDocument
 from pdfminer.pdfinterp import PDFResourceManager
 from pdfminer.pdfpage import PDFPage
@@ -36,6 +37,7 @@ class PDF(Container):
         strict_metadata: bool = False,
         unicode_norm: Optional[Literal["NFC", "NFKC", "NFD", "NFKD"]] = None,
         raise_unicode_errors: bool = True,
+        layout_cache: Optional[LayoutCache] = None,
     ):
         self.stream = stream
         self.stream_is_external = stream_is_external
@@ -45,10 +47,13 @@ class PDF(Container):
         self.password = password
         self.unicode_norm = unicode_norm
         self.raise_unicode_errors = raise_unicode_errors
+        self.layout_cache = layout_cache
 
+        self.parser = PDFParser(stream)
         try:
-            self.doc = PDFDocument(PDFParser(stream), password=password or "")
+            self.doc = PDFDocument(self.parser, password=password or "")
         except Exception as e:
+            self.parser.close()
             raise PdfminerException(e)
         self.rsrcmgr = PDFResourceManager()
         self.metadata = {}
@@ -82,6 +87,7 @@ class PDF(Container):
         gs_path: Optional[Union[str, pathlib.Path]] = None,
         repair_setting: T_repair_setting = "default",
         raise_unicode_errors: bool = True,
+        layout_cache: Optional[LayoutCache] = None,
     ) -> "PDF":
 
         stream: Union[BufferedReader, BytesIO]
@@ -114,6 +120,7 @@ class PDF(Container):
                 unicode_norm=unicode_norm,
                 stream_is_external=stream_is_external,
                 raise_unicode_errors=raise_unicode_errors,
+                layout_cache=layout_cache,
             )
 
         except PdfminerException:
@@ -127,6 +134,9 @@ class PDF(Container):
         for page in self.pages:
             page.close()
 
+        # Releases the memory mapping of the file, if any
+        self.parser.close()
+
         if not self.stream_is_external:
             self.stream.close()
 
@@ -150,8 +160,13 @@ class PDF(Container):
         pp = self.pages_to_parse
         self._pages: List[Page] = []
 
-        def iter_pages() -> Generator[PDFPage, None, None]:
-            gen = PDFPage.create_pages(self.doc)
+        def iter_pages() -> Generator[Tuple[int, PDFPage], None, None]:
+            if pp is None:
+                gen = enumerate(PDFPage.create_pages(self.doc))
+            else:
+                # Only the selected pages are looked up in the page tree
+                pagenos = [n - 1 for n in pp if n >= 1]
+                gen = PDFPage.enumerate_pages(self.doc, pagenos)
             while True:
                 try:
                     yield next(gen)
@@ -160,10 +175,8 @@ class PDF(Container):
                 except Exception as e:
                     raise PdfminerException(e)
 
-        for i, page in enumerate(iter_pages()):
+        for i, page in iter_pages():
             page_number = i + 1
-            if pp is not None and page_number not in pp:
-                continue
             p = Page(self, page, page_number=page_number, initial_doctop=doctop)
             self._pages.append(p)
             doctop += p.height
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Compact binary question bank, built from questions.json.
+
+The bank is a build artifact kept in .pdf_cache/questions.bank; the Android
+app reads questions.json, so the bank is not shipped in its assets.
+
+Layout (all integers little-endian):
+
+    header   b'KQB1', u32 count
+    index    count x (u32 id, u32 offset, u32 length), sorted by id
+    records  one per question, at the offsets given in the index
+
+A record is:
+
+    u8  correct     ord('A')..ord('D'), or 0 for null
+    u8  n_en, n_de  number of English / German options
+    str question_en, question_de, options_en..., options_de...
+
+and every str is a u16 length followed by that many UTF-8 bytes. For options
+the top bit of the length is set when the "A) ", "B) ", ... prefix matching
+the option's position was stripped, so the common prefixes are not stored.
+
+The reader memory-maps the file and only decodes the record that is asked
+for:
+
+    bank = question_bank.QuestionBank('.pdf_cache/questions.bank')
+    bank[42]                 # -> same dict as in questions.json
+
+Convert from the shell:
+
+    python3 question_bank.py app/src/main/assets/questions.json [questions.bank]
+"""
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+
+# Where the build scripts keep the bank
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.pdf_cache', 'questions.bank')
+
+MAGIC = b'KQB1'
+HEADER = struct.Struct('<4sI')
+INDEX_ENTRY = struct.Struct('<III')
+RECORD_HEAD = struct.Struct('<BBB')
+STR_LEN = struct.Struct('<H')
+
+PREFIX_FLAG = 0x8000
+MAX_STR_LEN = PREFIX_FLAG - 1
+
+
+def _option_prefix(position):
+    return 'ABCD'[position] + ') ' if position < 4 else None
+
+
+def _pack_str(value, prefix=None):
+    flag = 0
+    if prefix and value.startswith(prefix):
+        value = value[len(prefix):]
+        flag = PREFIX_FLAG
+    data = value.encode('utf-8')
+    if len(data) > MAX_STR_LEN:
+        raise ValueError(f"string too long for the question bank ({len(data)} bytes)")
+    return STR_LEN.pack(len(data) | flag) + data
+
+
+def pack_question(question):
+    """Encode one question dict as a bank record."""
+    correct = question.get('correct')
+    options_en = question['options_en']
+    options_de = question['options_de']
+    parts = [
+        RECORD_HEAD.pack(ord(correct) if correct else 0, len(options_en), len(options_de)),
+        _pack_str(question['question_en']),
+        _pack_str(question['question_de']),
+    ]
+    for options in (options_en, options_de):
+        for position, option in enumerate(options):
+            parts.append(_pack_str(option, _option_prefix(position)))
+    return b''.join(parts)
+
+
+def unpack_question(q_id, buf, offset=0):
+    """Decode the record starting at `offset` in `buf`."""
+    correct, n_en, n_de = RECORD_HEAD.unpack_from(buf, offset)
+    offset += RECORD_HEAD.size
+
+    def read_str(prefix=None):
+        nonlocal offset
+        (length,) = STR_LEN.unpack_from(buf, offset)
+        offset += STR_LEN.size
+        size = length & MAX_STR_LEN
+        value = bytes(buf[offset:offset + size]).decode('utf-8')
+        offset += size
+        if length & PREFIX_FLAG:
+            value = prefix + value
+        return value
+
+    question_en = read_str()
+    question_de = read_str()
+    options_en = [read_str(_option_prefix(i)) for i in range(n_en)]
+    options_de = [read_str(_option_prefix(i)) for i in range(n_de)]
+    return {
+        'id': q_id,
+        'question_en': question_en,
+        'question_de': question_de,
+        'options_en': options_en,
+        'options_de': options_de,
+        'correct': chr(correct) if correct else None,
+    }
+
+
+def write_bank(questions, path):
+    """Write `questions` (dicts in questions.json format) to a bank file."""
+    records = sorted((q['id'], pack_question(q)) for q in questions)
+    offset = HEADER.size + INDEX_ENTRY.size * len(records)
+    index = []
+    for q_id, record in records:
+        index.append(INDEX_ENTRY.pack(q_id, offset, len(record)))
+        offset += len(record)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(records)))
+        f.write(b''.join(index))
+        f.write(b''.join(record for _, record in records))
+    os.replace(tmp_path, path)
+
+
+class QuestionBank:
+    """Random access to a bank file without decoding the other records."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self._buf = b''
+        if len(self._buf) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a question bank")
+        magic, count = HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a question bank")
+        self._count = count
+
+    def _entry(self, position):
+        return INDEX_ENTRY.unpack_from(self._buf, HEADER.size + position * INDEX_ENTRY.size)
+
+    def _find(self, q_id):
+        """The index entry of `q_id`, or None; only the entries bisected are read."""
+        position = bisect.bisect_left(range(self._count), q_id, key=lambda i: self._entry(i)[0])
+        if position < self._count:
+            entry = self._entry(position)
+            if entry[0] == q_id:
+                return entry
+        return None
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, q_id):
+        return self._find(q_id) is not None
+
+    def __getitem__(self, q_id):
+        entry = self._find(q_id)
+        if entry is None:
+            raise KeyError(q_id)
+        _, offset, _ = entry
+        return unpack_question(q_id, self._buf, offset)
+
+    def get(self, q_id, default=None):
+        try:
+            return self[q_id]
+        except KeyError:
+            return default
+
+    def ids(self):
+        return [self._entry(position)[0] for position in range(self._count)]
+
+    def __iter__(self):
+        for position in range(self._count):
+            q_id, offset, _ = self._entry(position)
+            yield unpack_question(q_id, self._buf, offset)
+
+    def close(self):
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(f"Usage: {sys.argv[0]} questions.json [questions.bank]")
+        sys.exit(1)
+
+    json_path = sys.argv[1]
+    bank_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    write_bank(questions, bank_path)
+
+    json_size = os.path.getsize(json_path)
+    bank_size = os.path.getsize(bank_path)
+    print(f"✅ Wrote {len(questions)} questions to {bank_path}")
+    print(f"   {json_size} bytes JSON -> {bank_size} bytes bank ({bank_size / json_size:.0%})")
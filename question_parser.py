@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Streaming parser for the KLCP question catalog and solutions PDFs.
+
+The parser consumes page texts one at a time and yields every question as
+soon as its block is complete, so only the block being read is kept in
+memory. Blocks may span page boundaries; the `===PAGE_BREAK===` marker that
+create_perfect_json.py used to insert between pages is ignored.
+
+`iter_questions_from_layout` does the same from the cached char data of
+pdf_cache, using line geometry and the bold headers instead of flattened text.
+
+    import pdf_cache
+    import question_parser
+
+    pages = pdf_cache.iter_page_texts('KLCP_Fragenkatalog.pdf')
+    for question in question_parser.iter_questions(pages):
+        ...
+"""
+import json
+import re
+
+PAGE_BREAK = '===PAGE_BREAK==='
+
+# "Question 12" / "Frage 12" on a line of its own. The catalog font has no
+# digit glyphs, so the number usually comes out as NUL characters, and a few
+# German headers still contain the template placeholder.
+HEADER_RE = re.compile(r'^(?P<kind>Question|Frage)(?:\s+(?:(?P<number>[\d\x00]+)|\{.*\}))?$', re.IGNORECASE)
+OPTION_RE = re.compile(r'^[A-D]\)')
+CHAPTER_RE = re.compile(r'^KLCP (?:Exam Questions|Prüfungsfragen)\b')
+ANSWER_RE = re.compile(r'Correct\s+Answer:\s+([A-D])', re.IGNORECASE)
+
+# Gap between two lines, in multiples of the font size, above which the
+# second line starts a new paragraph (see `_starts_paragraph`).
+PARAGRAPH_GAP = 0.9
+
+
+def iter_lines(page_texts):
+    """Yield the stripped, non-empty lines of every page, dropping page-break markers."""
+    for text in page_texts:
+        if not text:
+            continue
+        for line in text.split('\n'):
+            line = line.strip()
+            if line and line != PAGE_BREAK:
+                yield line
+
+
+class _Block:
+    """The question currently being read."""
+
+    def __init__(self):
+        self.question = {'en': [], 'de': []}
+        self.options = {'en': [], 'de': []}
+
+    def add_line(self, lang, line):
+        options = self.options[lang]
+        if OPTION_RE.match(line) and len(options) < 4:
+            options.append(line)
+        elif options:
+            # Continuation of a wrapped option.
+            options[-1] += ' ' + line
+        else:
+            self.question[lang].append(line)
+
+    def is_next_option(self, lang, line):
+        """Whether `line` starts with the label of the next expected option."""
+        options = self.options[lang]
+        return len(options) < 4 and line.startswith('ABCD'[len(options)] + ')')
+
+    def continue_line(self, lang, line):
+        """Append a wrapped line to whatever was added last."""
+        target = self.options[lang] or self.question[lang]
+        if target:
+            target[-1] += ' ' + line
+        else:
+            target.append(line)
+
+    def to_dict(self):
+        return {
+            'question_en': ' '.join(self.question['en']),
+            'question_de': ' '.join(self.question['de']),
+            'options_en': self.options['en'],
+            'options_de': self.options['de'],
+        }
+
+
+def iter_questions(page_texts):
+    """
+    Yield a dict per "Question" block in the catalog.
+
+    Each dict has question_en, question_de, options_en and options_de. Wrapped
+    question and option lines are joined with a space. Chapter title lines
+    between blocks are skipped.
+    """
+    block = None
+    lang = None
+    for line in iter_lines(page_texts):
+        header = HEADER_RE.match(line)
+        if header:
+            if header.group('kind').lower() == 'question':
+                if block is not None:
+                    yield block.to_dict()
+                block = _Block()
+                lang = 'en'
+            elif block is not None:
+                lang = 'de'
+        elif CHAPTER_RE.match(line):
+            lang = None
+        elif block is not None and lang is not None:
+            block.add_line(lang, line)
+
+    if block is not None:
+        yield block.to_dict()
+
+
+def iter_layout_lines(page):
+    """
+    Yield the text lines of a cached page record with their geometry.
+
+    Each line is a dict with text, x0, top, bottom, size and bold, built from
+    the cached chars with pdfplumber's word extractor.
+    """
+    from operator import itemgetter
+
+    import pdf_cache
+    from pdfplumber.utils import DEFAULT_Y_TOLERANCE, cluster_objects, extract_words
+
+    words = extract_words(pdf_cache.page_chars(page), return_chars=True)
+    for line_words in cluster_objects(words, itemgetter('top'), DEFAULT_Y_TOLERANCE):
+        line_words.sort(key=itemgetter('x0'))
+        first = line_words[0]['chars'][0]
+        yield {
+            'text': ' '.join(w['text'] for w in line_words),
+            'x0': line_words[0]['x0'],
+            'top': min(w['top'] for w in line_words),
+            'bottom': max(w['bottom'] for w in line_words),
+            'size': first['size'],
+            'bold': 'bold' in first['fontname'].lower(),
+        }
+
+
+def _starts_paragraph(line, previous):
+    """
+    Whether `line` starts a new paragraph rather than wrapping `previous`.
+
+    Wrapped lines follow at roughly half a line of leading; on most pages the
+    question and every option are separated by more than one and a half. A
+    line indented past the previous one is always a continuation.
+    """
+    if previous is None:
+        return True
+    if line['x0'] > previous['x0'] + 1:
+        return False
+    return line['top'] - previous['bottom'] > PARAGRAPH_GAP * line['size']
+
+
+def iter_questions_from_layout(pages):
+    """
+    Yield a dict per "Question" block, segmented by geometry.
+
+    `pages` are pdf_cache page records. Headers are the bold "Question" /
+    "Frage" lines, other bold lines are chapter titles. Body lines are grouped
+    into paragraphs by line spacing and indent; on tightly set pages a line
+    opening with the next expected option label ("A)", then "B)", ...) also
+    starts a paragraph. An option or question that wraps therefore stays one
+    entry, even if a wrapped line happens to start with another label.
+    The dicts have the same keys as those of `iter_questions`.
+    """
+    block = None
+    lang = None
+    for page in pages:
+        previous = None
+        for line in iter_layout_lines(page):
+            text = line['text'].strip()
+            if line['bold']:
+                previous = None
+                header = HEADER_RE.match(text)
+                if not header:
+                    lang = None
+                elif header.group('kind').lower() == 'question':
+                    if block is not None:
+                        yield block.to_dict()
+                    block = _Block()
+                    lang = 'en'
+                elif block is not None:
+                    lang = 'de'
+                continue
+
+            if block is not None and lang is not None:
+                if _starts_paragraph(line, previous) or block.is_next_option(lang, text):
+                    block.add_line(lang, text)
+                else:
+                    block.continue_line(lang, text)
+            previous = line
+
+    if block is not None:
+        yield block.to_dict()
+
+
+def iter_numbered_answers(page_texts):
+    """
+    Yield (number, letter) for the first "Correct Answer: X" of every block.
+
+    The number is taken from the "Question N" header. Where the PDF font has
+    no digit glyphs the header number is unreadable, and the block's position
+    in the document (1, 2, ...) is used instead.
+    """
+    ordinal = 0
+    number = None
+    previous = ''
+    for line in iter_lines(page_texts):
+        header = HEADER_RE.match(line)
+        if header and header.group('kind').lower() == 'question':
+            ordinal += 1
+            digits = header.group('number') or ''
+            number = int(digits) if digits.isdigit() else ordinal
+            previous = ''
+            continue
+        if number is None:
+            continue
+        # Search together with the previous line in case the phrase wrapped.
+        match = ANSWER_RE.search(previous + ' ' + line)
+        if match:
+            yield number, match.group(1).upper()
+            number = None
+        previous = line
+
+
+def iter_answers(page_texts):
+    """Yield the first "Correct Answer: X" letter of every "Question" block."""
+    for _, letter in iter_numbered_answers(page_texts):
+        yield letter
+
+
+def dump_json_array(items, f):
+    """
+    Write `items` to `f` as a JSON array, one item at a time.
+
+    The output is identical to json.dump(list(items), f, indent=2,
+    ensure_ascii=False), but the first entry is written before the last one
+    has been produced.
+    """
+    first = True
+    for item in items:
+        f.write('[\n  ' if first else ',\n  ')
+        f.write(json.dumps(item, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        first = False
+    f.write('[]' if first else '\n]')
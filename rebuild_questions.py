@@ -1,82 +1,24 @@
 #!/usr/bin/env python3
 import json
-import pdfplumber
-import re
+import pdf_cache
+import question_parser
 
 print("📖 Extracting questions from KLCP_Fragenkatalog.pdf...")
 
-# Extract questions from catalog
+# Extract questions from catalog, segmented by page geometry
 questions_list = []
-with pdfplumber.open('KLCP_Fragenkatalog.pdf') as pdf:
-    full_text = ''
-    for page in pdf.pages:
-        full_text += page.extract_text() + '\n\n'
-    
-    # Split by "Question" blocks
-    blocks = re.split(r'\bQuestion\s+', full_text, flags=re.IGNORECASE)
-    
-    for block in blocks[1:]:  # Skip first empty part
-        lines = [l.strip() for l in block.split('\n') if l.strip()]
-        if len(lines) < 5:
-            continue
-            
-        # Extract English question (first non-empty line)
-        question_en = lines[0]
-        
-        # Extract options A-D (English)
-        options_en = []
-        for line in lines[1:]:
-            if line.startswith(('A)', 'B)', 'C)', 'D)')):
-                options_en.append(line)
-            if len(options_en) == 4:
-                break
-        
-        # Extract German question (after "Frage")
-        question_de = ""
-        options_de = []
-        frage_idx = -1
-        for i, line in enumerate(lines):
-            if line.lower().startswith('frage'):
-                frage_idx = i
-                break
-        
-        if frage_idx >= 0 and frage_idx + 1 < len(lines):
-            question_de = lines[frage_idx + 1]
-            
-            # Get German options
-            for line in lines[frage_idx + 2:]:
-                if line.startswith(('A)', 'B)', 'C)', 'D)')):
-                    options_de.append(line)
-                if len(options_de) == 4:
-                    break
-        
-        if len(options_en) == 4:
-            questions_list.append({
-                'question_en': question_en,
-                'question_de': question_de,
-                'options_en': options_en,
-                'options_de': options_de
-            })
+pages = pdf_cache.load_pages('KLCP_Fragenkatalog.pdf', workers=None)
+for question in question_parser.iter_questions_from_layout(pages):
+    if len(question['options_en']) == 4:
+        questions_list.append(question)
 
 print(f"✅ Extracted {len(questions_list)} questions")
 
 print("\n📖 Extracting answers from KLCP_Loesungen.pdf...")
 
-# Extract answers from solutions
-answers_list = []
-with pdfplumber.open('KLCP_Loesungen.pdf') as pdf:
-    full_text = ''
-    for page in pdf.pages:
-        full_text += page.extract_text() + '\n\n'
-    
-    # Split by "Question" blocks
-    blocks = re.split(r'\bQuestion\s+', full_text, flags=re.IGNORECASE)
-    
-    for block in blocks[1:]:
-        # Find first "Correct Answer: X"
-        match = re.search(r'Correct\s+Answer:\s+([A-D])', block, re.IGNORECASE)
-        if match:
-            answers_list.append(match.group(1).upper())
+# Extract answers from solutions: the first "Correct Answer: X" of every "Question" block
+page_texts = pdf_cache.page_texts('KLCP_Loesungen.pdf', workers=None)
+answers_list = list(question_parser.iter_answers(page_texts))
 
 print(f"✅ Extracted {len(answers_list)} answers")
 
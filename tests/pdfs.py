@@ -0,0 +1,39 @@
+"""Builds small PDF files for the tests, object by object."""
+
+
+def stream(attrs, data):
+    """The body of a stream object with dictionary entries `attrs`."""
+    return b'<< %s /Length %d >>\nstream\n%s\nendstream' % (attrs, len(data), data)
+
+
+def build_pdf(objects, startxref=True):
+    """A PDF of `objects`, the bodies of objects 1, 2, ..., with 1 the catalog.
+
+    With startxref=False the trailer points nowhere, so pdfminer has to
+    rebuild the cross-reference table by scanning the file.
+    """
+    out = b'%PDF-1.4\n'
+    offsets = []
+    for objid, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (objid, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\n' % (len(objects) + 1)
+    out += b'startxref\n%d\n%%%%EOF\n' % (xref if startxref else len(out) + 12345)
+    return out
+
+
+FONT = b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+
+
+def text_content(text):
+    return stream(b'', b'BT /F1 12 Tf 20 150 Td (%s) Tj ET' % text)
+
+
+def page(parent, contents, font, extra=b''):
+    """A page object whose text uses `font` as /F1."""
+    return (b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 200 200] '
+            b'/Resources << /Font << /F1 %d 0 R >> %s >> /Contents %d 0 R >>'
+            % (parent, font, extra, contents))
@@ -0,0 +1,107 @@
+"""Tests for answer_key, run from the repository root so that it is importable."""
+import json
+import os
+
+import pytest
+
+import answer_key
+import pdf_cache
+
+from pdfs import FONT, build_pdf, page, stream
+
+
+def lines_content(lines):
+    ops = b' 0 -14 Td '.join(b'(%s) Tj' % line for line in lines)
+    return stream(b'', b'BT /F1 10 Tf 20 180 Td %s ET' % ops)
+
+
+def write_solutions(path, answers):
+    """A solutions PDF with a page per question and its answer."""
+    count = len(answers)
+    kids = b' '.join(b'%d 0 R' % (4 + n) for n in range(count))
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, count),
+        FONT,
+    ]
+    objects += [page(2, 4 + count + n, 3) for n in range(count)]
+    objects += [
+        lines_content([b'Question %d' % number, b'Correct Answer: %s' % letter.encode()])
+        for number, letter in answers.items()
+    ]
+    path.write_bytes(build_pdf(objects))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'cache'
+    monkeypatch.setattr(pdf_cache, 'CACHE_DIR', str(directory))
+    return directory
+
+
+def test_load_builds_and_then_reads_the_index(tmp_path, cache_dir, monkeypatch):
+    path = tmp_path / 'solutions.pdf'
+    write_solutions(path, {1: 'B', 2: 'D', 3: 'A'})
+
+    key = answer_key.AnswerKey.load(str(path))
+    assert key.answers == {1: 'B', 2: 'D', 3: 'A'}
+    (index,) = [name for name in os.listdir(cache_dir) if name.endswith('.answers.json')]
+    assert index.startswith(pdf_cache.file_hash(str(path)))
+    assert json.loads((cache_dir / index).read_text(encoding='utf-8')) == {'1': 'B', '2': 'D', '3': 'A'}
+
+    # The second load doesn't look at the pages
+    def no_pages(*args, **kwargs):
+        raise AssertionError('the PDF was parsed again')
+
+    monkeypatch.setattr(pdf_cache, 'iter_page_texts', no_pages)
+    key = answer_key.AnswerKey.load(str(path))
+    assert key.answers == {1: 'B', 2: 'D', 3: 'A'}
+    assert (key[2], 2 in key, 4 in key, key.get(4, '-'), len(key)) == ('D', True, False, '-', 3)
+
+
+def test_load_rebuilds_when_the_pdf_changes(tmp_path, cache_dir):
+    path = tmp_path / 'solutions.pdf'
+    write_solutions(path, {1: 'B', 2: 'D'})
+    assert answer_key.AnswerKey.load(str(path)).answers == {1: 'B', 2: 'D'}
+    write_solutions(path, {1: 'C', 2: 'D', 3: 'A'})
+    assert answer_key.AnswerKey.load(str(path)).answers == {1: 'C', 2: 'D', 3: 'A'}
+    assert len([name for name in os.listdir(cache_dir) if name.endswith('.answers.json')]) == 2
+
+
+def test_corrupt_index_is_rebuilt(tmp_path, cache_dir):
+    path = tmp_path / 'solutions.pdf'
+    write_solutions(path, {1: 'B'})
+    answer_key.AnswerKey.load(str(path))
+    (index,) = [name for name in os.listdir(cache_dir) if name.endswith('.answers.json')]
+    (cache_dir / index).write_text('{"1": ', encoding='utf-8')
+    assert answer_key.AnswerKey.load(str(path)).answers == {1: 'B'}
+    assert json.loads((cache_dir / index).read_text(encoding='utf-8')) == {'1': 'B'}
+
+
+def test_load_without_cache_writes_nothing(tmp_path, cache_dir):
+    path = tmp_path / 'solutions.pdf'
+    write_solutions(path, {1: 'B'})
+    assert answer_key.AnswerKey.load(str(path), use_cache=False).answers == {1: 'B'}
+    assert not cache_dir.exists()
+
+
+def test_first_answer_per_number_wins():
+    pages = ['Question 1\nCorrect Answer: A\nQuestion 1\nCorrect Answer: B\nQuestion 2\nCorrect Answer: C']
+    assert answer_key.AnswerKey.from_page_texts(pages).answers == {1: 'A', 2: 'C'}
+
+
+def test_diff():
+    key = answer_key.AnswerKey({1: 'A', 2: 'B', 3: 'C'})
+    questions = [
+        {'id': 3, 'question_en': 'Third?', 'correct': 'D'},
+        {'id': 1, 'question_en': 'First?', 'correct': 'A'},
+        {'id': 2, 'question_en': 'Second?', 'correct': 'A'},
+        # Not in the key
+        {'id': 4, 'question_en': 'Fourth?', 'correct': 'A'},
+    ]
+    assert key.diff(questions) == [
+        {'id': 2, 'json_answer': 'A', 'pdf_answer': 'B', 'question': 'Second?'},
+        {'id': 3, 'json_answer': 'D', 'pdf_answer': 'C', 'question': 'Third?'},
+    ]
+    assert key.diff(questions[1:2]) == []
+    assert key.diff([]) == []
@@ -0,0 +1,124 @@
+"""Tests for catalog_build, run from the repository root so that it is importable."""
+import json
+import os
+
+import pytest
+
+import catalog_build
+
+
+def make_questions(count, changes=None):
+    questions = []
+    for q_id in range(1, count + 1):
+        question = {
+            'id': q_id,
+            'question_en': f'Question {q_id}?',
+            'question_de': f'Frage {q_id}?',
+            'options_en': ['A) a', 'B) b', 'C) c', 'D) d'],
+            'options_de': ['A) ä', 'B) b', 'C) c', 'D) d'],
+            'correct': 'A',
+        }
+        question.update((changes or {}).get(q_id, {}))
+        questions.append(question)
+    return questions
+
+
+@pytest.fixture
+def build(tmp_path):
+    output = tmp_path / 'questions.json'
+    manifest = tmp_path / 'cache' / 'questions.manifest.json'
+
+    def write(questions, sources=None):
+        # A generator, like the questions of create_perfect_json.py
+        return catalog_build.write_incremental(
+            (q for q in questions), str(output), sources=sources, manifest_file=str(manifest))
+
+    write.output = output
+    write.manifest = manifest
+    return write
+
+
+def read(path):
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def hand_fix(path, q_id, correct):
+    """Change an answer in the file itself, like corrections.py does."""
+    questions = read(path)
+    for question in questions:
+        if question['id'] == q_id:
+            question['correct'] = correct
+    path.write_text(json.dumps(questions, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def test_first_build_writes_everything(build):
+    questions = make_questions(3)
+    assert build(questions, sources={'a.pdf': ['h1', 'h2']}) == [1, 2, 3]
+    assert read(build.output) == questions
+    assert build.output.read_text(encoding='utf-8') == json.dumps(questions, indent=2, ensure_ascii=False)
+    manifest = read(build.manifest)
+    assert manifest['sources'] == {'a.pdf': ['h1', 'h2']}
+    assert manifest['questions'] == {str(q['id']): catalog_build.question_hash(q) for q in questions}
+    assert not os.path.exists(str(build.output) + '.tmp')
+
+
+def test_unchanged_questions_are_not_rewritten(build):
+    build(make_questions(3))
+    hand_fix(build.output, 2, 'D')
+    before = build.output.read_bytes()
+    stat = os.stat(build.output)
+    assert build(make_questions(3)) == []
+    assert os.stat(build.output).st_mtime_ns == stat.st_mtime_ns
+    assert build.output.read_bytes() == before
+    assert not os.path.exists(str(build.output) + '.tmp')
+
+
+def test_changed_question_is_patched(build):
+    build(make_questions(4))
+    hand_fix(build.output, 1, 'C')
+    changed = make_questions(4, {3: {'question_en': 'Question 3, reworded?'}})
+    assert build(changed[:3] + make_questions(5)[4:]) == [3, 5, 4]
+    result = {q['id']: q for q in read(build.output)}
+    assert sorted(result) == [1, 2, 3, 5]
+    # The fix of an unchanged entry survives, the changed one is replaced
+    assert result[1]['correct'] == 'C'
+    assert result[3]['question_en'] == 'Question 3, reworded?'
+    assert read(build.manifest)['questions']['3'] == catalog_build.question_hash(changed[2])
+
+
+def test_missing_manifest_forces_a_full_rewrite(build):
+    build(make_questions(3))
+    hand_fix(build.output, 2, 'D')
+    build.manifest.unlink()
+    assert build(make_questions(3)) == [1, 2, 3]
+    assert read(build.output) == make_questions(3)
+
+
+@pytest.mark.parametrize('stale', ['other_output', 'other_ids', 'old_format', 'corrupt'])
+def test_stale_manifest_forces_a_full_rewrite(build, stale):
+    build(make_questions(3))
+    hand_fix(build.output, 2, 'D')
+    if stale == 'other_ids':
+        # The file was replaced since the manifest was written
+        questions = read(build.output) + make_questions(4)[3:]
+        build.output.write_text(json.dumps(questions), encoding='utf-8')
+    elif stale == 'corrupt':
+        build.manifest.write_text('{"questions": ', encoding='utf-8')
+    else:
+        manifest = read(build.manifest)
+        if stale == 'other_output':
+            manifest['output'] = str(build.output) + '.old'
+        else:
+            manifest['format'] = catalog_build.MANIFEST_FORMAT - 1
+        build.manifest.write_text(json.dumps(manifest), encoding='utf-8')
+
+    changed = build(make_questions(3))
+    assert changed == ([1, 2, 3, 4] if stale == 'other_ids' else [1, 2, 3])
+    assert read(build.output) == make_questions(3)
+    # The next build is incremental again
+    assert build(make_questions(3)) == []
+
+
+def test_full_rewrite_without_questions_writes_an_empty_array(build):
+    assert build([]) == []
+    assert read(build.output) == []
@@ -0,0 +1,101 @@
+"""Tests for the compiled CMaps of pdfminer.cmapdb."""
+import gzip
+import os
+import pickle
+import random
+
+import pytest
+from pdfminer.cmapdb import (
+    CMapDB,
+    MappedCMap,
+    MappedUnicodeMap,
+    PyCMap,
+    PyUnicodeMap,
+)
+
+CMAPS = ['90ms-RKSJ-H', 'UniJIS-UCS2-V', 'GBK-EUC-H', 'UniKS-UTF16-H', 'ETen-B5-V']
+UNICODE_MAPS = ['Adobe-Japan1', 'Adobe-GB1', 'Adobe-Korea1', 'Adobe-CNS1']
+
+
+def _codes(code2cid, prefix=b''):
+    for byte, value in code2cid.items():
+        code = prefix + bytes([byte])
+        if isinstance(value, dict):
+            yield from _codes(value, code)
+        else:
+            yield code
+
+
+@pytest.mark.parametrize('name', CMAPS)
+def test_mapped_cmap_decodes_like_the_pickle(name):
+    pickled = PyCMap(name, CMapDB._load_data(name))
+    mapped = MappedCMap(name, CMapDB._compile(name))
+    assert mapped.is_vertical() == pickled.is_vertical()
+    assert mapped.code2cid == pickled.code2cid
+
+    codes = list(_codes(pickled.code2cid))
+    rnd = random.Random(name)
+    rnd.shuffle(codes)
+    text = b''.join(codes[:5000])
+    assert list(mapped.decode(text)) == list(pickled.decode(text))
+    # Bytes that start no code, and codes cut short
+    noise = bytes(rnd.randrange(256) for _ in range(5000))
+    assert list(mapped.decode(noise)) == list(pickled.decode(noise))
+
+
+@pytest.mark.parametrize('name', UNICODE_MAPS)
+def test_mapped_unicode_map_decodes_like_the_pickle(name):
+    data = CMapDB._load_data('to-unicode-%s' % name)
+    buf = CMapDB._compile('to-unicode-%s' % name)
+    for vertical in (False, True):
+        pickled = PyUnicodeMap(name, data, vertical)
+        mapped = MappedUnicodeMap(name, buf, vertical)
+        assert mapped.is_vertical() == pickled.is_vertical()
+        for cid in range(max(pickled.cid2unichr) + 10):
+            if cid in pickled.cid2unichr:
+                assert mapped.get_unichr(cid) == pickled.get_unichr(cid)
+            else:
+                with pytest.raises(KeyError):
+                    mapped.get_unichr(cid)
+        assert mapped.cid2unichr == pickled.cid2unichr
+
+
+def _write_cmap(directory, code2cid):
+    with gzip.open(os.path.join(directory, 'Test-H.pickle.gz'), 'wb') as f:
+        f.write(pickle.dumps({'IS_VERTICAL': False, 'CODE2CID': code2cid}))
+
+
+@pytest.fixture
+def test_cmap(tmp_path, monkeypatch):
+    source = tmp_path / 'source'
+    source.mkdir()
+    monkeypatch.setenv('CMAP_PATH', str(source))
+    monkeypatch.delitem(CMapDB._cmap_cache, 'Test-H', raising=False)
+    yield source
+    CMapDB._cmap_cache.pop('Test-H', None)
+
+
+def test_no_cache_by_default(test_cmap, monkeypatch):
+    monkeypatch.setattr(CMapDB, 'cache_dir', None)
+    _write_cmap(test_cmap, {0x41: 1})
+    cmap = CMapDB.get_cmap('Test-H')
+    assert isinstance(cmap, PyCMap)
+    assert list(cmap.decode(b'A')) == [1]
+
+
+def test_changed_pickle_is_compiled_again(test_cmap, tmp_path, monkeypatch):
+    cache = tmp_path / 'cache'
+    monkeypatch.setattr(CMapDB, 'cache_dir', str(cache))
+    _write_cmap(test_cmap, {0x41: 1})
+    cmap = CMapDB.get_cmap('Test-H')
+    assert isinstance(cmap, MappedCMap)
+    assert list(cmap.decode(b'A')) == [1]
+
+    # Same name, older mtime, other content
+    _write_cmap(test_cmap, {0x41: 2, 0x42: 3})
+    os.utime(test_cmap / 'Test-H.pickle.gz', (0, 0))
+    CMapDB._cmap_cache.pop('Test-H')
+    cmap = CMapDB.get_cmap('Test-H')
+    assert isinstance(cmap, MappedCMap)
+    assert list(cmap.decode(b'AB')) == [2, 3]
+    assert len(os.listdir(cache)) == 2
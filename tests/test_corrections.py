@@ -0,0 +1,148 @@
+"""Tests for corrections.py, run from the repository root so that it is importable."""
+import json
+import os
+
+import pytest
+
+import corrections
+
+CORRECTIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'corrections')
+
+# The dicts the correction scripts hard-coded before they moved to corrections/*.csv
+REPLACED_DICTS = {
+    'complete_corrections.csv': {
+        6: 'C', 8: 'D', 9: 'C', 10: 'D', 11: 'B', 13: 'D', 14: 'A', 17: 'B', 19: 'C', 20: 'C',
+        21: 'B', 23: 'C', 26: 'A', 29: 'D', 30: 'B', 32: 'D', 33: 'B', 34: 'D', 35: 'A', 36: 'C',
+        37: 'A', 38: 'D', 43: 'C', 44: 'D', 46: 'D', 48: 'A', 49: 'A', 51: 'B', 55: 'B', 56: 'A',
+        59: 'B', 60: 'A', 62: 'C', 63: 'D', 64: 'B', 65: 'B', 66: 'D', 67: 'B', 68: 'D', 70: 'C',
+        71: 'C', 72: 'D', 73: 'C', 75: 'C', 76: 'D', 77: 'C', 78: 'D', 79: 'B', 80: 'D', 81: 'D',
+        86: 'C', 87: 'C', 88: 'C', 90: 'A', 93: 'B', 94: 'A', 96: 'D', 98: 'B',
+    },
+    'correct_all_answers.csv': {
+        1: 'D', 2: 'C', 3: 'C', 4: 'D', 5: 'C', 6: 'C', 7: 'C', 8: 'D', 9: 'C', 10: 'D',
+        11: 'B', 12: 'D', 13: 'D', 14: 'A', 15: 'A', 16: 'D', 17: 'B', 18: 'C', 19: 'C', 20: 'C',
+        21: 'B', 22: 'A', 23: 'C', 24: 'C', 25: 'B', 26: 'A', 27: 'D', 28: 'C', 29: 'C', 30: 'B',
+        31: 'C', 32: 'A', 33: 'D', 34: 'B', 35: 'C', 36: 'A', 37: 'D', 38: 'B', 39: 'C', 40: 'A',
+    },
+    'fix_all_375_questions.csv': {
+        6: 'C', 8: 'D', 9: 'C', 10: 'D', 11: 'B', 13: 'D', 14: 'A', 16: 'D', 17: 'B', 19: 'C',
+        20: 'C', 21: 'B', 23: 'C', 26: 'A', 29: 'D', 30: 'B', 32: 'D', 33: 'B', 34: 'D', 35: 'A',
+        36: 'C', 37: 'A', 38: 'D', 39: 'B', 40: 'C', 41: 'C', 42: 'D',
+    },
+    'manual_correct_all.csv': {
+        1: 'D', 2: 'C', 3: 'C', 4: 'D', 5: 'C', 6: 'C', 7: 'C', 8: 'D', 9: 'C', 10: 'D', 11: 'B',
+    },
+}
+
+
+def write_questions(path, answers):
+    questions = [
+        {'id': q_id, 'question_en': f'Question {q_id}', 'correct': correct}
+        for q_id, correct in answers.items()
+    ]
+    path.write_text(json.dumps(questions), encoding='utf-8')
+
+
+def read_answers(path):
+    return {q['id']: q['correct'] for q in json.loads(path.read_text(encoding='utf-8'))}
+
+
+@pytest.mark.parametrize('name', sorted(REPLACED_DICTS))
+def test_correction_sets_match_replaced_dicts(name):
+    loaded = corrections.load_correction_set(os.path.join(CORRECTIONS_DIR, name))
+    assert {c.id: c.correct for c in loaded} == REPLACED_DICTS[name]
+    assert len(loaded) == len(REPLACED_DICTS[name])
+    assert all(c.note for c in loaded)
+
+
+def test_every_correction_set_is_covered():
+    names = {name for name in os.listdir(CORRECTIONS_DIR) if name.endswith(('.csv', '.jsonl'))}
+    assert names == set(REPLACED_DICTS)
+
+
+def test_csv_and_jsonl_sets(tmp_path):
+    csv_path = tmp_path / 'a.csv'
+    csv_path.write_text('id,correct,note\n1,b,"lower case, with comma"\n#2,C,skipped\n', encoding='utf-8')
+    jsonl_path = tmp_path / 'b.jsonl'
+    jsonl_path.write_text('# comment\n\n{"id": 3, "correct": "D"}\n', encoding='utf-8')
+
+    (one,) = corrections.load_correction_set(str(csv_path))
+    assert (one.id, one.correct, one.note, one.line) == (1, 'B', 'lower case, with comma', 2)
+    (three,) = corrections.load_correction_set(str(jsonl_path))
+    assert (three.id, three.correct, three.note, three.line) == (3, 'D', '', 3)
+
+
+def test_invalid_answer_names_the_line(tmp_path):
+    path = tmp_path / 'bad.csv'
+    path.write_text('id,correct,note\n1,A,\n2,E,\n', encoding='utf-8')
+    with pytest.raises(ValueError, match=r'bad\.csv:3: invalid answer'):
+        corrections.load_correction_set(str(path))
+
+
+def test_conflicts_across_and_within_sets():
+    first = [corrections.Correction(1, 'A', source='first'), corrections.Correction(2, 'B', source='first')]
+    second = [corrections.Correction(1, 'C', source='second'), corrections.Correction(2, 'B', source='second')]
+    third = [corrections.Correction(3, 'A', source='third', line=2),
+             corrections.Correction(3, 'D', source='third', line=3)]
+
+    merged, conflicts = corrections.merge([first, second, third])
+    assert {q_id: c.correct for q_id, c in merged.items()} == {1: 'C', 2: 'B', 3: 'D'}
+    assert sorted([c.where() for c in entries] for entries in conflicts) == [
+        ['first', 'second'],
+        ['third:2', 'third:3'],
+    ]
+
+
+def test_conflicting_sets_are_refused(tmp_path):
+    questions = tmp_path / 'questions.json'
+    write_questions(questions, {1: 'A', 2: 'A'})
+    first = tmp_path / 'first.csv'
+    first.write_text('id,correct,note\n1,B,\n', encoding='utf-8')
+    second = tmp_path / 'second.csv'
+    second.write_text('id,correct,note\n1,C,\n2,D,\n', encoding='utf-8')
+
+    with pytest.raises(ValueError, match='1 conflicting corrections: Q1: B'):
+        corrections.apply_corrections([str(first), str(second)], str(questions))
+    assert corrections.main([str(first), str(second), '--questions', str(questions)]) == 1
+    assert read_answers(questions) == {1: 'A', 2: 'A'}
+
+
+def test_last_wins(tmp_path):
+    questions = tmp_path / 'questions.json'
+    write_questions(questions, {1: 'A', 2: 'A'})
+    first = tmp_path / 'first.csv'
+    first.write_text('id,correct,note\n1,B,\n', encoding='utf-8')
+    second = tmp_path / 'second.csv'
+    second.write_text('id,correct,note\n1,C,\n2,D,\n', encoding='utf-8')
+
+    assert corrections.main([str(first), str(second), '--questions', str(questions), '--last-wins']) == 0
+    assert read_answers(questions) == {1: 'C', 2: 'D'}
+
+
+def test_dry_run_writes_nothing(tmp_path, capsys):
+    questions = tmp_path / 'questions.json'
+    write_questions(questions, {1: 'A', 2: 'B'})
+    before = questions.read_bytes()
+    path = tmp_path / 'set.csv'
+    path.write_text('id,correct,note\n1,C,why\n2,B,\n9,A,\n', encoding='utf-8')
+
+    changes = corrections.apply_corrections([str(path)], str(questions), dry_run=True)
+    assert [(q['id'], old, new) for q, old, new, _ in changes] == [(1, 'A', 'C')]
+    assert corrections.main([str(path), '--questions', str(questions), '--dry-run']) == 0
+    assert questions.read_bytes() == before
+    assert not os.path.exists(str(questions) + '.tmp')
+    out = capsys.readouterr().out
+    assert 'Q9 is not in' in out
+    assert 'Dry run: 1 answers would change' in out
+
+
+def test_apply_writes_once(tmp_path):
+    questions = tmp_path / 'questions.json'
+    write_questions(questions, {1: 'A', 2: 'B'})
+    path = tmp_path / 'set.csv'
+    path.write_text('id,correct,note\n1,C,\n2,B,\n', encoding='utf-8')
+
+    changes = corrections.apply_corrections([str(path)], str(questions))
+    assert len(changes) == 1
+    assert read_answers(questions) == {1: 'C', 2: 'B'}
+    assert corrections.apply_corrections([str(path)], str(questions)) == []
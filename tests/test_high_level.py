@@ -0,0 +1,108 @@
+"""Tests for pdfminer.high_level."""
+from pdfminer.high_level import extract_pages, extract_text
+from pdfminer.layout import LTImage
+from pdfminer.pdfpage import PDFPage
+
+from pdfs import FONT, build_pdf, page, stream, text_content
+
+
+def _image_pdf():
+    content = (b'q 50 0 0 50 10 10 cm /Im1 Do Q '
+               b'q 20 0 0 20 100 100 cm BI /W 2 /H 2 /BPC 8 /CS /G ID \x00\x10\x20\x30\nEI Q '
+               b'BT /F1 12 Tf 20 150 Td (Image page) Tj ET')
+    return build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        page(2, 4, 7, extra=b'/XObject << /Im1 5 0 R >>'),
+        stream(b'', content),
+        stream(b'/Type /XObject /Subtype /Image /Width 2 /Height 2 '
+               b'/BitsPerComponent 8 /ColorSpace 6 0 R', bytes(range(12))),
+        b'[/Indexed /DeviceRGB 1 <000000ffffff>]',
+        FONT,
+    ])
+
+
+def _summary(ltpage):
+    items = []
+
+    def walk(obj):
+        if isinstance(obj, LTImage):
+            items.append(('image', obj.bbox, obj.srcsize, obj.stream.get_data()))
+        elif hasattr(obj, '__iter__'):
+            for child in obj:
+                walk(child)
+        else:
+            items.append((type(obj).__name__, getattr(obj, 'bbox', None)))
+
+    walk(ltpage)
+    return (ltpage.pageid, items)
+
+
+def test_extract_pages_in_workers_with_images(tmp_path):
+    path = tmp_path / 'image.pdf'
+    path.write_bytes(_image_pdf())
+    serial = [_summary(p) for p in extract_pages(path)]
+    parallel = [_summary(p) for p in extract_pages(path, workers=2)]
+    assert parallel == serial
+    images = [item for item in serial[0][1] if item[0] == 'image']
+    assert [image[3] for image in images] == [bytes(range(12)), b'\x00\x10\x20\x30']
+
+
+def _text_pages_pdf(count, pages_count):
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % (4 + 2 * i) for i in range(count)), pages_count),
+        FONT,
+    ]
+    for i in range(count):
+        objects.append(page(2, 5 + 2 * i, 3))
+        objects.append(text_content(b'page %d' % i))
+    return build_pdf(objects)
+
+
+def test_workers_only_create_the_selected_pages(tmp_path, monkeypatch):
+    path = tmp_path / 'pages.pdf'
+    path.write_bytes(_text_pages_pdf(6, 6))
+
+    def create_pages(doc):
+        raise AssertionError('all pages were created')
+
+    monkeypatch.setattr(PDFPage, 'create_pages', create_pages)
+    serial = extract_text(path, page_numbers=[1, 4])
+    assert extract_text(path, page_numbers=[1, 4], workers=2) == serial
+    assert [line for line in serial.split() if line != 'page'] == ['1', '4']
+    pages = extract_pages(path, page_numbers=[4], workers=2)
+    assert [_summary(p) for p in pages] == [
+        _summary(p) for p in extract_pages(path, page_numbers=[4])
+    ]
+
+
+def test_workers_with_wrong_page_count(tmp_path):
+    # The root claims two pages but has five; the pages are found anyway
+    path = tmp_path / 'wrong_count.pdf'
+    path.write_bytes(_text_pages_pdf(5, 2))
+    serial = extract_text(path)
+    assert serial.count('page') == 5
+    assert extract_text(path, workers=2) == serial
+    for options in ({'page_numbers': [3]}, {'maxpages': 3}):
+        assert extract_text(path, workers=2, **options) == extract_text(path, **options)
+
+
+def test_layout_takes_glyphs_from_decode_glyphs(tmp_path, monkeypatch):
+    path = tmp_path / 'text.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        page(2, 5, 4),
+        FONT,
+        stream(b'', b'BT /F1 12 Tf 20 150 Td [(Hello) -250 (world)] TJ ET'),
+    ]))
+    from pdfminer.pdffont import PDFFont
+
+    looked_up = []
+    get_glyph = PDFFont.get_glyph
+    monkeypatch.setattr(PDFFont, 'get_glyph', lambda self, cid: looked_up.append(cid) or get_glyph(self, cid))
+    monkeypatch.setattr(PDFFont, 'decode_glyphs', lambda self, s: [(cid, get_glyph(self, cid)) for cid in s])
+    assert extract_text(str(path)).strip() == 'Hello world'
+    assert looked_up == []
@@ -0,0 +1,245 @@
+"""Tests for pdfminer.layout: its characters, pdfplumber's view of them, and
+the grouping of text boxes."""
+import heapq
+import math
+import pickle
+import random
+
+import pdfplumber
+import pytest
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import (
+    LAParams,
+    LTChar,
+    LTContainer,
+    LTLayoutContainer,
+    LTTextBoxHorizontal,
+    LTTextBoxVertical,
+    LTTextGroupLRTB,
+    LTTextGroupTBRL,
+    item_state,
+)
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdfinterp import PDFGraphicState, PDFResourceManager, PDFTextState
+from pdfminer.psparser import LIT
+from pdfminer.utils import Plane
+
+from pdfs import FONT, build_pdf, page, stream
+
+
+def _text_pdf(tmp_path):
+    path = tmp_path / 'text.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        page(2, 4, 5),
+        stream(b'', b'BT /F1 12 Tf 20 150 Td (ab) Tj 0 -20 Td (c) Tj ET'),
+        FONT,
+    ]))
+    return path
+
+
+def _chars(path):
+    chars = []
+
+    def walk(obj):
+        if isinstance(obj, LTChar):
+            chars.append(obj)
+        elif isinstance(obj, LTContainer):
+            for child in obj:
+                walk(child)
+
+    for ltpage in extract_pages(path):
+        walk(ltpage)
+    return chars
+
+
+def test_char_matrix_and_bbox(tmp_path):
+    (a, b, c) = _chars(_text_pdf(tmp_path))
+    assert a.matrix == (1, 0, 0, 1, 20, 150)
+    assert c.matrix[4:] == (20, 130)
+    assert a.bbox == (a.x0, a.y0, a.x1, a.y1)
+    assert a.x1 == b.x0
+    assert (a.width, a.height) == (a.x1 - a.x0, a.y1 - a.y0)
+    c.set_bbox((1, 2, 4, 8))
+    assert (c.bbox, c.width, c.height) == ((1, 2, 4, 8), 3, 6)
+    c.matrix = (1, 0, 0, 1, 5, 6)
+    assert c.matrix == (1, 0, 0, 1, 5, 6)
+
+
+def test_char_takes_attributes_of_its_own(tmp_path):
+    (a, _, _) = _chars(_text_pdf(tmp_path))
+    a.note = 'first'
+    copy = pickle.loads(pickle.dumps(a))
+    assert copy.note == 'first'
+    assert (copy.get_text(), copy.matrix, copy.bbox) == ('a', a.matrix, a.bbox)
+
+
+def _helvetica():
+    spec = {'Type': LIT('Font'), 'Subtype': LIT('Type1'), 'BaseFont': LIT('Helvetica')}
+    return PDFResourceManager().get_font(None, spec)
+
+
+def _signs(matrix):
+    return [math.copysign(1, x) for x in matrix[:4]]
+
+
+def test_strings_share_the_scale_of_their_matrices():
+    device = PDFTextDevice(PDFResourceManager())
+    textstate = PDFTextState()
+    textstate.font = _helvetica()
+    textstate.fontsize = 12
+    matrices = []
+    for (b, x) in [(0.0, 10), (0.0, 20), (-0.0, 30), (-0.0, 40), (0.5, 50)]:
+        textstate.matrix = (1.0, b, 0.0, 1.0, x, 100)
+        device.ctm = (1.0, b, 0.0, 1.0, 0, 0)
+        device.render_string(textstate, [b'a'], None, PDFGraphicState())
+        matrices.append(device.string_matrix)
+    assert [m[4] for m in matrices] == [10, 20, 30, 40, 50]
+    assert matrices[1][0] is matrices[0][0]
+    # -0.0 == 0.0, but the scale of another sign isn't taken over
+    assert _signs(matrices[2]) == [1, -1, 1, 1]
+    assert matrices[3][1] is matrices[2][1]
+    assert matrices[4][:4] == (1.0, 1.0, 0.0, 1.0)
+
+
+def test_chars_share_floats_and_scales():
+    font = _helvetica()
+    numbers = {}
+    scales = {}
+
+    def char(matrix):
+        return LTChar(matrix, font, 12, 1, 0, 'a', 0.5, 0, None, PDFGraphicState(), numbers, scales)
+
+    x = 10.0
+    first = char((1.0, 0.0, 0.0, 1.0, x, 100.0))
+    second = char((1.0, 0.0, 0.0, 1.0, x + 6, float('100')))
+    assert second.matrix[:4] == first.matrix[:4]
+    assert second._scale is first._scale
+    assert second.matrix[5] is first.matrix[5]
+    assert (second.adv, second.y0, second.height) == (first.adv, first.y0, first.height)
+    assert second.adv is first.adv
+    negative = char((1.0, -0.0, 0.0, 1.0, x, 100.0))
+    assert negative._scale is not first._scale
+    assert _signs(negative.matrix) == [1, -1, 1, 1]
+    assert numbers and all(type(k) is float for k in numbers)
+    assert all(len(k) == 4 for k in scales)
+
+
+def test_item_state_leaves_the_dict_alone(tmp_path):
+    (a, _, _) = _chars(_text_pdf(tmp_path))
+    (instance_dict, slots) = item_state(a)
+    assert instance_dict is None
+    assert slots['_text'] == 'a'
+    assert 'note' not in slots
+    # Still no __dict__ after the first call
+    assert item_state(a)[0] is None
+    a.note = 'first'
+    assert item_state(a)[0] == {'note': 'first'}
+
+
+def test_plumber_char_keys(tmp_path):
+    with pdfplumber.open(_text_pdf(tmp_path)) as pdf:
+        chars = pdf.pages[0].chars
+    assert [char['text'] for char in chars] == ['a', 'b', 'c']
+    assert list(chars[0]) == [
+        'matrix', 'fontname', 'adv', 'upright', 'x0', 'y0', 'x1', 'y1',
+        'width', 'height', 'size', 'mcid', 'tag', 'object_type', 'page_number',
+        'ncs', 'text', 'stroking_color', 'non_stroking_color', 'top', 'bottom',
+        'doctop',
+    ]
+    assert chars[0]['matrix'] == (1, 0, 0, 1, 20, 150)
+
+
+def _dist(obj1, obj2):
+    x0 = min(obj1.x0, obj2.x0)
+    y0 = min(obj1.y0, obj2.y0)
+    x1 = max(obj1.x1, obj2.x1)
+    y1 = max(obj1.y1, obj2.y1)
+    return (x1 - x0) * (y1 - y0) - obj1.width * obj1.height - obj2.width * obj2.height
+
+
+def all_pairs_groups(bbox, boxes):
+    """group_textboxes as it was, with a heap of the distances of all pairs."""
+    plane = Plane(bbox)
+
+    def isany(obj1, obj2):
+        x0 = min(obj1.x0, obj2.x0)
+        y0 = min(obj1.y0, obj2.y0)
+        x1 = max(obj1.x1, obj2.x1)
+        y1 = max(obj1.y1, obj2.y1)
+        return set(plane.find((x0, y0, x1, y1))).difference((obj1, obj2))
+
+    dists = []
+    for i, box1 in enumerate(boxes):
+        for box2 in boxes[i + 1 :]:
+            dists.append((False, _dist(box1, box2), id(box1), id(box2), box1, box2))
+    heapq.heapify(dists)
+    plane.extend(boxes)
+    done = set()
+    while dists:
+        (skip_isany, d, id1, id2, obj1, obj2) = heapq.heappop(dists)
+        if id1 in done or id2 in done:
+            continue
+        if not skip_isany and isany(obj1, obj2):
+            heapq.heappush(dists, (True, d, id1, id2, obj1, obj2))
+            continue
+        if isinstance(obj1, (LTTextBoxVertical, LTTextGroupTBRL)) or isinstance(
+            obj2, (LTTextBoxVertical, LTTextGroupTBRL)
+        ):
+            group = LTTextGroupTBRL([obj1, obj2])
+        else:
+            group = LTTextGroupLRTB([obj1, obj2])
+        plane.remove(obj1)
+        plane.remove(obj2)
+        done.update([id1, id2])
+        for other in plane:
+            heapq.heappush(dists, (False, _dist(group, other), id(group), id(other), group, other))
+        plane.add(group)
+    return list(plane)
+
+
+def _tree(obj, boxes):
+    if obj in boxes:
+        return boxes.index(obj)
+    return (type(obj).__name__, obj.bbox, [_tree(child, boxes) for child in obj])
+
+
+def _random_boxes(rnd, count):
+    # Lines in a few columns, words scattered over the page, and boxes
+    # anywhere, some of them vertical and overlapping. Small boxes far apart
+    # make the grid search grow over many cells. Coordinates are random
+    # floats, so no two distances tie and the order of merges doesn't come
+    # down to id().
+    boxes = []
+    columns = rnd.randint(1, 3)
+    lines = rnd.random()
+    for n in range(count):
+        kind = rnd.random()
+        if kind < lines:
+            column = rnd.randrange(columns)
+            x0 = 30 + column * 180 + rnd.uniform(0, 10)
+            y0 = rnd.uniform(30, 750)
+            (width, height) = (rnd.uniform(40, 170), rnd.uniform(8, 40))
+        else:
+            (x0, y0) = (rnd.uniform(0, 580), rnd.uniform(0, 770))
+            if kind < lines + (1 - lines) * 0.8:
+                (width, height) = (rnd.uniform(1, 30), rnd.uniform(1, 12))
+            else:
+                (width, height) = (rnd.uniform(1, 60), rnd.uniform(1, 90))
+        box = LTTextBoxVertical() if rnd.random() < 0.1 else LTTextBoxHorizontal()
+        box.set_bbox((x0, y0, x0 + width, y0 + height))
+        boxes.append(box)
+    return boxes
+
+
+@pytest.mark.parametrize('count', [0, 1, 2, 3, 10, 40, 100])
+def test_group_textboxes_matches_all_pairs(count):
+    laparams = LAParams(boxes_flow=0.5)
+    for seed in range(10 if count < 100 else 2):
+        rnd = random.Random(f'{count}-{seed}')
+        boxes = _random_boxes(rnd, count)
+        container = LTLayoutContainer((0, 0, 612, 792))
+        groups = container.group_textboxes(laparams, boxes)
+        expected = all_pairs_groups(container.bbox, boxes)
+        assert [_tree(g, boxes) for g in groups] == [_tree(g, boxes) for g in expected]
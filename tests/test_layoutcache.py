@@ -0,0 +1,54 @@
+"""Tests for the layout cache of pdfminer.layoutcache."""
+import os
+import pickle
+import zlib
+
+from pdfminer import layoutcache
+from pdfminer.layout import LAParams
+from pdfminer.layoutcache import LayoutCache
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+
+from pdfs import FONT, build_pdf, page, text_content
+
+
+class MakeDir:
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (os.mkdir, (self.path,))
+
+
+def _first_page(tmp_path):
+    path = tmp_path / 'text.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        page(2, 4, 5),
+        text_content(b'cached'),
+        FONT,
+    ]))
+    fp = open(path, 'rb')
+    doc = PDFDocument(PDFParser(fp))
+    return (fp, next(PDFPage.create_pages(doc)))
+
+
+def test_file_with_other_objects_is_not_loaded(tmp_path):
+    cache = LayoutCache(str(tmp_path / 'cache'))
+    os.makedirs(cache.cache_dir)
+    target = str(tmp_path / 'made')
+    for records in (MakeDir(target), [(MakeDir, (), None)]):
+        with open(os.path.join(cache.cache_dir, 'evil.layout'), 'wb') as out:
+            out.write(zlib.compress(pickle.dumps(records)))
+        assert cache.get('evil') is None
+    assert not os.path.exists(target)
+
+
+def test_key_covers_pdfminer_sources(tmp_path, monkeypatch):
+    (fp, pdfpage) = _first_page(tmp_path)
+    with fp:
+        key = LayoutCache.key(pdfpage, LAParams())
+        monkeypatch.setattr(layoutcache, '_source_digest', lambda: 'changed')
+        assert LayoutCache.key(pdfpage, LAParams()) != key
@@ -0,0 +1,25 @@
+"""Tests for pdf_cache, run from the repository root so that it is importable."""
+import pdf_cache
+
+from pdfs import FONT, build_pdf, page, text_content
+
+
+def test_parallel_parse_ignores_wrong_count(tmp_path):
+    # The root claims one page but has three
+    path = tmp_path / 'wrong_count.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R 4 0 R 5 0 R] /Count 1 >>',
+        page(2, 7, 6),
+        page(2, 8, 6),
+        page(2, 9, 6),
+        FONT,
+        text_content(b'p0'),
+        text_content(b'p1'),
+        text_content(b'p2'),
+    ]))
+    assert pdf_cache._page_count(str(path)) == 3
+    serial = pdf_cache.load_pages(str(path), use_cache=False, workers=1)
+    parallel = pdf_cache.load_pages(str(path), use_cache=False, workers=2)
+    assert [p['text'] for p in serial] == ['p0', 'p1', 'p2']
+    assert parallel == serial
@@ -0,0 +1,259 @@
+"""Tests for pdfminer.pdfdocument."""
+import io
+import random
+import struct
+import zlib
+from hashlib import md5
+
+import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from pdfminer.arcfour import Arcfour
+from pdfminer.high_level import extract_text
+from pdfminer.pdfdocument import (
+    PDFDocument,
+    PDFObjectCache,
+    PDFStandardSecurityHandler,
+    PDFStandardSecurityHandlerV4,
+    PDFStandardSecurityHandlerV5,
+    estimate_size,
+)
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream
+from pdfminer.psparser import LIT
+from pdfminer.utils import unpad_aes
+
+from pdfs import FONT, build_pdf, page, stream, text_content
+
+
+def _embedded_pdf():
+    return build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 5 0 R >> >> '
+        b'/Contents 4 0 R >>',
+        text_content(b'embedded'),
+        FONT,
+    ])
+
+
+def test_fallback_xref_skips_stream_data(tmp_path):
+    # Without a valid startxref the objects are found by scanning the file,
+    # which must not pick up the objects of the PDF embedded in object 3
+    path = tmp_path / 'embedded.pdf'
+    embedded = _embedded_pdf()
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R /Names << /EmbeddedFiles 4 0 R >> >>',
+        b'<< /Type /Pages /Kids [5 0 R 6 0 R 7 0 R] /Count 3 >>',
+        stream(b'/Type /EmbeddedFile', embedded),
+        b'<< /Names [(embedded.pdf) << /Type /Filespec /F (embedded.pdf) '
+        b'/EF << /F 3 0 R >> >>] >>',
+        page(2, 9, 8),
+        page(2, 10, 8),
+        page(2, 11, 8),
+        FONT,
+        text_content(b'page 0'),
+        text_content(b'page 1'),
+        text_content(b'page 2'),
+    ], startxref=False))
+    pages = extract_text(path).split('\f')
+    assert [text.strip() for text in pages[:3]] == ['page 0', 'page 1', 'page 2']
+
+
+def test_fallback_xref_with_wrong_stream_length(tmp_path):
+    # The stream data then ends at the next "endstream"
+    path = tmp_path / 'wrong_length.pdf'
+    data = b'1 0 obj\n<< /Type /Catalog /Pages 7 0 R >>\nendobj\n'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [4 0 R] /Count 1 >>',
+        b'<< /Type /EmbeddedFile /Length 7 >>\nstream\n%s\nendstream' % data,
+        page(2, 6, 5),
+        FONT,
+        text_content(b'page 0'),
+    ], startxref=False))
+    assert extract_text(path).strip() == 'page 0'
+
+
+def _handler(cls, key):
+    # A handler with its file key, without the password checks of init()
+    handler = cls.__new__(cls)
+    handler.key = key
+    handler._object_cipher = None
+    return handler
+
+
+def _object_key(key, objid, genno, salt=b''):
+    key += struct.pack('<L', objid)[:3] + struct.pack('<L', genno)[:2] + salt
+    return md5(key).digest()[: min(len(key), 16)]
+
+
+def _aes_cbc(key, data):
+    # Like the decryptor of one string before the cipher was shared: the
+    # trailing partial block stays in the unfinalized decryptor
+    if len(data) < 16:
+        return b''
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(data[:16])).decryptor()
+    return unpad_aes(decryptor.update(data[16:]))
+
+
+def _aes_cbc_encrypt(key, iv, plain):
+    pad = 16 - len(plain) % 16
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+    return iv + encryptor.update(plain + bytes([pad]) * pad) + encryptor.finalize()
+
+
+# Strings of one object, another object between them, and back again
+OBJECTS = [(5, 0), (5, 0), (5, 0), (6, 0), (5, 0), (5, 1), (6, 0)]
+
+
+@pytest.mark.parametrize('cache_size', [None, 40])
+def test_rc4_strings_share_the_keystream(cache_size):
+    rnd = random.Random(1)
+    key = rnd.randbytes(16)
+    handler = _handler(PDFStandardSecurityHandler, key)
+    if cache_size is not None:
+        handler.KEYSTREAM_CACHE_SIZE = cache_size
+    lengths = [0, 1, 30, 10, 45, 100, 3, 200, 7, 70000, 20]
+    for n, length in enumerate(lengths):
+        objid, genno = OBJECTS[n % len(OBJECTS)]
+        data = rnd.randbytes(length)
+        expected = Arcfour(_object_key(key, objid, genno)).decrypt(data)
+        assert handler.decrypt(objid, genno, data) == expected
+
+
+def test_rc4_key_of_a_40_bit_file_key():
+    key = b'\x01\x02\x03\x04\x05'
+    handler = _handler(PDFStandardSecurityHandler, key)
+    data = b'secret string'
+    assert len(_object_key(key, 7, 0)) == 10
+    assert handler.decrypt(7, 0, data) == Arcfour(_object_key(key, 7, 0)).decrypt(data)
+
+
+def _aes_strings(rnd, key):
+    plain = rnd.randbytes(rnd.choice([0, 1, 15, 16, 17, 100]))
+    data = _aes_cbc_encrypt(key, rnd.randbytes(16), plain)
+    # A trailing partial block, a block short, or a string shorter than its IV
+    cut = rnd.choice([0, 0, 5, 15, 16, len(data) - 3])
+    if cut:
+        return None, data[: len(data) - cut]
+    return plain, data
+
+
+def test_aes128_matches_cbc():
+    rnd = random.Random(2)
+    key = rnd.randbytes(16)
+    handler = _handler(PDFStandardSecurityHandlerV4, key)
+    for n in range(60):
+        objid, genno = OBJECTS[n % len(OBJECTS)]
+        object_key = _object_key(key, objid, genno, b'sAlT')
+        plain, data = _aes_strings(rnd, object_key)
+        decrypted = handler.decrypt_aes128(objid, genno, data)
+        assert decrypted == _aes_cbc(object_key, data)
+        if plain is not None:
+            assert decrypted == plain
+
+
+def test_aes256_matches_cbc():
+    rnd = random.Random(3)
+    key = rnd.randbytes(32)
+    handler = _handler(PDFStandardSecurityHandlerV5, key)
+    for n in range(60):
+        objid, genno = OBJECTS[n % len(OBJECTS)]
+        plain, data = _aes_strings(rnd, key)
+        decrypted = handler.decrypt_aes256(objid, genno, data)
+        assert decrypted == _aes_cbc(key, data)
+        if plain is not None:
+            assert decrypted == plain
+
+
+def _entry_sizes(cache):
+    return sum(estimate_size(value) for (value, _) in cache._entries.values())
+
+
+def test_object_cache_drops_least_recently_used():
+    item = PDFObjectCache.ITEM_SIZE
+    cache = PDFObjectCache(3 * item)
+    for n, key in enumerate('abc'):
+        cache.put(key, n)
+    assert cache.get('a') == 0
+    cache.put('d', 3)
+    assert list(cache._entries) == ['c', 'a', 'd']
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    cache.put('c', 2)
+    cache.put('e', 4)
+    assert list(cache._entries) == ['d', 'c', 'e']
+    # An entry bigger than the whole cache is kept on its own
+    cache.put('big', b'x' * 1000)
+    assert list(cache._entries) == ['big']
+    assert cache.stats() == {
+        'entries': 1,
+        'size': item + 1000,
+        'max_size': 3 * item,
+        'hits': 1,
+        'misses': 1,
+        'evictions': 5,
+    }
+
+
+def test_object_cache_without_max_size_keeps_everything():
+    cache = PDFObjectCache()
+    for n in range(1000):
+        cache.put(n, n)
+    assert [cache.get(n) for n in (0, 999, 1000)] == [0, 999, None]
+    assert cache.stats()['evictions'] == 0
+    assert cache.size == 1000 * PDFObjectCache.ITEM_SIZE
+
+
+def _compressed_stream(size):
+    data = b'x' * size
+    return PDFStream({'Filter': LIT('FlateDecode')}, zlib.compress(data)), data
+
+
+def test_object_cache_measures_streams_once_decoded():
+    cache = PDFObjectCache()
+    (first, data) = _compressed_stream(5000)
+    (second, _) = _compressed_stream(7000)
+    cache.put(1, first)
+    cache.put(2, second)
+    # Still undecoded when 2 was put, so measured by the put after decoding
+    assert first.get_data() == data
+    cache.put(3, 3)
+    assert cache.size == _entry_sizes(cache)
+    assert cache.size > 5000
+    assert list(cache._undecoded) == [2]
+    second.get_data()
+    cache.put(4, 4)
+    assert cache.size == _entry_sizes(cache) > 12000
+    assert not cache._undecoded
+
+
+def test_object_cache_forgets_evicted_streams():
+    cache = PDFObjectCache(10 * PDFObjectCache.ITEM_SIZE)
+    (stream, _) = _compressed_stream(5000)
+    cache.put(1, stream)
+    for n in range(2, 20):
+        cache.put(n, n)
+    assert 1 not in cache
+    assert not cache._undecoded
+    stream.get_data()
+    cache.put(20, 20)
+    assert cache.size == _entry_sizes(cache)
+
+
+def test_cache_size_bounds_the_document_cache():
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [] /Count 0 >>',
+    ]
+    objects += [stream(b'/Filter /FlateDecode', zlib.compress(b'%d' % n * 2000)) for n in range(20)]
+    data = build_pdf(objects)
+    limit = 10000
+    doc = PDFDocument(PDFParser(io.BytesIO(data)), cache_size=limit)
+    for _ in range(2):
+        for objid in range(3, 23):
+            assert doc.getobj(objid).get_data() == b'%d' % (objid - 3) * 2000
+    stats = doc.object_cache.stats()
+    assert stats['evictions'] > 0
+    assert stats['entries'] < 20
+    assert stats['size'] <= limit
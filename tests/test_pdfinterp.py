@@ -0,0 +1,127 @@
+"""Tests for the operator dispatch of pdfminer.pdfinterp.PDFPageInterpreter."""
+import abc
+
+import pytest
+
+from pdfminer.pdfdevice import PDFDevice
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.psparser import KWD
+
+from pdfs import FONT, build_pdf, page, text_content
+
+
+def _two_pages(tmp_path):
+    path = tmp_path / 'two_pages.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>',
+        page(2, 6, 5),
+        page(2, 7, 5),
+        FONT,
+        text_content(b'page 0'),
+        text_content(b'page 1'),
+    ]))
+    return path
+
+
+def _process(interpreter, path):
+    with open(path, 'rb') as fp:
+        for pdfpage in PDFPage.get_pages(fp):
+            yield interpreter.process_page(pdfpage)
+
+
+def _interpreter(cls):
+    return cls(PDFResourceManager(), PDFDevice(PDFResourceManager()))
+
+
+def test_handler_registered_on_class_after_first_page(tmp_path):
+    class Interpreter(PDFPageInterpreter):
+        pass
+
+    class Sub(Interpreter):
+        pass
+
+    shown = []
+    for cls in (Interpreter, Sub):
+        pages = _process(_interpreter(cls), _two_pages(tmp_path))
+        next(pages)
+        Interpreter.register_operator('Tj', lambda self, s: shown.append((cls.__name__, s)))
+        next(pages)
+        Interpreter.register_operator('Tj', PDFPageInterpreter.do_Tj)
+    assert shown == [('Interpreter', b'page 1'), ('Sub', b'page 1')]
+    assert Sub.get_operator(KWD(b'Tj'))[0] is PDFPageInterpreter.do_Tj
+
+
+def test_handler_assigned_on_class_after_first_page(tmp_path, monkeypatch):
+    class Interpreter(PDFPageInterpreter):
+        pass
+
+    shown = []
+    interpreter = _interpreter(Interpreter)
+    pages = _process(interpreter, _two_pages(tmp_path))
+    next(pages)
+    Interpreter.do_Tj = lambda self, s: shown.append(('class', s))
+    next(pages)
+    # On a base class, seen by subclasses that don't override it
+    del Interpreter.do_Tj
+    monkeypatch.setattr(PDFPageInterpreter, 'do_Tj', lambda self, s: shown.append(('base', s)))
+    list(_process(interpreter, _two_pages(tmp_path)))
+    # An operator without a handler so far
+    assert Interpreter.get_operator(KWD(b'XX')) is None
+    Interpreter.do_XX = lambda self: shown.append('XX')
+    assert Interpreter.get_operator(KWD(b'XX'))[1:] == (0, 'XX')
+    assert shown == [('class', b'page 1'), ('base', b'page 0'), ('base', b'page 1')]
+
+
+def test_subclass_can_mix_in_abc(tmp_path):
+    class Interpreter(PDFPageInterpreter, abc.ABC):
+        @abc.abstractmethod
+        def do_Tj(self, s):
+            pass
+
+    class Concrete(Interpreter):
+        def do_Tj(self, s):
+            shown.append(s)
+
+    shown = []
+    with pytest.raises(TypeError):
+        _interpreter(Interpreter)
+    list(_process(_interpreter(Concrete), _two_pages(tmp_path)))
+    assert shown == [b'page 0', b'page 1']
+    assert Concrete._operators is not Interpreter._operators is not PDFPageInterpreter._operators
+
+
+def test_register_operator_and_instance_handlers(tmp_path):
+    class Interpreter(PDFPageInterpreter):
+        pass
+
+    calls = []
+    Interpreter.register_operator('Tj', lambda self, s: calls.append(('class', s)))
+    interpreter = _interpreter(Interpreter)
+    list(_process(interpreter, _two_pages(tmp_path)))
+    interpreter.do_Tj = lambda s: calls.append(('instance', s))
+    list(_process(interpreter, _two_pages(tmp_path)))
+    assert calls == [
+        ('class', b'page 0'),
+        ('class', b'page 1'),
+        ('instance', b'page 0'),
+        ('instance', b'page 1'),
+    ]
+
+
+def test_instance_handlers_are_resolved_once_per_execute(tmp_path, monkeypatch):
+    interpreter = _interpreter(PDFPageInterpreter)
+    calls = []
+    interpreter.do_Tj = lambda s: calls.append(s)
+    resolved = []
+    get_instance_operators = PDFPageInterpreter.get_instance_operators
+    monkeypatch.setattr(
+        PDFPageInterpreter,
+        'get_instance_operators',
+        lambda self: resolved.append(1) or get_instance_operators(self),
+    )
+    list(_process(interpreter, _two_pages(tmp_path)))
+    assert calls == [b'page 0', b'page 1']
+    assert len(resolved) == 2
+    assert list(interpreter.get_instance_operators()) == [KWD(b'Tj')]
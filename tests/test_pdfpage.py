@@ -0,0 +1,117 @@
+"""Tests for looking up pages in pdfminer.pdfpage."""
+import io
+
+import pdfplumber
+from pdfminer.high_level import extract_text
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage, PDFPageIndex
+from pdfminer.pdfparser import PDFParser
+
+from pdfs import FONT, build_pdf, page, text_content
+
+
+def _page_texts(path, count):
+    return [extract_text(path, page_numbers=[n]).strip() for n in range(count)]
+
+
+def test_empty_subtree_before_a_page(tmp_path):
+    # Root kids: an empty /Pages node, a page, and a /Pages node of three
+    path = tmp_path / 'empty_subtree.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R 4 0 R 5 0 R] /Count 4 >>',
+        b'<< /Type /Pages /Parent 2 0 R /Kids [] /Count 0 >>',
+        page(2, 8, 7),
+        b'<< /Type /Pages /Parent 2 0 R /Kids [6 0 R 12 0 R 13 0 R] /Count 3 >>',
+        page(5, 9, 7),
+        FONT,
+        text_content(b'page 0'),
+        text_content(b'page 1'),
+        text_content(b'page 2'),
+        text_content(b'page 3'),
+        page(5, 10, 7),
+        page(5, 11, 7),
+    ]))
+    assert _page_texts(path, 5) == ['page 0', 'page 1', 'page 2', 'page 3', '']
+
+
+def test_page_after_a_subtree_in_a_node_of_as_many_kids(tmp_path):
+    # The root has three kids and three pages, but its first kid holds two
+    # of them and its last none, so page 1 is not the root's second kid
+    path = tmp_path / 'mixed.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R 6 0 R 7 0 R] /Count 3 >>',
+        b'<< /Type /Pages /Parent 2 0 R /Kids [4 0 R 5 0 R] /Count 2 >>',
+        page(3, 9, 8),
+        page(3, 10, 8),
+        page(2, 11, 8),
+        b'<< /Type /Pages /Parent 2 0 R /Kids [] /Count 0 >>',
+        FONT,
+        text_content(b'first'),
+        text_content(b'second'),
+        text_content(b'third'),
+    ]))
+    expected = ['first', 'second', 'third']
+    assert [text.strip() for text in extract_text(path).split('\f')[:3]] == expected
+    assert _page_texts(path, 3) == expected
+    assert extract_text(path, page_numbers=[1], workers=2).strip() == 'second'
+    with pdfplumber.open(path, pages=[2]) as pdf:
+        assert [p.extract_text() for p in pdf.pages] == ['second']
+    with open(path, 'rb') as fp:
+        pages = PDFPage.get_pages(fp, pagenos=[1, 2])
+        assert [p.pageid for p in pages] == [5, 6]
+
+
+def test_subtree_with_wrong_count(tmp_path):
+    # The first /Pages node claims one page but has two, and the root claims
+    # two of three. Lookups through the first node and past the root's
+    # /Count walk the tree like create_pages().
+    path = tmp_path / 'wrong_count.pdf'
+    path.write_bytes(build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R 6 0 R] /Count 2 >>',
+        b'<< /Type /Pages /Parent 2 0 R /Kids [4 0 R 5 0 R] /Count 1 >>',
+        page(3, 8, 7),
+        page(3, 9, 7),
+        page(2, 10, 7),
+        FONT,
+        text_content(b'page 0'),
+        text_content(b'page 1'),
+        text_content(b'page 2'),
+    ]))
+    assert [extract_text(path, page_numbers=[n]).strip() for n in (0, 2, 3)] == ['page 0', 'page 2', '']
+    with pdfplumber.open(path, pages=[1, 3]) as pdf:
+        assert [p.extract_text() for p in pdf.pages] == ['page 0', 'page 2']
+
+
+def test_lookup_resolves_only_the_way_to_the_page():
+    # Root of two /Pages nodes of 20 pages each; content and font are shared
+    pages = 40
+    first = 4
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [5 0 R 6 0 R] /Count %d >>' % pages,
+        FONT,
+        text_content(b'page'),
+    ]
+    kids = [b' '.join(b'%d 0 R' % (first + 3 + n) for n in range(half, half + 20)) for half in (0, 20)]
+    objects.append(b'<< /Type /Pages /Parent 2 0 R /Kids [%s] /Count 20 >>' % kids[0])
+    objects.append(b'<< /Type /Pages /Parent 2 0 R /Kids [%s] /Count 20 >>' % kids[1])
+    objects.extend(page(5 if n < 20 else 6, 4, 3) for n in range(pages))
+
+    doc = PDFDocument(PDFParser(io.BytesIO(build_pdf(objects))))
+    resolved = []
+    getobj = doc.getobj
+    doc.getobj = lambda objid: resolved.append(objid) or getobj(objid)
+    index = PDFPageIndex(doc)
+    resolved.clear()
+
+    # The pages of the second node up to the one looked up are resolved, to
+    # see that none of them is a /Pages node
+    assert index.lookup(33)[0] == first + 3 + 33
+    assert sorted(set(resolved)) == [5, 6] + [first + 3 + n for n in range(20, 34)]
+    resolved.clear()
+    assert index.lookup(25)[0] == first + 3 + 25
+    assert sorted(set(resolved)) == [first + 3 + n for n in range(20, 26)]
+    assert len(index) == pages
@@ -0,0 +1,99 @@
+"""Tests for pdfminer.utils.Plane, the R-tree behind the layout analysis.
+
+Run against the vendored pdfminer, e.g. with pdf_env's interpreter:
+
+    pdf_env/bin/python -m pytest tests
+"""
+import random
+
+from pdfminer.utils import Plane
+
+PAGE = (0, 0, 100, 100)
+
+
+class Box:
+    def __init__(self, x0, y0, x1, y1):
+        (self.x0, self.y0, self.x1, self.y1) = (x0, y0, x1, y1)
+
+    def __repr__(self):
+        return f'Box({self.x0}, {self.y0}, {self.x1}, {self.y1})'
+
+
+def test_extend_with_duplicates_places_object_once():
+    a = Box(10, 10, 20, 20)
+    b = Box(30, 30, 40, 40)
+    plane = Plane(PAGE)
+    plane.extend([a, a, b])
+    assert len(plane) == 2
+    assert list(plane) == [a, b]
+    assert list(plane.find(PAGE)) == [a, b]
+
+
+def test_add_again_is_a_no_op():
+    a = Box(10, 10, 20, 20)
+    b = Box(30, 30, 40, 40)
+    plane = Plane(PAGE)
+    plane.extend([a, b])
+    plane.add(a)
+    assert list(plane) == [a, b]
+    plane.remove(a)
+    assert a not in plane
+    assert list(plane.find(PAGE)) == [b]
+
+
+def test_find_after_many_adds_and_removes():
+    boxes = [Box(i % 10 * 10, i // 10 * 10, i % 10 * 10 + 5, i // 10 * 10 + 5) for i in range(100)]
+    plane = Plane(PAGE)
+    plane.extend(boxes)
+    for box in boxes[::2]:
+        plane.remove(box)
+    # find() orders objects by grid cell, so compare as sets here
+    assert set(plane.find((0, 0, 100, 100))) == set(boxes[1::2])
+    assert list(plane.find((0, 0, 16, 6))) == [boxes[1]]
+
+
+def _grid_find(boxes, plane_bbox, bbox, gridsize=50):
+    """find() of the grid Plane replaced: by first shared cell, then by age."""
+    def cells(b):
+        (x0, y0, x1, y1) = b
+        if x1 <= plane_bbox[0] or plane_bbox[2] <= x0 or y1 <= plane_bbox[1] or plane_bbox[3] <= y0:
+            return []
+        x0, y0 = max(plane_bbox[0], x0), max(plane_bbox[1], y0)
+        x1, y1 = min(plane_bbox[2], x1), min(plane_bbox[3], y1)
+        return [(x, y) for y in range(int(y0) // gridsize, int(y1 + gridsize) // gridsize)
+                for x in range(int(x0) // gridsize, int(x1 + gridsize) // gridsize)]
+
+    found = []
+    for cell in cells(bbox):
+        for box in boxes:
+            if box in found or cell not in cells((box.x0, box.y0, box.x1, box.y1)):
+                continue
+            if box.x1 <= bbox[0] or bbox[2] <= box.x0 or box.y1 <= bbox[1] or bbox[3] <= box.y0:
+                continue
+            found.append(box)
+    return found
+
+
+def test_find_matches_the_grid_order():
+    rnd = random.Random(7)
+    page = (0, 0, 600, 800)
+    # Wide lines and tall columns, some sticking out of the page
+    boxes = []
+    for _ in range(300):
+        (x0, y0) = (rnd.uniform(-50, 600), rnd.uniform(-50, 800))
+        if rnd.random() < 0.7:
+            boxes.append(Box(x0, y0, x0 + rnd.uniform(50, 400), y0 + 10))
+        else:
+            boxes.append(Box(x0, y0, x0 + 8, y0 + rnd.uniform(50, 300)))
+    plane = Plane(page)
+    plane.extend(boxes[:200])
+    live = boxes[:200]
+    for box in boxes[200:]:
+        plane.add(box)
+        live.append(box)
+        gone = live.pop(rnd.randrange(len(live)))
+        plane.remove(gone)
+    for _ in range(100):
+        (x0, y0) = (rnd.uniform(-20, 600), rnd.uniform(-20, 800))
+        bbox = (x0, y0, x0 + rnd.uniform(0, 300), y0 + rnd.uniform(0, 60))
+        assert list(plane.find(bbox)) == _grid_find(live, page, bbox)
@@ -0,0 +1,154 @@
+"""Tests for the PNG and TIFF predictors of pdfminer.utils.
+
+Both are compared with reference decoders that follow the specifications
+byte by byte and component by component.
+"""
+import random
+
+import pytest
+from pdfminer.pdfexceptions import PDFValueError
+from pdfminer.utils import apply_png_predictor, apply_tiff_predictor
+
+BITS = [1, 2, 4, 8, 16]
+COLORS = [1, 3, 4]
+
+
+def _paeth(left, above, upper_left):
+    p = left + above - upper_left
+    pa = abs(p - left)
+    pb = abs(p - above)
+    pc = abs(p - upper_left)
+    if pa <= pb and pa <= pc:
+        return left
+    if pb <= pc:
+        return above
+    return upper_left
+
+
+def reference_png(colors, columns, bpc, data):
+    nbytes = (colors * columns * bpc + 7) // 8
+    bpp = max(1, colors * bpc // 8)
+    prior = [0] * nbytes
+    out = []
+    for start in range(0, len(data), nbytes + 1):
+        filter_type = data[start]
+        line = data[start + 1 : start + 1 + nbytes]
+        raw = []
+        for j, x in enumerate(line):
+            left = raw[j - bpp] if j >= bpp else 0
+            upper_left = prior[j - bpp] if j >= bpp else 0
+            above = prior[j]
+            if filter_type == 0:
+                predicted = 0
+            elif filter_type == 1:
+                predicted = left
+            elif filter_type == 2:
+                predicted = above
+            elif filter_type == 3:
+                predicted = (left + above) // 2
+            else:
+                predicted = _paeth(left, above, upper_left)
+            raw.append((x + predicted) % 256)
+        out.extend(raw)
+        prior = raw
+    return bytes(out)
+
+
+def _unpack(line, bpc):
+    if bpc == 16:
+        return [line[i] << 8 | line[i + 1] for i in range(0, len(line) - 1, 2)]
+    per_byte = 8 // bpc
+    return [(byte >> (8 - bpc * (k + 1))) % (1 << bpc) for byte in line for k in range(per_byte)]
+
+
+def _pack(components, bpc, line):
+    if bpc == 16:
+        packed = b''.join(c.to_bytes(2, 'big') for c in components)
+        # An odd byte at the end of a short row is not a component
+        return packed + line[len(packed) :]
+    per_byte = 8 // bpc
+    out = []
+    for i in range(0, len(components), per_byte):
+        byte = 0
+        for c in components[i : i + per_byte]:
+            byte = byte << bpc | c
+        out.append(byte)
+    return bytes(out)
+
+
+def reference_tiff(colors, columns, bpc, data):
+    nbytes = (colors * columns * bpc + 7) // 8
+    out = b''
+    for start in range(0, len(data), nbytes):
+        line = data[start : start + nbytes]
+        components = _unpack(line, bpc)
+        # Components past the last pixel are padding
+        for k in range(colors, min(colors * columns, len(components))):
+            components[k] = (components[k] + components[k - colors]) % (1 << bpc)
+        out += _pack(components, bpc, line)
+    return out
+
+
+def _png_data(rnd, nbytes, filters, short):
+    data = b''.join(bytes([f]) + rnd.randbytes(nbytes) for f in filters)
+    return data[: len(data) - short]
+
+
+@pytest.mark.parametrize('bpc', BITS)
+@pytest.mark.parametrize('colors', COLORS)
+@pytest.mark.parametrize('filter_type', [0, 1, 2, 3, 4])
+def test_png_predictor_single_filter(filter_type, colors, bpc):
+    rnd = random.Random(f'{filter_type}-{colors}-{bpc}')
+    for columns in (1, 5, 37):
+        nbytes = (colors * columns * bpc + 7) // 8
+        for short in (0, 1, nbytes // 2, nbytes):
+            data = _png_data(rnd, nbytes, [filter_type] * 6, short)
+            expected = reference_png(colors, columns, bpc, data)
+            assert apply_png_predictor(15, colors, columns, bpc, data) == expected
+
+
+@pytest.mark.parametrize('bpc', BITS)
+@pytest.mark.parametrize('colors', COLORS)
+def test_png_predictor_mixed_filters(colors, bpc):
+    rnd = random.Random(f'mixed-{colors}-{bpc}')
+    # 8 bit RGB rows of 30 columns are wider than 64 bytes, and take the
+    # other path for Up rows
+    for columns in (1, 7, 30):
+        nbytes = (colors * columns * bpc + 7) // 8
+        for _ in range(10):
+            filters = [rnd.choice([0, 1, 2, 2, 2, 3, 4]) for _ in range(rnd.randint(1, 12))]
+            short = rnd.choice([0, 0, 1, nbytes // 3])
+            data = _png_data(rnd, nbytes, filters, short)
+            expected = reference_png(colors, columns, bpc, data)
+            assert apply_png_predictor(12, colors, columns, bpc, data) == expected
+
+
+@pytest.mark.parametrize('bpc', BITS)
+@pytest.mark.parametrize('colors', COLORS)
+def test_tiff_predictor(colors, bpc):
+    rnd = random.Random(f'tiff-{colors}-{bpc}')
+    # Columns 5 and 3 leave padding at the end of rows below 8 bits
+    for columns in (1, 3, 5, 40):
+        nbytes = (colors * columns * bpc + 7) // 8
+        for short in (0, 1, nbytes // 2):
+            data = rnd.randbytes(nbytes * 4)
+            data = data[: len(data) - short]
+            expected = reference_tiff(colors, columns, bpc, data)
+            assert apply_tiff_predictor(colors, columns, bpc, data) == expected
+
+
+def test_tiff_predictor_known_row():
+    # Two RGB pixels of 16 bits; the sum of the second red wraps around
+    data = bytes.fromhex('fff0 0001 0002' '0020 0003 0004')
+    assert apply_tiff_predictor(3, 2, 16, data) == bytes.fromhex('fff0 0001 0002' '0010 0004 0006')
+    # Four 2-bit samples and two padding bits left as they are
+    assert apply_tiff_predictor(1, 3, 2, bytes([0b01_11_10_11])) == bytes([0b01_00_10_11])
+
+
+def test_unsupported_values():
+    with pytest.raises(PDFValueError):
+        apply_png_predictor(10, 1, 1, 3, b'\x00\x00')
+    with pytest.raises(PDFValueError):
+        apply_tiff_predictor(1, 1, 12, b'\x00\x00')
+    with pytest.raises(PDFValueError):
+        apply_png_predictor(10, 1, 2, 8, b'\x00\x01\x02\x05\x01\x02')
@@ -0,0 +1,123 @@
+"""Tests for the batched tokenizer of pdfminer.psparser.
+
+Every parser is compared with the per-token path (TOKEN_BATCH = 0) reading
+its input in one buffer.
+"""
+import io
+
+import pytest
+from pdfminer.pdfinterp import PDFContentParser
+from pdfminer.pdftypes import PDFStream
+from pdfminer.psexceptions import PSEOF
+from pdfminer.psparser import PSStackParser
+
+TRICKY = (
+    b'%comment at the start\n'
+    b'BT /F1 12 Tf -.5 +3. 1.25 -7 0 Td .5 -0 007 1. -.002 Tc\n'
+    b'(simple) Tj (a\\(b\\) (nested (deep) x) \\n\\t\\101\\1\\12x\\\\ \\q) Tj\n'
+    b'(line\\\r\ncontinued) Tj (cr\rlf\r\n) Tj () Tj\n'
+    b'<48656C6C6F> Tj <4 8\n6 c> Tj <> Tj <a> Tj\n'
+    b'[(x) -250 (y) 1.5 (z)] TJ % trailing comment ) ( <\r'
+    b'/Name /Name#20With#23Escapes /A/B//C /\n'
+    b'<< /D [1 2 R] /E << /F (g) >> /H <0a0b> >>\n'
+    b'true false null {1 2} word-with.dots T* \' " d0\n'
+    b'ET'
+)
+
+INLINE_IMAGE = (
+    b'q BI /W 2 /H 2 /BPC 8 /CS /G ID \x00\x10EI\x10\x20\x30\nEI Q '
+    b'BI /W 1 /H 1 /BPC 8 /CS /RGB /F /AHx ID 0a0b0c> EI\n'
+    b'BT (after) Tj ET'
+)
+
+
+def _norm(obj):
+    if isinstance(obj, PDFStream):
+        return ('stream', _norm(obj.attrs), obj.rawdata)
+    if isinstance(obj, list):
+        return [_norm(x) for x in obj]
+    if isinstance(obj, dict):
+        return {k: _norm(v) for k, v in obj.items()}
+    return obj
+
+
+def _objects(parser):
+    objs = []
+    while True:
+        try:
+            (pos, obj) = parser.nextobject()
+        except PSEOF:
+            return objs
+        objs.append((pos, _norm(obj)))
+
+
+def _stack_parser(data, bufsize, batch):
+    class Parser(PSStackParser):
+        BUFSIZ = bufsize
+        TOKEN_BATCH = batch
+
+        def do_keyword(self, pos, token):
+            self.push((pos, token))
+
+        def flush(self):
+            self.add_results(*self.popall())
+
+    return Parser(io.BytesIO(data))
+
+
+def _content_parser(streams, bufsize, batch):
+    class Parser(PDFContentParser):
+        BUFSIZ = bufsize
+        TOKEN_BATCH = batch
+
+        def fillbuf(self):
+            # Read the streams in chunks, like before they were read whole
+            if self.charpos < len(self.buf):
+                return
+            while True:
+                self.fillfp()
+                self.bufpos = self.fp.tell()
+                self.buf = self.fp.read(self.BUFSIZ)
+                if self.buf:
+                    break
+                self.fp = None
+            self.charpos = 0
+
+    if bufsize is None:
+        Parser.fillbuf = PDFContentParser.fillbuf
+    return Parser([PDFStream({}, data) for data in streams])
+
+
+@pytest.mark.parametrize('bufsize', [1, 7, 4096])
+@pytest.mark.parametrize('data', [TRICKY, TRICKY + b' (unterminated \\( string', b'  -.5 +3.'])
+def test_stack_parser_matches_per_token_path(data, bufsize):
+    expected = _objects(_stack_parser(data, 4096, 0))
+    assert expected
+    assert _objects(_stack_parser(data, bufsize, 256)) == expected
+    assert _objects(_stack_parser(data, bufsize, 3)) == expected
+
+
+@pytest.mark.parametrize('bufsize', [1, 7, None])
+@pytest.mark.parametrize('split', [None, 20, 61, 70])
+def test_content_parser_matches_per_token_path(bufsize, split):
+    data = TRICKY + b'\n' + INLINE_IMAGE
+    streams = [data] if split is None else [TRICKY[:split], TRICKY[split:] + b'\n' + INLINE_IMAGE]
+    expected = _objects(_content_parser([data], 4096, 0))
+    images = [obj for _, obj in expected if isinstance(obj, tuple)]
+    assert [raw for (_, _, raw) in images] == [b'\x00\x10EI\x10\x20\x30', b'0a0b0c> ']
+    assert _objects(_content_parser(streams, bufsize, 256)) == _objects(_content_parser(streams, 4096, 0))
+    if split is None:
+        assert _objects(_content_parser(streams, bufsize, 256)) == expected
+
+
+def test_inline_image_across_streams():
+    streams = [b'q BI /W 2 /H 2 /BPC 8 /CS /G ID \x00\x10', b'\x20\x30\nEI Q']
+    for bufsize in (1, 7, None):
+        assert _objects(_content_parser(streams, bufsize, 256)) == _objects(_content_parser(streams, 4096, 0))
+
+
+def test_escaped_line_break_split_between_buffers():
+    data = b'(ab\\\r\ncd) x'
+    for bufsize in range(1, len(data) + 1):
+        for batch in (0, 256):
+            assert _objects(_stack_parser(data, bufsize, batch))[0] == (0, b'abcd')
@@ -0,0 +1,116 @@
+"""Tests for question_bank, run from the repository root so that it is importable."""
+import pytest
+
+import question_bank
+
+QUESTIONS = [
+    {
+        'id': 7,
+        'question_en': 'Which command lists files?',
+        'question_de': 'Welcher Befehl listet Dateien?',
+        'options_en': ['A) ls', 'B) cd', 'C) pwd', 'D) rm'],
+        'options_de': ['A) ls', 'B) cd', 'C) pwd', 'D) rm'],
+        'correct': 'A',
+    },
+    {
+        # No answer, options without or with other prefixes
+        'id': 2,
+        'question_en': 'Pick one',
+        'question_de': '',
+        'options_en': ['ls', 'A) cd', 'B)pwd', 'D) rm'],
+        'options_de': [],
+        'correct': None,
+    },
+    {
+        # More than four options, and text beyond ASCII
+        'id': 40000,
+        'question_en': 'Größe of a file? ✓ 文件',
+        'question_de': 'Wie groß ist die Datei? — „ß“',
+        'options_en': ['A) du', 'B) df', 'C) ls -l', 'D) stat', 'E) wc -c', 'F) 文件'],
+        'options_de': ['A) du', 'B) df', 'C) ls -l', 'D) stat', 'E) wc -c'],
+        'correct': 'D',
+    },
+    {
+        'id': 3,
+        'question_en': '',
+        'question_de': 'Ä' * 1000,
+        'options_en': ['A) ', 'B) x', 'C) y', 'D) z'],
+        'options_de': ['A) ä', 'B) ö', 'C) ü', 'D) ß'],
+        'correct': 'C',
+    },
+]
+
+
+@pytest.fixture
+def bank_path(tmp_path):
+    path = tmp_path / 'sub' / 'questions.bank'
+    question_bank.write_bank(QUESTIONS, str(path))
+    return str(path)
+
+
+def test_round_trip(bank_path):
+    by_id = {q['id']: q for q in QUESTIONS}
+    with question_bank.QuestionBank(bank_path) as bank:
+        assert len(bank) == len(QUESTIONS)
+        assert bank.ids() == [2, 3, 7, 40000]
+        for q_id, question in by_id.items():
+            assert q_id in bank
+            assert bank[q_id] == question
+        assert list(bank) == [by_id[q_id] for q_id in sorted(by_id)]
+
+
+def test_missing_ids(bank_path):
+    with question_bank.QuestionBank(bank_path) as bank:
+        for q_id in (0, 1, 4, 8, 39999, 40001):
+            assert q_id not in bank
+            assert bank.get(q_id) is None
+            with pytest.raises(KeyError):
+                bank[q_id]
+        assert bank.get(5, 'none') == 'none'
+
+
+def test_prefixes_are_not_stored(tmp_path):
+    path = str(tmp_path / 'questions.bank')
+    question_bank.write_bank(QUESTIONS[:1], path)
+    with open(path, 'rb') as f:
+        assert b') ' not in f.read()
+    with question_bank.QuestionBank(path) as bank:
+        assert bank[7] == QUESTIONS[0]
+
+
+def test_many_questions(tmp_path):
+    questions = [dict(QUESTIONS[0], id=q_id, question_en=f'Q{q_id}') for q_id in range(1, 2000, 3)]
+    path = str(tmp_path / 'questions.bank')
+    question_bank.write_bank(reversed(questions), path)
+    with question_bank.QuestionBank(path) as bank:
+        assert bank.ids() == [q['id'] for q in questions]
+        assert all(bank[q['id']] == q for q in questions)
+        assert 2 not in bank
+
+        # A lookup reads the index entries it bisects, not the whole index
+        read = []
+        entry = bank._entry
+        bank._entry = lambda position: read.append(position) or entry(position)
+        assert bank[1000]['question_en'] == 'Q1000'
+        assert 0 < len(read) <= 12
+
+
+def test_empty_bank(tmp_path):
+    path = str(tmp_path / 'questions.bank')
+    question_bank.write_bank([], path)
+    with question_bank.QuestionBank(path) as bank:
+        assert (len(bank), bank.ids(), list(bank), 1 in bank) == (0, [], [], False)
+
+
+@pytest.mark.parametrize('data', [b'', b'KQB', b'JSON\x00\x00\x00\x00'])
+def test_not_a_bank(tmp_path, data):
+    path = tmp_path / 'questions.bank'
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match='is not a question bank'):
+        question_bank.QuestionBank(str(path))
+
+
+def test_string_too_long(tmp_path):
+    question = dict(QUESTIONS[0], question_en='x' * (question_bank.MAX_STR_LEN + 1))
+    with pytest.raises(ValueError, match='string too long'):
+        question_bank.write_bank([question], str(tmp_path / 'questions.bank'))
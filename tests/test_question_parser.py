@@ -0,0 +1,199 @@
+"""Tests for question_parser, run from the repository root so that it is importable.
+
+The pages are built twice from the same lines: as page texts for the text
+parser, and as pdf_cache page records of chars for the layout parser.
+"""
+import io
+import json
+
+import pdf_cache
+import question_parser
+
+SIZE = 10
+CHAR_WIDTH = 5
+# Gaps between lines: a new paragraph, and a line that wraps the one above
+PARAGRAPH = 16
+WRAP = 2
+
+
+def layout_page(lines, page_number=1):
+    """A pdf_cache page record of `lines`, (kind, text) pairs.
+
+    kind is 'bold' for headers and chapter titles, 'text' for a line that
+    starts a paragraph and 'wrap' for one that continues the line above.
+    """
+    chars = []
+    top = 50
+    for n, (kind, text) in enumerate(lines):
+        if n:
+            top += SIZE + (WRAP if kind == 'wrap' else PARAGRAPH)
+        fontname = 'ABCDEF+Helvetica-Bold' if kind == 'bold' else 'ABCDEF+Helvetica'
+        for i, char in enumerate(text):
+            if char == ' ':
+                continue
+            x0 = 40 + i * CHAR_WIDTH
+            row = (char, fontname, SIZE, x0, x0 + CHAR_WIDTH, top, top + SIZE, top, True)
+            chars.append(row)
+    return {
+        'page_number': page_number,
+        'width': 595.0,
+        'height': 842.0,
+        'text': text_page(lines),
+        'chars': chars,
+    }
+
+
+def text_page(lines):
+    return '\n'.join(text for (_, text) in lines)
+
+
+def both_parsers(pages):
+    from_text = list(question_parser.iter_questions(text_page(lines) for lines in pages))
+    from_layout = list(question_parser.iter_questions_from_layout(
+        layout_page(lines, n + 1) for n, lines in enumerate(pages)
+    ))
+    return from_text, from_layout
+
+
+# The catalog font has no digits, so the header number is NUL characters
+FIRST = [
+    ('bold', 'KLCP Exam Questions Chapter 1'),
+    ('bold', 'Question \x00'),
+    ('text', 'Which command lists the files'),
+    ('wrap', 'of a directory?'),
+    ('text', 'A) ls'),
+    ('text', 'B) cd'),
+]
+FIRST_CONTINUED = [
+    ('text', 'C) pwd'),
+    ('text', 'D) rm -r, which removes them'),
+    ('wrap', 'all at once'),
+    ('bold', 'Frage \x00'),
+    ('text', 'Welcher Befehl listet die Dateien'),
+    ('wrap', 'eines Verzeichnisses auf?'),
+    ('text', 'A) ls'),
+    ('text', 'B) cd'),
+    ('text', 'C) pwd'),
+    ('text', 'D) rm -r, das sie alle auf'),
+    ('wrap', 'einmal löscht'),
+]
+# Only three options, in English and in German
+SECOND = [
+    ('bold', 'Question \x00\x00'),
+    ('text', 'Which file holds the users?'),
+    ('text', 'A) /etc/passwd'),
+    ('text', 'B) /etc/users'),
+    ('text', 'C) /etc/group'),
+    ('bold', 'Frage {number}'),
+    ('text', 'Welche Datei enthält die Benutzer?'),
+    ('text', 'A) /etc/passwd'),
+    ('text', 'B) /etc/users'),
+    ('text', 'C) /etc/group'),
+    ('bold', 'KLCP Exam Questions Chapter 2'),
+]
+
+EXPECTED = [
+    {
+        'question_en': 'Which command lists the files of a directory?',
+        'question_de': 'Welcher Befehl listet die Dateien eines Verzeichnisses auf?',
+        'options_en': ['A) ls', 'B) cd', 'C) pwd', 'D) rm -r, which removes them all at once'],
+        'options_de': ['A) ls', 'B) cd', 'C) pwd', 'D) rm -r, das sie alle auf einmal löscht'],
+    },
+    {
+        'question_en': 'Which file holds the users?',
+        'question_de': 'Welche Datei enthält die Benutzer?',
+        'options_en': ['A) /etc/passwd', 'B) /etc/users', 'C) /etc/group'],
+        'options_de': ['A) /etc/passwd', 'B) /etc/users', 'C) /etc/group'],
+    },
+]
+
+
+def test_question_across_pages_and_missing_option():
+    (from_text, from_layout) = both_parsers([FIRST, FIRST_CONTINUED + SECOND])
+    assert from_text == EXPECTED
+    assert from_layout == EXPECTED
+
+
+def test_page_break_markers_and_blank_pages_are_ignored():
+    pages = [text_page(FIRST), '', question_parser.PAGE_BREAK, text_page(FIRST_CONTINUED + SECOND)]
+    assert list(question_parser.iter_questions(pages)) == EXPECTED
+
+
+def test_layout_joins_wrapped_lines_that_start_with_a_label():
+    # "A) again" wraps option B. The text parser takes it for an option, the
+    # layout sees a wrapped line. After four options both join such lines.
+    lines = [
+        ('bold', 'Question 7'),
+        ('text', 'Pick one.'),
+        ('text', 'A) one'),
+        ('text', 'B) two, or else'),
+        ('wrap', 'A) again'),
+        ('text', 'C) three'),
+        ('text', 'D) four, or else'),
+        ('wrap', 'B) again'),
+    ]
+    (from_text, from_layout) = both_parsers([lines])
+    assert from_layout[0]['options_en'] == [
+        'A) one', 'B) two, or else A) again', 'C) three', 'D) four, or else B) again',
+    ]
+    assert from_text[0]['options_en'] == [
+        'A) one', 'B) two, or else', 'A) again', 'C) three D) four, or else B) again',
+    ]
+
+
+def test_layout_on_a_tightly_set_page():
+    # No gap tells paragraphs apart, only the next expected option label
+    lines = [('bold', 'Question 3')] + [('wrap', text) for (_, text) in FIRST[2:] + FIRST_CONTINUED[:3]]
+    (from_text, from_layout) = both_parsers([lines])
+    assert from_layout[0]['question_en'] == 'Which command lists the files of a directory?'
+    assert from_layout[0]['options_en'] == EXPECTED[0]['options_en']
+    assert from_text == from_layout
+
+
+def test_paragraph_gap_threshold():
+    gap = question_parser.PARAGRAPH_GAP * SIZE
+    previous = {'x0': 40, 'top': 0, 'bottom': SIZE, 'size': SIZE}
+
+    def line(top, x0=40):
+        return {'x0': x0, 'top': top, 'bottom': top + SIZE, 'size': SIZE}
+
+    assert question_parser._starts_paragraph(line(SIZE + gap + 0.5), previous)
+    assert not question_parser._starts_paragraph(line(SIZE + gap - 0.5), previous)
+    # Indented lines continue the one above, however far below
+    assert not question_parser._starts_paragraph(line(SIZE + 3 * gap, x0=50), previous)
+    assert question_parser._starts_paragraph(line(SIZE + WRAP), None)
+
+
+def test_layout_lines_are_read_from_the_cached_chars():
+    page = layout_page([('bold', 'Question 1'), ('text', 'A) ls -l')])
+    assert len(pdf_cache.page_chars(page)) == len('Question1') + len('A)ls-l')
+    lines = list(question_parser.iter_layout_lines(page))
+    assert [(line['text'], line['bold'], line['size']) for line in lines] == [
+        ('Question 1', True, SIZE),
+        ('A) ls -l', False, SIZE),
+    ]
+
+
+def test_numbered_answers_with_wrapped_and_unreadable_headers():
+    pages = [
+        'Question 4\nWhich one?\nA) x\nB) y\nCorrect Answer: B\nCorrect Answer: A',
+        # The phrase wraps, here across a page
+        'Question \x00\nWhich one?\nA) x\nCorrect',
+        'Answer: c\nExplanation',
+        # A block without an answer, then one with an unreadable number
+        'Question 9\nNo answer here\nQuestion {number}\nCorrect Answer: D',
+    ]
+    assert list(question_parser.iter_numbered_answers(pages)) == [(4, 'B'), (2, 'C'), (4, 'D')]
+    assert list(question_parser.iter_answers(pages)) == ['B', 'C', 'D']
+
+
+def test_answers_before_the_first_header_are_ignored():
+    pages = ['Correct Answer: A\nQuestion 1\nCorrect Answer: B']
+    assert list(question_parser.iter_numbered_answers(pages)) == [(1, 'B')]
+
+
+def test_dump_json_array_matches_json_dump():
+    for items in ([], [EXPECTED[0]], EXPECTED, [1, 'ä', {'a': [1, 2]}]):
+        out = io.StringIO()
+        question_parser.dump_json_array(iter(items), out)
+        assert out.getvalue() == json.dumps(items, indent=2, ensure_ascii=False)